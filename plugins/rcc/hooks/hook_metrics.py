@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Latency summary of the frontmatter hook's recorded phase timings.
+
+validate_frontmatter.py, the validator daemon and the plugin-validate worker
+record per-phase spans of every invocation in .rcc/metrics/spans.ring (see
+validators/metrics.py). `summary` reports, over the last N invocations, how
+often each phase ran and its p50 / p95 / max latency, phases and validators
+apart.
+
+Usage:
+    python3 hook_metrics.py summary [--last N] [--entry hook] [--cwd PATH] [--format text|json]
+    python3 hook_metrics.py clear [--cwd PATH]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+_hooks_dir = Path(__file__).parent
+sys.path.insert(0, str(_hooks_dir))
+from validators import metrics  # noqa: E402
+from validators.utils import percentile  # noqa: E402
+
+DEFAULT_LAST = 100
+TOTAL = "total"
+
+
+def phase_stats(records: list[dict]) -> dict[str, dict]:
+    """phase -> {count, p50_ms, p95_ms, max_ms}; "total" is the whole invocation."""
+    samples: dict[str, list[float]] = {TOTAL: []}
+    for record in records:
+        samples[TOTAL].append(record.get("total_us", 0) / 1000)
+        for name, us in record["spans"].items():
+            samples.setdefault(name, []).append(us / 1000)
+    return {
+        name: {
+            "count": len(values),
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "max_ms": max(values, default=0.0),
+        }
+        for name, values in samples.items()
+    }
+
+
+def summarize(records: list[dict]) -> dict:
+    stats = phase_stats(records)
+    by_p95 = sorted(stats, key=lambda name: (name != TOTAL, -stats[name]["p95_ms"]))
+    return {
+        "invocations": len(records),
+        "entries": {e: sum(1 for r in records if r.get("entry") == e)
+                    for e in dict.fromkeys(r.get("entry", "") for r in records)},
+        "phases": {n: stats[n] for n in by_p95 if not n.startswith(metrics.VALIDATOR_PREFIX)},
+        "validators": {n.removeprefix(metrics.VALIDATOR_PREFIX): stats[n]
+                       for n in by_p95 if n.startswith(metrics.VALIDATOR_PREFIX)},
+    }
+
+
+def _print_table(title: str, rows: dict[str, dict]) -> None:
+    if not rows:
+        return
+    width = max(len(name) for name in rows) + 2
+    print(f"\n{title:<{width}} {'runs':>5} {'p50':>9} {'p95':>9} {'max':>9}")
+    for name, s in rows.items():
+        print(f"{name:<{width}} {s['count']:>5} {s['p50_ms']:>7.1f}ms {s['p95_ms']:>7.1f}ms {s['max_ms']:>7.1f}ms")
+
+
+def print_summary(summary: dict) -> None:
+    entries = ", ".join(f"{n} {e or '?'}" for e, n in summary["entries"].items())
+    print(f"invocations:{summary['invocations']}" + (f" ({entries})" if entries else ""))
+    _print_table("phase", summary["phases"])
+    _print_table("validator", summary["validators"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize recorded hook phase timings.")
+    parser.add_argument("command", choices=["summary", "clear"])
+    parser.add_argument("--last", type=int, default=DEFAULT_LAST,
+                        help=f"Invocations to include (default: {DEFAULT_LAST}, 0 for all kept)")
+    parser.add_argument("--entry", help="Only invocations of this entry point (hook, daemon, plugin-worker)")
+    parser.add_argument("--cwd", type=Path, default=None, help="Project directory (default: cwd)")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format (default: text)")
+    args = parser.parse_args()
+
+    cwd = (args.cwd or Path.cwd()).resolve()
+    if args.command == "clear":
+        print("status:cleared" if metrics.clear(cwd) else "status:no-metrics")
+        sys.exit(0)
+
+    records = metrics.load(cwd)
+    if args.entry:
+        records = [r for r in records if r.get("entry") == args.entry]
+    if args.last:
+        records = records[-args.last:]
+    summary = summarize(records)
+    if args.format == "json":
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    elif not records:
+        print("status:no-metrics")
+    else:
+        print_summary(summary)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Background `claude plugin validate` worker and status report.
+
+The frontmatter hook never runs the CLI inline: it records a request and
+spawns `plugin_validate.py run` (see validators/plugin_jobs.py), which waits
+for the edit burst to settle, validates once, and persists the result.
+
+Usage:
+    python3 plugin_validate.py status [--cwd PATH]
+    python3 plugin_validate.py run <plugin-dir> [--cwd PATH] [--profile]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Import shared validation logic from sibling script
+_hooks_dir = Path(__file__).parent
+sys.path.insert(0, str(_hooks_dir))
+from validate_frontmatter import check_plugin_validate  # noqa: E402
+from validators import metrics, plugin_jobs, profiling  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Background plugin validation jobs.")
+    parser.add_argument("command", choices=["run", "status"])
+    parser.add_argument("plugin_dir", nargs="?", type=Path, help="Plugin root (for run)")
+    parser.add_argument("--cwd", type=Path, default=None, help="Project directory (default: cwd)")
+    parser.add_argument("--profile", action="store_true", help="Profile this run into .rcc/profiles/")
+    args = parser.parse_args()
+
+    cwd = (args.cwd or Path.cwd()).resolve()
+    if args.command == "run":
+        if args.plugin_dir is None:
+            parser.error("run requires a plugin directory")
+        profiling.start(cwd, "plugin-worker", force=args.profile)
+        with metrics.invocation(cwd, "plugin-worker"):
+            plugin_jobs.run_worker(cwd, args.plugin_dir, check_plugin_validate)
+        sys.exit(0)
+
+    records = plugin_jobs.job_status(cwd)
+    if not records:
+        print("status:no-jobs")
+    for rec in records:
+        plugin_dir = Path(rec["plugin_dir"])
+        rel = plugin_dir.relative_to(cwd) if plugin_dir.is_relative_to(cwd) else plugin_dir
+        print(f"plugin:{rel} state:{rec['state']} warnings:{len(rec['warnings'])}")
+        for w in rec["warnings"]:
+            print(f"  - {w}")
+    sys.exit(1 if any(rec["warnings"] for rec in records) else 0)
+
+
+if __name__ == "__main__":
+    main()
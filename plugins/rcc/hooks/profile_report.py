@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Aggregated cProfile report of profiled validator runs.
+
+Validator entry points run with --profile or RCC_PROFILE=1 store each run
+under .rcc/profiles/runs/ and refresh <entry>.collapsed (flamegraph.pl /
+speedscope input) and <entry>.top.txt (see validators/profiling.py).
+`report` rebuilds both from the kept runs and prints the hot-function
+table; `clear` deletes the profiles.
+
+Usage:
+    python3 profile_report.py report [--entry hook] [--top N] [--cwd PATH]
+    python3 profile_report.py clear [--cwd PATH]
+
+    flamegraph.pl .rcc/profiles/hook.collapsed > hook.svg
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+_hooks_dir = Path(__file__).parent
+sys.path.insert(0, str(_hooks_dir))
+from validators import profiling  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate profiled validator runs.")
+    parser.add_argument("command", choices=["report", "clear"])
+    parser.add_argument("--entry", help="Entry point (hook, daemon, validate-all, ...; default: all)")
+    parser.add_argument("--top", type=int, default=profiling.TOP_N,
+                        help=f"Functions in the hot-function table (default: {profiling.TOP_N})")
+    parser.add_argument("--cwd", type=Path, default=None, help="Project directory (default: cwd)")
+    args = parser.parse_args()
+
+    cwd = (args.cwd or Path.cwd()).resolve()
+    directory = profiling.profiles_dir(cwd)
+    if args.command == "clear":
+        shutil.rmtree(directory, ignore_errors=True)
+        print("status:cleared")
+        sys.exit(0)
+
+    entries = [args.entry] if args.entry else profiling.entries(cwd)
+    exported = [(e, profiling.export(cwd, e, args.top)) for e in entries]
+    exported = [(e, paths) for e, paths in exported if paths is not None]
+    if not exported:
+        print(f"status:no-profiles (run with --profile or {profiling.PROFILE_ENV}=1)")
+        sys.exit(0)
+    for entry, (collapsed, table) in exported:
+        print(f"entry:{entry} runs:{len(profiling.run_files(cwd, entry))} "
+              f"collapsed:{collapsed.relative_to(cwd)} top:{table.relative_to(cwd)}")
+        print(table.read_text(encoding="utf-8"))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,17 @@ Imports validation logic from validate_frontmatter.py, scans all relevant files,
 and writes a Markdown report for agent review.
 
 Usage:
-    python3 validate_all.py [--output PATH]
+    python3 validate_all.py [--output PATH] [--cli-cross-check] [--jobs N]
+                            [--changed-since REF | --staged | --watch [--poll]]
+                            [--format markdown|jsonl|sarif] [--profile]
 """
 
 import argparse
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 # Import shared validation logic from sibling script
 _hooks_dir = Path(__file__).parent
@@ -24,44 +28,108 @@ from validate_frontmatter import (  # noqa: E402
     check_plugin_validate,
     check_rules_md,
     check_skill_md,
-    discover_skill_and_agent_dirs,
 )
+from validators.manifest_validator import check_marketplace_json, check_plugin_json  # noqa: E402
+from validators import (  # noqa: E402
+    changes,
+    discovery,
+    documents,
+    formats,
+    history,
+    linkgraph,
+    parallel,
+    profiling,
+    result_cache,
+    walk,
+)
+from validators import watch as watch_module  # noqa: E402
+
 
+@documents.run()
+def validate_all(cwd: Path, cli_cross_check: bool = False, jobs: int = 1,
+                 on_result: Callable[[str, list[str]], None] | None = None,
+                 changed: list[Path] | None = None,
+                 timings: dict[str, float] | None = None) -> dict[str, list[str]]:
+    """Scan all plugin components and return {relative_path: [warnings]}.
 
-def validate_all(cwd: Path) -> dict[str, list[str]]:
-    """Scan all plugin components and return {relative_path: [warnings]}."""
-    results: dict[str, list[str]] = {}
-    skill_dirs, agent_dirs = discover_skill_and_agent_dirs(cwd)
-    rules_dir = cwd / ".claude" / "rules"
+    With jobs > 1 the checks run on a process pool (validators.parallel);
+    on_result(relative_path, warnings) streams each file as it completes.
+    With changed paths, only the components they affect are checked
+    (validators.changes). timings, if given, receives each file's check time
+    in seconds before on_result is called for it.
+    """
+    # One traversal (git index or pruned walk) feeds discovery and the file lists
+    inventory = walk.scan_project(cwd)
+    skill_dirs, agent_dirs = discovery.discover(cwd, inventory)
+    tasks: list[parallel.Task] = []
 
-    for sd in skill_dirs:
-        for skill_md in sorted(sd.rglob("SKILL.md")):
-            warnings = check_skill_md(skill_md)
-            if warnings:
-                results[str(skill_md.relative_to(cwd))] = warnings
+    def rel(path: Path) -> str:
+        return path.relative_to(cwd).as_posix()
+
+    skill_mds = [cwd / p for sd in skill_dirs for p in inventory.skill_mds_under(rel(sd))]
+    for skill_md in skill_mds:
+        tasks.append((check_skill_md, skill_md, True))
 
     for ad in agent_dirs:
-        for agent_md in sorted(ad.glob("*.md")):
-            warnings = check_agent_md(agent_md)
-            if warnings:
-                results[str(agent_md.relative_to(cwd))] = warnings
-
-    if rules_dir.exists():
-        for rule_md in sorted(rules_dir.glob("*.md")):
-            warnings = check_rules_md(rule_md)
-            if warnings:
-                results[str(rule_md.relative_to(cwd))] = warnings
-
-    for plugin_json in sorted(cwd.rglob(".claude-plugin/plugin.json")):
-        plugin_dir = plugin_json.parent.parent
-        warnings = check_plugin_validate(plugin_dir)
-        if warnings:
-            results[str(plugin_json.relative_to(cwd))] = warnings
+        for agent_md in inventory.markdown_in(rel(ad)):
+            tasks.append((check_agent_md, cwd / agent_md, True))
+
+    for rule_md in inventory.markdown_in(".claude/rules"):
+        tasks.append((check_rules_md, cwd / rule_md, True))
+
+    # Manifest results are cached with the existence of their declared paths
+    plugin_dirs = discovery.plugin_roots(cwd, inventory)
+    cli_checks: dict[Path, tuple[parallel.Check, Path]] = {}
+    for plugin_dir in plugin_dirs:
+        plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
+        tasks.append((check_plugin_json, plugin_json, True))
+        if cli_cross_check:
+            cli_checks[plugin_json] = (check_plugin_validate, plugin_dir)
+
+    # Marketplaces live next to a plugin.json or alone at the repo root
+    marketplaces = set(inventory.marketplaces)
+    for root in sorted({cwd, *plugin_dirs}):
+        marketplace_json = root / ".claude-plugin" / "marketplace.json"
+        if rel(marketplace_json) in marketplaces:
+            tasks.append((check_marketplace_json, marketplace_json, True))
+
+    graph = None
+    if changed is not None:
+        graph = linkgraph.for_project(cwd, skill_dirs, inventory)
+        scope = changes.affected_components(changed, [t[1] for t in tasks], skill_dirs, plugin_dirs, graph)
+        tasks = [t for t in tasks if t[1] in scope]
+
+    path_timings: dict[Path, float] = {}
 
+    def report(path: Path, warnings: list[str]) -> None:
+        rel_path = str(path.relative_to(cwd))
+        if timings is not None:
+            timings[rel_path] = path_timings[path]
+        if on_result is not None:
+            on_result(rel_path, warnings)
+
+    checked = parallel.run_checks(tasks, cwd, jobs=jobs, extra=cli_checks, on_result=report,
+                                  timings=path_timings)
+    results = {str(path.relative_to(cwd)): warnings for path, warnings in checked.items() if warnings}
+
+    result_cache.for_project(cwd).save()
+    # Keep the hook's reverse-dependency graph current: a full scan rebuilds
+    # it, a scoped one refreshes what it touched
+    if graph is None:
+        graph = linkgraph.build(cwd, skill_mds)
+    else:
+        for path in changed:
+            if not path.exists():
+                graph.forget(path)
+        for check, path, _ in tasks:
+            if check is check_skill_md:
+                graph.refresh(path)
+    graph.save()
     return results
 
 
-def write_report(results: dict[str, list[str]], cwd: Path, output: Path | None = None) -> Path:
+def write_report(results: dict[str, list[str]], cwd: Path, output: Path | None = None,
+                 scope: str | None = None, delta: history.Delta | None = None) -> Path:
     timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
     if output is None:
         output = cwd / ".rcc" / "validation" / f"{timestamp}-validation.md"
@@ -71,6 +139,8 @@ def write_report(results: dict[str, list[str]], cwd: Path, output: Path | None =
         "# Plugin Validation Report\n\n",
         f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
     ]
+    if scope:
+        lines.append(f"Scope: {scope}\n\n")
 
     if not results:
         lines.append("✅ All files valid — no issues found.\n")
@@ -82,20 +152,180 @@ def write_report(results: dict[str, list[str]], cwd: Path, output: Path | None =
                 lines.append(f"- {w}\n")
             lines.append("\n")
 
+    if delta is not None and delta.has_baseline:
+        lines.append("## Changes since last run\n\n")
+        if not delta.new and not delta.fixed:
+            lines.append("No warnings appeared or were fixed.\n")
+        for title, bucket in (("New", delta.new), ("Fixed", delta.fixed)):
+            if bucket:
+                lines.append(f"**{title} ({sum(map(len, bucket.values()))}):**\n\n")
+                for rel_path, warnings in sorted(bucket.items()):
+                    for w in warnings:
+                        lines.append(f"- `{rel_path}`: {w}\n")
+                lines.append("\n")
+
     output.write_text("".join(lines), encoding="utf-8")
     return output
 
 
+def watch_roots(cwd: Path) -> list[Path]:
+    """Directories holding components: plugin roots and the project's .claude dirs."""
+    return [
+        *discovery.plugin_roots(cwd),
+        cwd / ".claude-plugin",
+        *(cwd / ".claude" / sub for sub in ("skills", "agents", "rules")),
+    ]
+
+
+def watch(cwd: Path, jobs: int = 1, output: Path | None = None, polling: bool = False,
+          on_update: Callable[[str], None] | None = None, max_cycles: int | None = None) -> Path:
+    """Validate everything, then re-validate what changes until interrupted.
+
+    The report at output (default .rcc/validation/watch-validation.md) is
+    rewritten after every batch; on_update receives a one-line summary.
+    """
+    if output is None:
+        output = cwd / ".rcc" / "validation" / "watch-validation.md"
+    current: dict[str, list[str]] = {}
+    validate_all(cwd, jobs=jobs, on_result=current.__setitem__)
+
+    def publish(checked: dict[str, list[str]], delta: history.Delta) -> None:
+        issues = {rel: w for rel, w in current.items() if w}
+        write_report(issues, cwd, output, "watch mode, rewritten on every change", delta)
+        if on_update is not None:
+            new_count, fixed_count = delta.counts()
+            on_update(
+                f"[{datetime.now().strftime('%H:%M:%S')}] {len(current)} files, "
+                f"{len(issues)} with issues ({sum(map(len, issues.values()))} warnings) · "
+                f"{len(checked)} re-checked · +{new_count} new −{fixed_count} fixed"
+            )
+
+    publish(dict(current), history.Delta(has_baseline=False))
+    watcher = watch_module.make_watcher(watch_roots(cwd), polling)
+    cycles = 0
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            batch = watch_module.next_batch(watcher)
+            if batch is not None:
+                batch = {p for p in batch if p.is_relative_to(cwd)}
+                if not batch:
+                    continue
+            previous = dict(current)
+            checked: dict[str, list[str]] = {}
+            # Lost events: fall back to a full run
+            changed = None if batch is None else sorted(batch)
+            validate_all(cwd, jobs=jobs, on_result=checked.__setitem__, changed=changed)
+            if changed is None:
+                current.clear()
+                gone = set(previous) - set(checked)
+            else:
+                deleted = [p for p in changed if not p.exists()]
+                gone = {rel for rel in current if rel not in checked
+                        and any((cwd / rel).is_relative_to(d) for d in deleted)}
+                for rel in gone:
+                    del current[rel]
+            current.update(checked)
+            publish(checked, history.compare(previous, checked, gone))
+            if changed is None or any(p.name == "plugin.json" or p.is_dir() for p in changed):
+                # Plugins or directories may have appeared: re-arm the watches
+                watcher.close()
+                watcher = watch_module.make_watcher(watch_roots(cwd), polling)
+            cycles += 1
+    finally:
+        watcher.close()
+    return output
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate all plugin files and write a report.")
     parser.add_argument("--output", type=Path, default=None, help="Report output path")
+    parser.add_argument("--cli-cross-check", action="store_true",
+                        help="Also run `claude plugin validate` on every plugin (slow)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Check files on N worker processes (0 = one per CPU)")
+    scope_group = parser.add_mutually_exclusive_group()
+    scope_group.add_argument("--changed-since", metavar="REF", default=None,
+                             help="Only validate components affected by changes since REF")
+    scope_group.add_argument("--staged", action="store_true",
+                             help="Only validate components affected by staged changes")
+    parser.add_argument("--format", choices=("markdown", "jsonl", "sarif"), default="markdown",
+                        help="markdown: write the report file (default); jsonl: stream one record "
+                             "per finding to stdout; sarif: print a SARIF 2.1.0 log")
+    scope_group.add_argument("--watch", action="store_true",
+                             help="Keep running and re-validate components as they change")
+    parser.add_argument("--poll", action="store_true",
+                        help="With --watch, poll for changes instead of using inotify")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile this run into .rcc/profiles/ (also RCC_PROFILE=1; use --jobs 1)")
     args = parser.parse_args()
 
+    def progress(rel_path: str, warnings: list[str]) -> None:
+        # Per-file progress goes to stderr so stdout stays parseable
+        mark = f"⚠ {len(warnings)}" if warnings else "✓"
+        print(f"{mark} {rel_path}", file=sys.stderr, flush=True)
+
     cwd = Path.cwd()
-    results = validate_all(cwd)
-    report_path = write_report(results, cwd, args.output)
+    if args.watch and args.format != "markdown":
+        parser.error("--watch only writes the Markdown report")
+    changed = None
+    scope = None
+    if args.staged or args.changed_since:
+        try:
+            changed = changes.changed_paths(cwd, since=args.changed_since, staged=args.staged)
+        except changes.ChangeScopeError as e:
+            parser.error(f"cannot list changed files: {e}")
+        scope = "staged changes" if args.staged else f"changes since {args.changed_since}"
+        scope += f" ({len(changed)} changed path(s))"
+    # Only valid invocations leave a profiled run behind
+    profiling.start(cwd, "validate-all", force=args.profile)
+    if args.watch:
+        interactive = sys.stderr.isatty()
+
+        def show(line: str) -> None:
+            # Live summary: one line, rewritten in place on a terminal
+            print(f"\r\033[K{line}" if interactive else line, end="" if interactive else "\n",
+                  file=sys.stderr, flush=True)
+
+        output = args.output or cwd / ".rcc" / "validation" / "watch-validation.md"
+        print(f"report:{output}", flush=True)
+        try:
+            watch(cwd, jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1),
+                  output=output, polling=args.poll, on_update=show)
+        except KeyboardInterrupt:
+            print(file=sys.stderr)
+        sys.exit(0)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    checked: dict[str, list[str]] = {}
+    timings: dict[str, float] = {}
+    findings: list[formats.Finding] = []
+    jsonl = formats.JsonlWriter(sys.stdout) if args.format == "jsonl" else None
+
+    def collect(rel_path: str, warnings: list[str]) -> None:
+        checked[rel_path] = warnings
+        progress(rel_path, warnings)
+        file_findings = [formats.Finding.of(rel_path, w, seconds=timings[rel_path]) for w in warnings]
+        if jsonl is not None:
+            for finding in file_findings:
+                jsonl.finding(finding)
+            jsonl.file_done(rel_path, len(file_findings), timings[rel_path])
+        findings.extend(file_findings)
+
+    results = validate_all(cwd, cli_cross_check=args.cli_cross_check, jobs=jobs, on_result=collect,
+                           changed=changed, timings=timings)
+    removed = [str(p.relative_to(cwd)) for p in changed or [] if not p.exists()]
+    delta = history.record(cwd, checked, full=changed is None, removed=removed)
+    if args.format != "markdown":
+        # Machine formats own stdout; the exit code still reports issues
+        if args.format == "sarif":
+            formats.write_sarif(findings, sys.stdout, "rcc-validate-all")
+        sys.exit(1 if results else 0)
+    report_path = write_report(results, cwd, args.output, scope, delta)
 
     print(f"report:{report_path}")  # structured output for skill to parse
+    if delta.has_baseline:
+        new_count, fixed_count = delta.counts()
+        print(f"delta:{new_count} new, {fixed_count} fixed")
 
     if results:
         issue_count = sum(len(w) for w in results.values())
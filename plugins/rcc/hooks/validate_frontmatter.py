@@ -2,132 +2,86 @@
 # /// script
 # requires-python = ">=3.11"
 # ///
-"""Validate frontmatter and structure of SKILL.md, agent, rule files, and Claude Code configuration files."""
+"""Validate frontmatter and structure of SKILL.md, agent, rule files, and Claude Code configuration files.
+
+The hook is a thin client: it forwards the payload to the validator daemon
+and only imports the validators (validators.post_tool_use) when it has to
+validate in-process. Their names stay importable from this module.
+"""
 
 import json
-import subprocess
+import os
 import sys
+import time
 from pathlib import Path
 
-# Import modular validators
+_IMPORT_START = time.perf_counter()
+
 try:
-    from validators.skill_validator import check_skill_md
-    from validators.agent_validator import check_agent_md
-    from validators.rules_validator import check_rules_md
-    from validators.config_validator import check_settings_json, check_hooks_json
+    from validators import commands, daemon, metrics
 except ImportError:
     # Fallback for when script is run directly without package structure
     sys.path.append(str(Path(__file__).parent))
-    from validators.skill_validator import check_skill_md
-    from validators.agent_validator import check_agent_md
-    from validators.rules_validator import check_rules_md
-    from validators.config_validator import check_settings_json, check_hooks_json
-
-
-def discover_skill_and_agent_dirs(cwd: Path) -> tuple[list[Path], list[Path]]:
-    """Find valid skill and agent directories from plugin roots and .claude/."""
-    skill_dirs: list[Path] = []
-    agent_dirs: list[Path] = []
-
-    for plugin_json_path in cwd.rglob(".claude-plugin/plugin.json"):
-        plugin_root = plugin_json_path.parent.parent
-        try:
-            data = json.loads(plugin_json_path.read_text(encoding="utf-8"))
-        except Exception:
-            data = {}
-
-        for field, target_list in [("skills", skill_dirs), ("agents", agent_dirs)]:
-            default = field  # "skills" or "agents"
-            value = data.get(field, default)
-            if isinstance(value, str):
-                candidate = plugin_root / value
-                if candidate.exists() and candidate not in target_list:
-                    target_list.append(candidate)
-
-    # Project-level .claude/skills and .claude/agents
-    for subdir, target_list in [("skills", skill_dirs), ("agents", agent_dirs)]:
-        candidate = cwd / ".claude" / subdir
-        if candidate.exists() and candidate not in target_list:
-            target_list.append(candidate)
-
-    return skill_dirs, agent_dirs
-
-
-def check_plugin_validate(plugin_dir: Path) -> list[str]:
-    """Run `claude plugin validate` on plugin_dir (the dir containing .claude-plugin/)."""
-    try:
-        result = subprocess.run(
-            ["claude", "plugin", "validate", str(plugin_dir)],
-            capture_output=True, text=True, timeout=30
-        )
-        output = ((result.stdout or "") + (result.stderr or "")).strip()
-        if result.returncode != 0 and output:
-            return [f"plugin validate: {line}" for line in output.splitlines() if line.strip()]
-    except FileNotFoundError:
-        pass  # claude CLI not available
-    except Exception as e:
-        return [f"plugin validate failed: {e}"]
-    return []
+    from validators import commands, daemon, metrics
 
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
 
-def main() -> None:
-    try:
-        data = json.loads(sys.stdin.read())
-    except Exception:
-        sys.exit(0)
 
-    try:
-        file_path_str = data.get("tool_input", {}).get("file_path", "")
-        cwd_str = data.get("cwd", "")
-        if not file_path_str:
-            sys.exit(0)
+def _in_process():
+    from validators import post_tool_use
+    return post_tool_use
 
-        cwd = Path(cwd_str) if cwd_str else Path.cwd()
-        path = Path(file_path_str)
-        if not path.is_absolute():
-            path = cwd / path
-        if not path.exists():
-            sys.exit(0)
 
-        skill_dirs, agent_dirs = discover_skill_and_agent_dirs(cwd)
-        rules_dir = cwd / ".claude" / "rules"
-        warnings: list[str] = []
-
-        # Route to appropriate validator based on file type and location
-        if path.parent.name == ".claude-plugin" and path.suffix == ".json":
-            # .claude-plugin/ JSON files → run claude plugin validate on parent dir
-            warnings = check_plugin_validate(path.parent.parent)
-        elif path.name == "SKILL.md" and any(path.is_relative_to(sd) for sd in skill_dirs):
-            # SKILL.md files in skill directories
-            warnings = check_skill_md(path)
-        elif path.suffix == ".md" and any(path.is_relative_to(ad) for ad in agent_dirs):
-            # Agent .md files in agent directories
-            warnings = check_agent_md(path)
-        elif path.suffix == ".md" and rules_dir.exists() and path.is_relative_to(rules_dir):
-            # Rule .md files in .claude/rules/
-            warnings = check_rules_md(path)
-        elif path.name == "settings.json" and path.parent.name == ".claude":
-            # .claude/settings.json validation
-            warnings = check_settings_json(path)
-        elif path.name == "hooks.json" and path.parent.name == "hooks":
-            # Plugin hooks/hooks.json validation
-            warnings = check_hooks_json(path)
-
-        if warnings:
-            rel = path.relative_to(cwd) if path.is_relative_to(cwd) else path
-            lines = "\n".join(f"  - {w}" for w in warnings)
-            msg = f"⚠ validate-frontmatter [{rel}]:\n{lines}"
-            print(json.dumps({
-                "hookSpecificOutput": {
-                    "hookEventName": "PostToolUse",
-                    "additionalContext": msg,
-                },
-                "systemMessage": msg,
-            }))
+def __getattr__(name: str):
+    """Lazily re-export the in-process validation API (check_skill_md, handle_payload, ...)."""
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return getattr(_in_process(), name)
 
+
+def render_output(data: dict) -> str:
+    """Return the hook's stdout text for a payload ("" when silent)."""
+    with metrics.span("imports"):
+        post_tool_use = _in_process()
+    return post_tool_use.render_output(data)
+
+
+def is_ignored(data: dict, cwd: Path) -> bool:
+    """Bash calls that remove or move no file have nothing to validate."""
+    if data.get("tool_name") != "Bash":
+        return False
+    metrics.annotate(tool="Bash")
+    command = (data.get("tool_input") or {}).get("command", "")
+    return not commands.command_paths(command if isinstance(command, str) else "", cwd)
+
+
+def main() -> None:
+    raw = sys.stdin.buffer.read()
+    try:
+        data = json.loads(raw)
+        cwd = Path(data.get("cwd") or Path.cwd())
     except Exception:
-        pass  # never block Claude on validator errors (file may be mid-edit)
+        sys.exit(0)
 
+    # Prefer the warm validator daemon; fall back to validating in-process.
+    # Phase timings go to .rcc/metrics/ (validators.metrics), cProfile data
+    # to .rcc/profiles/ with RCC_PROFILE=1 (validators.profiling).
+    if os.environ.get("RCC_PROFILE") == "1":
+        from validators import profiling
+        profiling.start(cwd, "hook")
+    with metrics.invocation(cwd, "hook", started=_IMPORT_START):
+        metrics.add("imports", _IMPORT_SECONDS)
+        if is_ignored(data, cwd):
+            sys.exit(0)
+        with metrics.span("daemon"):
+            reply = daemon.request(cwd, raw)
+        if reply is not None and "output" in reply:
+            output = reply["output"]
+        else:
+            output = render_output(data)
+
+    if output:
+        print(output)
     sys.exit(0)
 
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Long-lived validator process for the PostToolUse frontmatter hook.
+
+Keeps the validators imported and their caches warm, listening on a
+per-project Unix socket. validate_frontmatter.py forwards each hook payload
+here and falls back to in-process validation when no daemon is running.
+
+Usage:
+    python3 validator_daemon.py start    # detach a daemon for the current project
+    python3 validator_daemon.py stop
+    python3 validator_daemon.py status
+    python3 validator_daemon.py serve    # run in the foreground
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import subprocess
+import sys
+from pathlib import Path
+
+_hooks_dir = Path(__file__).parent
+sys.path.insert(0, str(_hooks_dir))
+from validators import daemon, metrics, profiling  # noqa: E402
+from validators.post_tool_use import render_output  # noqa: E402
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    timeout = daemon.CLIENT_TIMEOUT
+
+    def handle(self) -> None:
+        raw = self.rfile.read()
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None
+
+        if isinstance(data, dict) and daemon.CONTROL_KEY in data:
+            reply = self.server.control(data[daemon.CONTROL_KEY])
+        elif self.server.is_stale():
+            # Sources changed under us: let the client validate with the new
+            # code and exit so the next session starts a fresh daemon.
+            reply = {"stale": True}
+            self.server.stopping = True
+        elif isinstance(data, dict):
+            # The client now waits for this reply instead of validating itself
+            self.wfile.write(daemon.ACCEPTED)
+            self.wfile.flush()
+            with metrics.invocation(self.server.cwd, "daemon"), profiling.session(self.server.cwd, "daemon"):
+                reply = {"output": render_output(data)}
+        else:
+            reply = {"output": ""}
+
+        self.wfile.write(json.dumps(reply).encode("utf-8"))
+
+
+class ValidatorServer(socketserver.UnixStreamServer):
+    """Serial Unix-socket server; hook calls arrive one edit at a time."""
+
+    def __init__(self, path: Path, cwd: Path, idle_timeout: float) -> None:
+        super().__init__(str(path), _Handler)
+        os.chmod(path, 0o600)
+        self.cwd = cwd
+        self.timeout = idle_timeout
+        self.stopping = False
+        self.fingerprint = daemon.source_fingerprint(_hooks_dir)
+
+    def is_stale(self) -> bool:
+        return daemon.source_fingerprint(_hooks_dir) != self.fingerprint
+
+    def control(self, command: str) -> dict:
+        if command == "shutdown":
+            self.stopping = True
+            return {"ok": True}
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "cwd": str(self.cwd)}
+        return {"ok": False, "error": f"unknown command: {command}"}
+
+    def handle_timeout(self) -> None:
+        self.stopping = True
+
+
+def serve(cwd: Path, idle_timeout: float = daemon.IDLE_TIMEOUT) -> None:
+    """Serve validation requests for cwd until idle or told to stop."""
+    path = daemon.socket_path(cwd)
+    if path.exists():
+        if daemon.control(cwd, "ping") is not None:
+            return  # another daemon already owns this project
+        path.unlink()  # left behind by a daemon that died
+
+    server = ValidatorServer(path, cwd, idle_timeout)
+    try:
+        while not server.stopping:
+            server.handle_request()
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def start(cwd: Path) -> bool:
+    """Detach a daemon for cwd unless one is already running."""
+    if not daemon.is_supported() or daemon.control(cwd, "ping") is not None:
+        return False
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "serve", "--cwd", str(cwd)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validator daemon for the frontmatter hook.")
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    parser.add_argument("--cwd", type=Path, default=None, help="Project directory (default: cwd)")
+    parser.add_argument("--idle-timeout", type=float, default=daemon.IDLE_TIMEOUT,
+                        help="Exit after this many idle seconds")
+    args = parser.parse_args()
+
+    cwd = (args.cwd or Path.cwd()).resolve()
+
+    if args.command == "serve":
+        if daemon.is_supported():
+            serve(cwd, args.idle_timeout)
+    elif args.command == "start":
+        # Never fail a SessionStart hook: the client falls back in-process.
+        start(cwd)
+    elif args.command == "stop":
+        print("status:stopped" if daemon.control(cwd, "shutdown") else "status:not-running")
+    else:
+        reply = daemon.control(cwd, "ping")
+        if reply:
+            print(f"status:running pid={reply.get('pid')} socket={daemon.socket_path(cwd)}")
+        else:
+            print("status:not-running")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
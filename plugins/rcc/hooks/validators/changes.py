@@ -0,0 +1,82 @@
+"""Scope validation to the components a git change touches.
+
+Pre-commit and CI runs only care about what a diff affects. The changed paths
+come from git and are expanded to components:
+
+- a changed component file (SKILL.md, agent, rule, manifest) is itself affected
+- a file inside a skill dir affects its owning SKILL.md (links, orphans)
+- a path a skill links to or mentions affects that skill, whether the path
+  was edited, added or deleted (validators.linkgraph reverse edges)
+- a changed plugin.json affects the whole plugin: its declared paths and
+  component dirs may have moved; a deleted path inside a plugin affects its
+  plugin.json, which may declare it
+- a changed plugin.json or marketplace.json affects the marketplaces next to it
+  and at the project root
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .linkgraph import LinkGraph, owning_skill
+
+GIT_TIMEOUT = 30
+
+
+class ChangeScopeError(Exception):
+    """git could not produce the list of changed paths."""
+
+
+def _git(cwd: Path, *args: str) -> list[str]:
+    try:
+        proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, timeout=GIT_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ChangeScopeError(f"git {args[0]} failed: {e}") from e
+    if proc.returncode != 0:
+        raise ChangeScopeError(proc.stderr.decode("utf-8", errors="replace").strip()
+                               or f"git {args[0]} exited with {proc.returncode}")
+    return [p for p in proc.stdout.decode("utf-8", errors="surrogateescape").split("\0") if p]
+
+
+def changed_paths(cwd: Path, since: Optional[str] = None, staged: bool = False) -> list[Path]:
+    """Return paths under cwd changed in the index (staged) or since a ref.
+
+    Since a ref, working-tree edits and untracked, unignored files count too.
+    Renames are reported as a deletion plus an addition.
+    """
+    diff = ["diff", "--name-only", "-z", "--no-renames", "--relative"]
+    if staged:
+        names = _git(cwd, *diff, "--cached")
+    else:
+        names = _git(cwd, *diff, since or "HEAD", "--")
+        names += _git(cwd, "ls-files", "-z", "--others", "--exclude-standard")
+    return sorted({Path(os.path.normpath(cwd / name)) for name in names})
+
+
+def affected_components(changed: Iterable[Path], components: Iterable[Path],
+                        skill_dirs: list[Path], plugin_dirs: list[Path],
+                        graph: LinkGraph) -> set[Path]:
+    """Return the subset of components (files validate_all would check) to validate."""
+    components = set(components)
+    affected: set[Path] = set()
+    cwd = graph.cwd
+    for path in changed:
+        affected.add(path)
+        owner = owning_skill(path, skill_dirs)
+        if owner is not None:
+            affected.add(owner)
+        affected.update(graph.dependents(path))
+
+        plugin_dir = next((pd for pd in plugin_dirs if path.is_relative_to(pd)), None)
+        if plugin_dir is None:
+            continue
+        manifest_dir = plugin_dir / ".claude-plugin"
+        if path == manifest_dir / "plugin.json":
+            affected.update(c for c in components if c.is_relative_to(plugin_dir))
+        elif not path.exists():
+            affected.add(manifest_dir / "plugin.json")
+        if path.parent == manifest_dir:
+            affected.add(manifest_dir / "marketplace.json")
+            affected.add(cwd / ".claude-plugin" / "marketplace.json")
+    return affected & components
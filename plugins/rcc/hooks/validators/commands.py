@@ -0,0 +1,76 @@
+"""Bash commands that can remove or move files a skill references.
+
+Kept free of the validator imports: the hook checks Bash payloads with
+command_paths() before it loads anything else, and most commands are
+dismissed there.
+"""
+
+import os
+import shlex
+from pathlib import Path
+
+REMOVING_COMMANDS = {"rm", "rmdir", "unlink", "mv"}
+# Subcommands of these tools that remove or move files ("git rm", "git mv")
+REMOVING_SUBCOMMANDS = {"git": {"rm", "mv"}}
+# Words that run the rest of the simple command as a command
+PREFIX_COMMANDS = {"sudo", "command", "builtin", "exec", "nohup", "time"}
+SEPARATORS = {"&&", "||", ";", ";;", "|", "|&", "&", "(", ")"}
+REDIRECTS = {">", ">>", "<", "<<", "<<<", ">&", "<&", "&>", "&>>", ">|"}
+
+
+def _simple_commands(command: str) -> list[list[str]]:
+    """Split a command line into the words of its simple commands."""
+    lexer = shlex.shlex(command.replace("\n", ";"), posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:   # unbalanced quotes
+        tokens = command.split()
+    simple: list[list[str]] = [[]]
+    skip = False
+    for token in tokens:
+        if skip:
+            skip = False
+        elif token in SEPARATORS:
+            simple.append([])
+        elif token in REDIRECTS:
+            if simple[-1] and simple[-1][-1].isdigit():
+                simple[-1].pop()   # the fd of "2>"
+            skip = True   # the redirect target is not an argument
+        else:
+            simple[-1].append(token)
+    return [words for words in simple if words]
+
+
+def _removed_args(words: list[str]) -> list[str]:
+    """Path arguments of one simple command if it removes or moves files."""
+    while words and ("=" in words[0] and not words[0].startswith("=") or words[0] in PREFIX_COMMANDS):
+        words = words[1:]   # VAR=value assignments and sudo / command / ...
+    if not words:
+        return []
+    name = os.path.basename(words[0])
+    if name in REMOVING_COMMANDS:
+        args = words[1:]
+    elif len(words) > 1 and words[1] in REMOVING_SUBCOMMANDS.get(name, ()):
+        args = words[2:]
+    else:
+        return []
+    paths: list[str] = []
+    options = True
+    for arg in args:
+        if options and arg == "--":
+            options = False
+        elif not (options and arg.startswith("-")) and arg:
+            paths.append(arg)
+    return paths
+
+
+def command_paths(command: str, cwd: Path) -> list[Path]:
+    """Return the path arguments of the rm / mv / git rm ... commands in a Bash command."""
+    paths: list[Path] = []
+    for words in _simple_commands(command):
+        for arg in _removed_args(words):
+            path = Path(os.path.normpath(cwd / arg))
+            if path.is_relative_to(cwd) and path != cwd:
+                paths.append(path)
+    return paths
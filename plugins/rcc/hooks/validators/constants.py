@@ -45,7 +45,21 @@ HOOK_EVENTS = {
     # Worktree
     "WorktreeCreate", "WorktreeRemove",
 }
-HOOK_TYPES = {"command", "http", "prompt", "agent"}
+# Hook entry fields: common to every type, then (required, optional) per type
+HOOK_COMMON_FIELDS = {"type", "timeout", "if", "statusMessage", "once"}
+HOOK_TYPE_FIELDS = {
+    "command": ({"command"}, {"async", "shell"}),
+    "http":    ({"url"}, {"headers", "allowedEnvVars"}),
+    "prompt":  ({"prompt"}, {"model"}),
+    "agent":   ({"prompt"}, {"model"}),
+}
+HOOK_TYPES = set(HOOK_TYPE_FIELDS)
+# JSON type of hook entry fields, checked in this order when present
+HOOK_FIELD_TYPES = {"async": "boolean", "once": "boolean", "headers": "object", "allowedEnvVars": "array"}
+# Timeout bounds in seconds (the maximum varies by type; 600 is a safe upper bound)
+HOOK_TIMEOUT_RANGE = (1, 600)
+# Timeout Claude Code applies when a hook declares none, in seconds
+DEFAULT_HOOK_TIMEOUTS = {"command": 600, "http": 30, "prompt": 30, "agent": 60}
 
 # Plugin hooks.json allowed top-level fields
 PLUGIN_HOOKS_ALLOWED_FIELDS = {"description", "hooks"}
@@ -67,4 +81,54 @@ VALID_PERMISSION_MODES = {"default", "acceptEdits", "auto", "dontAsk", "bypassPe
 VALID_MEMORY_SCOPES = {"user", "project", "local"}
 VALID_ISOLATION_MODES = {"worktree"}
 VALID_COLORS = {"red", "blue", "green", "yellow", "purple", "orange", "pink", "cyan"}
-BUILTIN_SUBAGENT_TYPES = {"Explore", "Plan", "general-purpose"}
\ No newline at end of file
+BUILTIN_SUBAGENT_TYPES = {"Explore", "Plan", "general-purpose"}
+# Plugin manifest (.claude-plugin/plugin.json) fields
+PLUGIN_MANIFEST_FIELDS = {
+    "name", "version", "description", "author", "homepage", "repository",
+    "license", "keywords", "commands", "agents", "skills", "outputStyles",
+    "hooks", "mcpServers", "lspServers", "userConfig", "dependencies",
+}
+# Component fields holding a path or a list of paths relative to the plugin root
+PLUGIN_PATH_FIELDS = {"commands", "agents", "skills", "outputStyles"}
+# Component fields holding a path to a config file or an inline config object
+PLUGIN_CONFIG_FIELDS = {"hooks", "mcpServers", "lspServers"}
+
+# Marketplace (.claude-plugin/marketplace.json) fields
+MARKETPLACE_FIELDS = {"$schema", "name", "owner", "metadata", "plugins", "description", "version"}
+MARKETPLACE_PLUGIN_SOURCE_TYPES = {"github", "url", "git-subdir", "npm", "pip"}
+
+# Declarative validation schema, compiled into lookup tables by validators.schema.
+# Frontmatter components: allowed fields, enum fields (checked in this order)
+# and required fields.
+FRONTMATTER_SCHEMA = {
+    "skill": {"allowed": SKILL_ALLOWED_FIELDS},
+    "agent": {
+        "allowed": AGENT_ALLOWED_FIELDS,
+        "enums": {
+            "model": VALID_MODELS,
+            "effort": VALID_EFFORT_LEVELS,
+            "color": VALID_COLORS,
+            "permissionMode": VALID_PERMISSION_MODES,
+            "memory": VALID_MEMORY_SCOPES,
+            "isolation": VALID_ISOLATION_MODES,
+        },
+        "required": ["name", "description"],
+    },
+    "rules": {"allowed": RULES_ALLOWED_FIELDS},
+}
+# JSON config documents: allowed top-level fields
+JSON_SCHEMA = {
+    "hooks.json": {"allowed": PLUGIN_HOOKS_ALLOWED_FIELDS},
+    "plugin.json": {
+        "allowed": PLUGIN_MANIFEST_FIELDS,
+        "field_types": {"description": "string", "homepage": "string", "repository": "string", "license": "string"},
+    },
+    "marketplace.json": {"allowed": MARKETPLACE_FIELDS},
+}
+# Hook entries inside settings.json / hooks.json
+HOOK_SCHEMA = {
+    "common": HOOK_COMMON_FIELDS,
+    "types": HOOK_TYPE_FIELDS,
+    "field_types": HOOK_FIELD_TYPES,
+    "timeout": HOOK_TIMEOUT_RANGE,
+}
@@ -0,0 +1,101 @@
+"""Socket protocol shared by the validator daemon and the hook client.
+
+The daemon listens on a per-project Unix socket. A client connects, sends the
+raw PostToolUse payload, half-closes the connection and reads back one JSON
+object: {"output": "<hook stdout>"} on success, or {"stale": true} when the
+daemon's validator sources changed since it started and the client should
+validate in-process instead.
+
+Before validating a payload the daemon sends an ACCEPTED line. Until then the
+client gives up after CLIENT_TIMEOUT and validates in-process; once the
+request is accepted it waits up to REPLY_TIMEOUT for the reply, longer than
+the hook's own timeout, so a slow validation is never run a second time in
+the client.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Seconds the client waits for the daemon to accept a payload before
+# validating in-process, and for the reply once it has been accepted.
+CLIENT_TIMEOUT = 5.0
+REPLY_TIMEOUT = 60.0
+ACCEPTED = b'{"accepted":true}\n'
+# Seconds the daemon stays alive without receiving a request.
+IDLE_TIMEOUT = 1800
+
+# Control messages carry this key instead of a hook payload.
+CONTROL_KEY = "rcc_daemon"
+
+
+def is_supported() -> bool:
+    """Unix sockets are unavailable on some platforms (e.g. Windows Python)."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path(cwd: Path) -> Path:
+    """Return the per-project socket path for a project directory.
+
+    Lives in the temp dir rather than the project because Unix socket paths
+    are limited to ~100 bytes.
+    """
+    digest = hashlib.sha1(str(cwd.resolve()).encode("utf-8")).hexdigest()[:12]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"rcc-validator-{uid}-{digest}.sock"
+
+
+def source_fingerprint(hooks_dir: Path) -> str:
+    """Fingerprint the validator sources so a daemon can detect code updates."""
+    parts: list[str] = []
+    for src in sorted([*hooks_dir.glob("*.py"), *hooks_dir.glob("validators/*.py")]):
+        try:
+            st = src.stat()
+        except OSError:
+            continue
+        parts.append(f"{src.name}:{st.st_mtime_ns}:{st.st_size}")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def request(cwd: Path, payload: bytes, timeout: float = CLIENT_TIMEOUT,
+            reply_timeout: float = REPLY_TIMEOUT) -> Optional[dict]:
+    """Send a payload to the project's daemon and return its decoded reply.
+
+    Returns None when no daemon is listening or the exchange fails for any
+    reason — callers treat that as "validate in-process".
+    """
+    if not is_supported():
+        return None
+    path = socket_path(cwd)
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(payload)
+            sock.shutdown(socket.SHUT_WR)
+            data = b""
+            accepted = False
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+                if not accepted and data.startswith(ACCEPTED):
+                    accepted = True
+                    data = data[len(ACCEPTED):]
+                    sock.settimeout(reply_timeout)
+        reply = json.loads(data.decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+def control(cwd: Path, command: str, timeout: float = 1.0) -> Optional[dict]:
+    """Send a control command ("ping" or "shutdown") to the project's daemon."""
+    return request(cwd, json.dumps({CONTROL_KEY: command}).encode("utf-8"), timeout)
@@ -0,0 +1,182 @@
+"""Persistent index of plugin roots, skill dirs and agent dirs.
+
+Finding plugins means listing the whole project for .claude-plugin/plugin.json
+(validators.walk), which grows with repository size. The result is cached in
+.rcc/cache/discovery.json together with the mtimes of every manifest and of the
+directories whose listing would change if a plugin, skills/ or agents/ dir was
+added or removed (top-level dirs, plugin ancestors, plugin roots). Checking those stamps costs a few stat() calls; the walk only
+reruns when one of them moved.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from .walk import Inventory, scan_project
+
+INDEX_VERSION = 1
+INDEX_NAME = "discovery.json"
+
+# Index loaded per project, so a long-lived process only re-stats.
+_memo: dict[str, dict] = {}
+
+
+def cache_dir(cwd: Path) -> Path:
+    """Return the project's RCC cache directory (gitignored on creation)."""
+    return cwd / ".rcc" / "cache"
+
+
+def ensure_cache_dir(cwd: Path) -> Path:
+    """Create .rcc/cache/ with a .gitignore so cache files are never committed."""
+    directory = cache_dir(cwd)
+    directory.mkdir(parents=True, exist_ok=True)
+    ignore = directory / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding="utf-8")
+    return directory
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _rel(path: Path, cwd: Path) -> str:
+    return os.path.relpath(path, cwd).replace("\\", "/")
+
+
+def find_plugin_manifests(cwd: Path, inventory: Optional[Inventory] = None) -> list[Path]:
+    """Return every .claude-plugin/plugin.json under cwd that is not ignored."""
+    if inventory is None:
+        inventory = scan_project(cwd)
+    return [cwd / rel for rel in inventory.plugin_manifests]
+
+
+def build_index(cwd: Path, inventory: Optional[Inventory] = None) -> dict:
+    """Walk the project (or use a walk already done) and return a fresh index."""
+    plugin_roots: list[str] = []
+    skill_dirs: list[str] = []
+    agent_dirs: list[str] = []
+    stamp_paths: set[Path] = {cwd, cwd / ".claude", cwd / ".gitignore"}
+    # Top-level dirs catch new plugins under e.g. plugins/; dot-dirs are skipped
+    # because .git and friends change on every commit.
+    try:
+        stamp_paths.update(p for p in cwd.iterdir() if p.is_dir() and not p.name.startswith("."))
+    except OSError:
+        pass
+
+    def add(candidate: Path, target: list[str]) -> None:
+        # Stamp the parent so creating the dir later invalidates the index.
+        stamp_paths.add(candidate.parent)
+        rel = _rel(candidate, cwd)
+        if candidate.exists() and rel not in target:
+            target.append(rel)
+
+    for plugin_json_path in find_plugin_manifests(cwd, inventory):
+        plugin_root = plugin_json_path.parent.parent
+        plugin_roots.append(_rel(plugin_root, cwd))
+        stamp_paths.add(plugin_json_path)
+        stamp_paths.add(plugin_json_path.parent)
+        # Ancestors up to cwd change when sibling plugins are added or removed.
+        for ancestor in plugin_root.parents:
+            if ancestor == cwd or not ancestor.is_relative_to(cwd):
+                break
+            stamp_paths.add(ancestor)
+        stamp_paths.add(plugin_root)
+
+        try:
+            data = json.loads(plugin_json_path.read_text(encoding="utf-8"))
+        except Exception:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        for field, target_list in [("skills", skill_dirs), ("agents", agent_dirs)]:
+            default = field  # "skills" or "agents"
+            value = data.get(field, default)
+            if isinstance(value, str):
+                add(plugin_root / value, target_list)
+
+    # Project-level .claude/skills and .claude/agents
+    for subdir, target_list in [("skills", skill_dirs), ("agents", agent_dirs)]:
+        add(cwd / ".claude" / subdir, target_list)
+
+    return {
+        "version": INDEX_VERSION,
+        "plugin_roots": plugin_roots,
+        "skill_dirs": skill_dirs,
+        "agent_dirs": agent_dirs,
+        "stamps": {_rel(p, cwd): _mtime(p) for p in sorted(stamp_paths)},
+    }
+
+
+def is_fresh(index: dict, cwd: Path) -> bool:
+    """True if no stamped manifest or directory changed since the index was built."""
+    if index.get("version") != INDEX_VERSION:
+        return False
+    stamps = index.get("stamps")
+    if not isinstance(stamps, dict):
+        return False
+    return all(_mtime(cwd / rel) == mtime for rel, mtime in stamps.items())
+
+
+def _read(cwd: Path) -> Optional[dict]:
+    try:
+        index = json.loads((cache_dir(cwd) / INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return index if isinstance(index, dict) else None
+
+
+def load_index(cwd: Path, inventory: Optional[Inventory] = None) -> dict:
+    """Return a fresh index for cwd, rebuilding and persisting it if stale.
+
+    A stale memo is checked against the file first: another process
+    (validate_all next to the daemon) may already have written a fresh index.
+    inventory, when the caller already walked the project, spares the rebuild
+    a second traversal.
+    """
+    index = _memo.get(str(cwd))
+    if index is None or not is_fresh(index, cwd):
+        index = _read(cwd)
+    if index is None or not is_fresh(index, cwd):
+        try:
+            # Create the cache dir first: doing it after stamping would bump
+            # the mtime of cwd and invalidate the index we just built.
+            directory: Optional[Path] = ensure_cache_dir(cwd)
+        except OSError:
+            directory = None  # read-only checkout: still usable in memory
+        index = build_index(cwd, inventory)
+        if directory is not None:
+            try:
+                (directory / INDEX_NAME).write_text(json.dumps(index, indent=1), encoding="utf-8")
+            except OSError:
+                pass
+    _memo[str(cwd)] = index
+    return index
+
+
+def invalidate(cwd: Path) -> None:
+    """Drop the cached index, e.g. after a plugin.json edit."""
+    _memo.pop(str(cwd), None)
+    try:
+        (cache_dir(cwd) / INDEX_NAME).unlink()
+    except OSError:
+        pass
+
+
+def discover(cwd: Path, inventory: Optional[Inventory] = None) -> tuple[list[Path], list[Path]]:
+    """Return (skill_dirs, agent_dirs) from the cached index."""
+    index = load_index(cwd, inventory)
+    return (
+        [cwd / rel for rel in index["skill_dirs"]],
+        [cwd / rel for rel in index["agent_dirs"]],
+    )
+
+
+def plugin_roots(cwd: Path, inventory: Optional[Inventory] = None) -> list[Path]:
+    """Return every plugin root (the dir containing .claude-plugin/) from the index."""
+    return [cwd / rel for rel in load_index(cwd, inventory)["plugin_roots"]]
@@ -0,0 +1,131 @@
+"""Per-run cache of component files and path existence.
+
+In one validation run the same SKILL.md is read by the result-cache key, the
+check itself and the link graph, and the same link target is stat-ed by the
+check and by the cache context fingerprint. Inside `with documents.run():`
+each file is read once and parsed (validators.scanner) once, and each
+existence check is answered once; outside a run every call goes to disk, so
+long-lived processes (the validator daemon) never see stale content.
+
+A run is one batch (validate_all, validate_plugin, validate_skill) or one
+hook call. Files edited during a run are seen as they were when first read.
+Runs nest: an inner run reuses the outer cache. The active run is held in a
+context variable, so runs in different threads (concurrent validate_plugin()
+calls, the daemon's connections) each get their own cache.
+"""
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, Optional
+
+from . import metrics
+from .scanner import MarkdownDoc, scan
+
+
+class CachedFile:
+    """A file's bytes, decoded text and scan, each computed on first use."""
+
+    __slots__ = ("data", "_text", "_doc")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self._text: Optional[str] = None
+        self._doc: Optional[MarkdownDoc] = None
+
+    @property
+    def text(self) -> str:
+        """UTF-8 text; raises UnicodeDecodeError like Path.read_text."""
+        if self._text is None:
+            self._text = self.data.decode("utf-8")
+        return self._text
+
+    @property
+    def doc(self) -> MarkdownDoc:
+        if self._doc is None:
+            self._doc = scan(self.text)
+        return self._doc
+
+
+class DocumentCache:
+    def __init__(self) -> None:
+        self.files: dict[str, CachedFile] = {}
+        self.existing: dict[str, bool] = {}
+        self.reads = 0
+
+    def read(self, path: Path) -> CachedFile:
+        key = os.fspath(path)
+        cached = self.files.get(key)
+        if cached is None:
+            cached = CachedFile(_read_bytes(path))
+            self.reads += 1
+            self.files[key] = cached
+        return cached
+
+    def exists(self, path: Path) -> bool:
+        key = os.path.normpath(path)
+        found = self.existing.get(key)
+        if found is None:
+            found = os.path.exists(key)
+            self.existing[key] = found
+        return found
+
+
+_active: ContextVar[Optional[DocumentCache]] = ContextVar("documents_run", default=None)
+
+
+@metrics.timed("read")
+def _read_bytes(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+@contextmanager
+def run() -> Iterator[DocumentCache]:
+    """Cache reads and existence checks until the block exits."""
+    active = _active.get()
+    if active is not None:
+        yield active
+        return
+    token = _active.set(DocumentCache())
+    try:
+        yield _active.get()
+    finally:
+        _active.reset(token)
+
+
+def read(path: Path) -> CachedFile:
+    """Read path (once per run); raises OSError like Path.read_bytes."""
+    active = _active.get()
+    if active is not None:
+        return active.read(path)
+    return CachedFile(_read_bytes(path))
+
+
+def read_text(path: Path) -> str:
+    return read(path).text
+
+
+def load(path: Path) -> MarkdownDoc:
+    """Scanned Markdown of path (parsed once per run)."""
+    return read(path).doc
+
+
+def scan_data(path: Path, data: bytes) -> MarkdownDoc:
+    """Scan data read from path, reusing the run's parse when it is the same read."""
+    active = _active.get()
+    cached = active.files.get(os.fspath(path)) if active is not None else None
+    if cached is not None and cached.data is data:
+        try:
+            return cached.doc
+        except UnicodeDecodeError:
+            pass
+    return scan(data.decode("utf-8", errors="replace"))
+
+
+def exists(path: Path) -> bool:
+    """os.path.exists, answered once per run."""
+    active = _active.get()
+    if active is not None:
+        return active.exists(path)
+    return os.path.exists(path)   # False, not OSError, for names too long to stat
@@ -0,0 +1,289 @@
+"""Near-duplicate content detection across SKILL.md bodies and references.
+
+Copy-pasted blocks are found by winnowing (Schleimer et al.): every file is
+reduced to words (lowercased, punctuation and Markdown markup dropped), each
+run of SHINGLE_WORDS words is hashed with a Rabin-Karp rolling hash, and the
+minimum hash of every WINDOW consecutive shingles is kept as a fingerprint.
+Any block shared by two files that is at least SHINGLE_WORDS + WINDOW - 1
+words long shares a fingerprint.
+
+The fingerprint index is memory-bounded, so tens of thousands of files can be
+scanned in one process:
+
+- it holds at most MAX_FINGERPRINTS entries; past that, only fingerprints
+  with hash % 2^k == 0 are kept and k grows as needed. Long blocks still
+  share sampled fingerprints; the shortest matches may be missed
+- a fingerprint in more than MAX_POSTINGS files is boilerplate (licence
+  lines, standard headings) and stops being tracked
+
+Files that share fingerprints are re-read and each shared fingerprint is
+extended word by word in both directions. Small edits do not end a block:
+after up to MAX_GAP_WORDS differing words on either side, extension goes on
+when RESYNC_WORDS equal words follow. Blocks are reported with the line
+ranges in both files.
+"""
+
+import re
+from zlib import crc32
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from . import documents
+from .scanner import split_frontmatter
+
+SHINGLE_WORDS = 12
+WINDOW = 16
+MIN_BLOCK_WORDS = 40
+MAX_GAP_WORDS = 6
+RESYNC_WORDS = 4
+MAX_FINGERPRINTS = 1_000_000
+MAX_POSTINGS = 64
+MAX_OPEN_DOCUMENTS = 256
+
+_WORD = re.compile(r"\w+")
+_MOD = (1 << 61) - 1
+_BASE = 1_000_003
+
+
+@dataclass
+class Document:
+    path: Path
+    words: list[str]
+    lines: list[int]   # 1-based line of each word
+
+
+@dataclass
+class DuplicateBlock:
+    """A block of path_a that reappears, possibly with small edits, in path_b."""
+
+    path_a: Path
+    lines_a: tuple[int, int]
+    path_b: Path
+    lines_b: tuple[int, int]
+    words: int
+
+    @property
+    def line_count(self) -> int:
+        return self.lines_a[1] - self.lines_a[0] + 1
+
+
+def _body(path: Path) -> Optional[tuple[str, int]]:
+    """Text to compare and the line it starts on; SKILL.md frontmatter is skipped."""
+    try:
+        text = documents.read_text(path)
+    except (OSError, UnicodeDecodeError):
+        return None
+    start = split_frontmatter(text)[1] if path.name == "SKILL.md" else 0
+    return text[start:], text.count("\n", 0, start) + 1
+
+
+def read_words(path: Path) -> Optional[list[str]]:
+    body = _body(path)
+    return _WORD.findall(body[0].lower()) if body is not None else None
+
+
+def read_document(path: Path) -> Optional[Document]:
+    """Words of a Markdown file with their line numbers."""
+    body = _body(path)
+    if body is None:
+        return None
+    text, line_no = body
+    words: list[str] = []
+    lines: list[int] = []
+    for line in text.lower().split("\n"):
+        found = _WORD.findall(line)
+        words.extend(found)
+        lines.extend([line_no] * len(found))
+        line_no += 1
+    return Document(path, words, lines)
+
+
+def fingerprints(words: list[str]) -> list[tuple[int, int]]:
+    """Winnowed (hash, word position) fingerprints of the word sequence."""
+    if len(words) < SHINGLE_WORDS:
+        return []
+    values = [crc32(w.encode()) for w in words]
+    top = pow(_BASE, SHINGLE_WORDS - 1, _MOD)
+    h = 0
+    for value in values[:SHINGLE_WORDS]:
+        h = (h * _BASE + value) % _MOD
+    hashes = [h]
+    for i in range(SHINGLE_WORDS, len(values)):
+        h = ((h - values[i - SHINGLE_WORDS] * top) * _BASE + values[i]) % _MOD
+        hashes.append(h)
+
+    # Rightmost minimum of each window, via a monotonic deque.
+    selected: list[tuple[int, int]] = []
+    window: deque[int] = deque()
+    for i, h in enumerate(hashes):
+        while window and hashes[window[-1]] >= h:
+            window.pop()
+        window.append(i)
+        if window[0] <= i - WINDOW:
+            window.popleft()
+        if i >= WINDOW - 1 or i == len(hashes) - 1:
+            pick = window[0]
+            if not selected or selected[-1][1] != pick:
+                selected.append((hashes[pick], pick))
+    return selected
+
+
+class FingerprintIndex:
+    """hash -> (file id, position) postings, bounded by modular sampling.
+
+    A posting is packed into one int (file id << 32 | position); most hashes
+    occur in a single file and are stored as that int alone, not a list.
+    """
+
+    def __init__(self, max_entries: int = MAX_FINGERPRINTS, max_postings: int = MAX_POSTINGS) -> None:
+        self.max_entries = max_entries
+        self.max_postings = max_postings
+        self.sample_mask = 0
+        self._postings: dict[int, int | list[int]] = {}
+        self._boilerplate: set[int] = set()
+
+    def add(self, file_id: int, prints: list[tuple[int, int]]) -> None:
+        """Index one file's fingerprints; file ids must be added in increasing order."""
+        postings = self._postings
+        base = file_id << 32
+        for h, pos in prints:
+            if h & self.sample_mask or h in self._boilerplate:
+                continue
+            posting = postings.get(h)
+            if posting is None:
+                postings[h] = base | pos
+            elif isinstance(posting, int):
+                if posting >> 32 != file_id:   # the first position per file seeds a match
+                    postings[h] = [posting, base | pos]
+            elif posting[-1] >> 32 != file_id:
+                if len(posting) >= self.max_postings:
+                    del postings[h]
+                    self._boilerplate.add(h)
+                else:
+                    posting.append(base | pos)
+        while len(self._postings) + len(self._boilerplate) > self.max_entries:
+            self.sample_mask = self.sample_mask * 2 + 1
+            self._postings = {h: p for h, p in self._postings.items() if not h & self.sample_mask}
+            self._boilerplate = {h for h in self._boilerplate if not h & self.sample_mask}
+
+    def shared(self) -> dict[tuple[int, int], list[tuple[int, int]]]:
+        """(file a, file b) -> [(position in a, position in b)] for a < b."""
+        pairs: dict[tuple[int, int], list[tuple[int, int]]] = defaultdict(list)
+        mask = (1 << 32) - 1
+        for posting in self._postings.values():
+            if isinstance(posting, int):
+                continue
+            for x, packed_a in enumerate(posting):
+                for packed_b in posting[x + 1:]:   # ascending file ids
+                    pairs[packed_a >> 32, packed_b >> 32].append((packed_a & mask, packed_b & mask))
+        return pairs
+
+
+def _extend(a: list[str], b: list[str], i: int, j: int, step: int) -> tuple[int, int]:
+    """Walk from a[i], b[j] (exclusive) while the texts agree, skipping small edits.
+
+    An edit of up to MAX_GAP_WORDS words on either side is skipped when
+    RESYNC_WORDS equal words follow it. Returns the last matching positions.
+    """
+    def same(x: int, y: int, n: int) -> bool:
+        return all(0 <= x + k * step < len(a) and 0 <= y + k * step < len(b)
+                   and a[x + k * step] == b[y + k * step] for k in range(n))
+
+    while True:
+        x, y = i + step, j + step
+        if same(x, y, 1):
+            i, j = x, y
+            continue
+        resync = next(((x + gx * step, y + gy * step)
+                       for gap in range(1, MAX_GAP_WORDS + 1)
+                       for gx, gy in ((gap, gap), (gap, 0), (0, gap))
+                       if same(x + gx * step, y + gy * step, RESYNC_WORDS)), None)
+        if resync is None:
+            return i, j
+        i, j = resync
+
+
+def _common_runs(a: list[str], b: list[str], seeds: list[tuple[int, int]]) -> list[tuple[int, int, int, int]]:
+    """Extend each seed into a near-duplicate block; returns (start a, end a, start b, end b)."""
+    runs: list[tuple[int, int, int, int]] = []
+    covered_a = covered_b = -1   # seeds inside the last block add nothing
+    for pos_a, pos_b in sorted(seeds):
+        if pos_a < covered_a and pos_b < covered_b:
+            continue
+        if a[pos_a:pos_a + SHINGLE_WORDS] != b[pos_b:pos_b + SHINGLE_WORDS]:
+            continue   # hash collision
+        start_a, start_b = _extend(a, b, pos_a, pos_b, -1)
+        end_a, end_b = _extend(a, b, pos_a + SHINGLE_WORDS - 1, pos_b + SHINGLE_WORDS - 1, 1)
+        covered_a, covered_b = end_a + 1, end_b + 1
+        runs.append((start_a, end_a + 1, start_b, end_b + 1))
+    return runs
+
+
+def _merge_runs(runs: list[tuple[int, int, int, int]]) -> list[tuple[int, int, int, int]]:
+    """Merge overlapping or adjacent blocks found from different seeds."""
+    blocks: list[list[int]] = []
+    for start_a, end_a, start_b, end_b in sorted(runs):
+        last = blocks[-1] if blocks else None
+        if (last is not None and start_a - last[1] <= MAX_GAP_WORDS
+                and -MAX_GAP_WORDS <= start_b - last[3] <= MAX_GAP_WORDS):
+            last[1], last[3] = max(last[1], end_a), max(last[3], end_b)
+        else:
+            blocks.append([start_a, end_a, start_b, end_b])
+    return [tuple(block) for block in blocks]
+
+
+def find_duplicates(paths: Iterable[Path], min_words: int = MIN_BLOCK_WORDS,
+                    index: Optional[FingerprintIndex] = None) -> list[DuplicateBlock]:
+    """Return blocks of at least min_words words shared by two of the files, largest first.
+
+    Only fingerprints are kept while scanning; the words of a file are read
+    again (at most MAX_OPEN_DOCUMENTS held at once) only if it shares
+    fingerprints with another file.
+    """
+    paths = list(dict.fromkeys(paths))
+    index = index or FingerprintIndex()
+    for file_id, path in enumerate(paths):
+        words = read_words(path)
+        if words is not None:
+            index.add(file_id, fingerprints(words))
+
+    blocks: list[DuplicateBlock] = []
+    documents: OrderedDict[int, Optional[Document]] = OrderedDict()
+
+    def document(file_id: int) -> Optional[Document]:
+        if file_id in documents:
+            documents.move_to_end(file_id)
+        else:
+            documents[file_id] = read_document(paths[file_id])
+            if len(documents) > MAX_OPEN_DOCUMENTS:
+                documents.popitem(last=False)
+        return documents[file_id]
+
+    pairs = index.shared()
+    for file_a, file_b in sorted(pairs):
+        doc_a, doc_b = document(file_a), document(file_b)
+        if doc_a is None or doc_b is None:
+            continue
+        runs = _common_runs(doc_a.words, doc_b.words, pairs[file_a, file_b])
+        for start_a, end_a, start_b, end_b in _merge_runs(runs):
+            if end_a - start_a < min_words:
+                continue
+            blocks.append(DuplicateBlock(
+                doc_a.path, (doc_a.lines[start_a], doc_a.lines[end_a - 1]),
+                doc_b.path, (doc_b.lines[start_b], doc_b.lines[end_b - 1]),
+                end_a - start_a,
+            ))
+    blocks.sort(key=lambda b: (-b.words, str(b.path_a), b.lines_a))
+    return blocks
+
+
+def skill_content_files(skill_dirs: Iterable[Path]) -> list[Path]:
+    """SKILL.md and references/*.md of each skill dir."""
+    files: list[Path] = []
+    for skill_dir in skill_dirs:
+        if (skill_dir / "SKILL.md").is_file():
+            files.append(skill_dir / "SKILL.md")
+        files.extend(sorted((skill_dir / "references").glob("*.md")))
+    return files
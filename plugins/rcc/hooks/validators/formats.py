@@ -0,0 +1,126 @@
+"""Machine-readable validation output: streamed JSONL and SARIF 2.1.0.
+
+Validators report plain message strings. A Finding adds what tools need:
+the file, a stable rule id derived from the message, a severity and the time
+spent checking that file. validate_all.py, validate_plugin.py and
+validate_skill.py share these writers:
+
+- JSONL: one object per line, written and flushed as each file finishes, so
+  large runs can be piped without buffering. "finding" records carry path,
+  rule_id, severity, message and duration_ms; a "file" record closes each
+  checked file with its finding count and duration_ms.
+- SARIF: a single log written at the end, for code-scanning dashboards.
+"""
+
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Iterable, TextIO
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+# Message patterns → rule ids, first match wins. Messages not listed fall back
+# to a slug of their leading words.
+RULES: list[tuple[re.Pattern[str], str]] = [(re.compile(p, re.IGNORECASE), rule) for p, rule in [
+    (r"^extra frontmatter field", "frontmatter-extra-field"),
+    (r"^missing (required field|yaml frontmatter)", "frontmatter-missing"),
+    (r"^invalid frontmatter", "frontmatter-invalid"),
+    (r"^broken link", "broken-link"),
+    (r"^orphaned file", "orphaned-file"),
+    (r"^invalid variable in SKILL\.md", "hooks-only-variable"),
+    (r"^name .* should match filename", "name-filename-mismatch"),
+    (r"^invalid (model|effort|color|permissionMode|memory|isolation) ", "invalid-field-value"),
+    (r"can backtrack catastrophically", "matcher-backtracking"),
+    (r"per tool name \(limit", "matcher-cost"),
+    (r"can be the plain alternation", "matcher-alternation"),
+    (r"tool name", "unknown-tool"),
+    (r"^tools field", "tools-format"),
+    (r"^plugin\.json", "plugin-manifest"),
+    (r"^marketplace\.json", "marketplace-manifest"),
+    (r"^(claude )?plugin validate", "plugin-validate-cli"),
+    (r"^(invalid JSON|failed to read file|root must be)", "invalid-json"),
+    (r"invalid regex pattern", "invalid-matcher"),
+    (r"invalid hook event", "invalid-hook-event"),
+    (r"^duplicated block", "duplicate-content"),
+    (r"^possible trigger overlap", "trigger-overlap"),
+]]
+
+
+def rule_id(message: str) -> str:
+    """Return the stable rule id for a validator message."""
+    for pattern, rule in RULES:
+        if pattern.search(message):
+            return rule
+    # Drop quoted names and parentheticals, and a leading location such as
+    # "hooks.PreToolUse[0]:", then slug the remaining words.
+    text = re.sub(r"'[^']*'|\"[^\"]*\"|\([^)]*\)", " ", message)
+    location, sep, rest = text.partition(":")
+    if sep and re.search(r"[\[./]", location):
+        text = rest
+    words = [w for w in re.findall(r"[a-z0-9]+", text.lower()) if not w.isdigit()][:6]
+    return "-".join(words) or "validation"
+
+
+@dataclass
+class Finding:
+    path: str
+    rule_id: str
+    severity: str      # "error" | "warning" | "info"
+    message: str
+    duration_ms: float
+
+    @classmethod
+    def of(cls, path: str, message: str, severity: str = "warning",
+           seconds: float = 0.0) -> "Finding":
+        return cls(path, rule_id(message), severity, message, round(seconds * 1000, 3))
+
+
+class JsonlWriter:
+    """Write findings as JSON lines, flushed as they are written."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def finding(self, finding: Finding) -> None:
+        self.stream.write(json.dumps({"type": "finding", **asdict(finding)}, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def file_done(self, path: str, count: int, seconds: float) -> None:
+        self.stream.write(json.dumps({
+            "type": "file", "path": path, "findings": count,
+            "duration_ms": round(seconds * 1000, 3),
+        }, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def sarif_log(findings: Iterable[Finding], tool_name: str,
+              information_uri: str = "https://github.com/wayne930242/Reflexive-Claude-Code") -> dict:
+    """Return a SARIF 2.1.0 log with one run containing every finding."""
+    findings = list(findings)
+    rules = sorted({f.rule_id for f in findings})
+    index = {r: i for i, r in enumerate(rules)}
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": tool_name,
+                "informationUri": information_uri,
+                "rules": [{"id": r, "name": r} for r in rules],
+            }},
+            "results": [{
+                "ruleId": f.rule_id,
+                "ruleIndex": index[f.rule_id],
+                "level": SARIF_LEVELS.get(f.severity, "warning"),
+                "message": {"text": f.message},
+                "locations": [{"physicalLocation": {"artifactLocation": {"uri": f.path.replace("\\", "/")}}}],
+                "properties": {"durationMs": f.duration_ms},
+            } for f in findings],
+        }],
+    }
+
+
+def write_sarif(findings: Iterable[Finding], stream: TextIO, tool_name: str) -> None:
+    json.dump(sarif_log(findings, tool_name), stream, indent=2, ensure_ascii=False)
+    stream.write("\n")
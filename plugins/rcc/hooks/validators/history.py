@@ -0,0 +1,100 @@
+"""Results of previous validate_all runs, for merging and new/fixed deltas.
+
+Re-validation itself is incremental through validators.result_cache: files
+whose content (and context) hash is unchanged reuse their cached warnings.
+This module keeps what the last runs concluded, per component, in
+.rcc/cache/last_run.json as {path: warnings} (clean components map to []):
+
+- a full run replaces the state; components that vanished count as fixed
+- a scoped run (--staged / --changed-since) merges its components in and
+  drops those that no longer exist
+
+Comparing a run against the stored state yields the warnings that are new
+and those that were fixed since.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .discovery import cache_dir, ensure_cache_dir
+
+STATE_NAME = "last_run.json"
+STATE_VERSION = 1
+
+
+@dataclass
+class Delta:
+    """Warnings that appeared or disappeared since the previous run."""
+
+    new: dict[str, list[str]] = field(default_factory=dict)
+    fixed: dict[str, list[str]] = field(default_factory=dict)
+    has_baseline: bool = True
+
+    def counts(self) -> tuple[int, int]:
+        return sum(map(len, self.new.values())), sum(map(len, self.fixed.values()))
+
+
+def load(cwd: Path) -> Optional[dict[str, list[str]]]:
+    """Return the stored {path: warnings}, or None before the first run."""
+    try:
+        data = json.loads((cache_dir(cwd) / STATE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        return None
+    results = data.get("results")
+    return results if isinstance(results, dict) else None
+
+
+def save(cwd: Path, state: dict[str, list[str]]) -> None:
+    path = cache_dir(cwd) / STATE_NAME
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        ensure_cache_dir(cwd)
+        tmp.write_text(json.dumps({"version": STATE_VERSION, "results": state}, indent=1, sort_keys=True),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def compare(previous: dict[str, list[str]], checked: dict[str, list[str]],
+            gone: set[str]) -> Delta:
+    """Diff the checked components (and the gone ones) against previous."""
+    delta = Delta()
+    for rel in sorted(set(checked) | gone):
+        before = previous.get(rel, [])
+        after = checked.get(rel, [])
+        new = [w for w in after if w not in before]
+        fixed = [w for w in before if w not in after]
+        if new:
+            delta.new[rel] = new
+        if fixed:
+            delta.fixed[rel] = fixed
+    return delta
+
+
+def record(cwd: Path, checked: dict[str, list[str]], full: bool,
+           removed: Iterable[str] = ()) -> Delta:
+    """Store this run's per-component results and return the delta to the last run.
+
+    checked maps every component the run looked at to its warnings, clean
+    ones included; removed lists paths a scoped run knows were deleted.
+    """
+    previous = load(cwd)
+    state = dict(previous or {})
+    if full:
+        gone = set(state) - set(checked)
+        state = {}
+    else:
+        gone = set(removed) & set(state)
+        for rel in gone:
+            del state[rel]
+    state.update(checked)
+    save(cwd, state)
+    if previous is None:
+        return Delta(has_baseline=False)
+    return compare(previous, checked, gone)
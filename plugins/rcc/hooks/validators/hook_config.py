@@ -0,0 +1,193 @@
+"""Configured hooks across settings layers and plugins.
+
+Claude Code merges the hooks of every layer and runs all that match:
+
+- user:     ~/.claude/settings.json
+- project:  <project>/.claude/settings.json
+- local:    <project>/.claude/settings.local.json
+- plugins:  hooks/hooks.json of each plugin root, or the "hooks" entry of
+            its plugin.json (a path or an inline object)
+
+Files are read the way check_settings_json and check_hooks_json read them;
+malformed parts are skipped here (the validators report them). Each hook
+becomes one HookEntry that knows its layer, event, matcher and timeout.
+Plugins are the plugin roots of the project (validators.discovery) plus any
+extra dirs given, minus those the merged enabledPlugins setting turns off;
+installed marketplace plugins are not looked up.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from . import documents
+from .constants import DEFAULT_HOOK_TIMEOUTS
+from .discovery import plugin_roots
+
+# What the matcher of a non-tool event is tested against, with the values
+# Claude Code sends. Tool events match the tool name.
+MATCH_FIELDS: dict[str, tuple[str, list[str]]] = {
+    "SessionStart": ("source", ["startup", "resume", "clear", "compact"]),
+    "SessionEnd": ("reason", ["clear", "logout", "prompt_input_exit", "other"]),
+    "PreCompact": ("trigger", ["manual", "auto"]),
+    "PostCompact": ("trigger", ["manual", "auto"]),
+    "Notification": ("notification_type", ["permission_prompt", "idle_prompt", "auth_success"]),
+    "SubagentStart": ("agent_type", ["general-purpose", "Explore", "Plan"]),
+    "SubagentStop": ("agent_type", ["general-purpose", "Explore", "Plan"]),
+    "ConfigChange": ("source", ["user_settings", "project_settings", "local_settings", "skills"]),
+    "FileChanged": ("file_path", []),
+}
+
+
+@dataclass(frozen=True)
+class HookEntry:
+    source: str                     # "user", "project", "local" or "plugin:<name>"
+    path: Path                      # file the hook is declared in
+    event: str
+    matcher: str                    # "" when the group has none
+    group: int                      # index of the matcher group in the event
+    index: int                      # index of the hook in the group
+    config: dict
+    plugin_root: Optional[Path] = None
+
+    @property
+    def type(self) -> str:
+        return str(self.config.get("type", ""))
+
+    @property
+    def command(self) -> str:
+        return str(self.config.get("command", ""))
+
+    @property
+    def timeout(self) -> float:
+        """Declared timeout in seconds, or Claude Code's default for the type."""
+        value = self.config.get("timeout")
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            return float(value)
+        return float(DEFAULT_HOOK_TIMEOUTS.get(self.type, 600))
+
+    @property
+    def is_async(self) -> bool:
+        return self.config.get("async") is True
+
+    @property
+    def once(self) -> bool:
+        return self.config.get("once") is True
+
+    @property
+    def if_rule(self) -> Optional[str]:
+        value = self.config.get("if")
+        return value if isinstance(value, str) and value else None
+
+    @property
+    def label(self) -> str:
+        return f"{self.source} {self.event}[{self.matcher or '*'}] #{self.group}.{self.index}"
+
+
+def hooks_from_object(hooks: object, source: str, path: Path,
+                      plugin_root: Optional[Path] = None) -> list[HookEntry]:
+    """HookEntry for every well-formed hook of a {"Event": [groups]} object."""
+    entries: list[HookEntry] = []
+    if not isinstance(hooks, dict):
+        return entries
+    for event, groups in hooks.items():
+        if not isinstance(groups, list):
+            continue
+        for g, group in enumerate(groups):
+            if not isinstance(group, dict) or not isinstance(group.get("hooks"), list):
+                continue
+            matcher = group.get("matcher", "")
+            matcher = matcher if isinstance(matcher, str) else ""
+            for i, config in enumerate(group["hooks"]):
+                if isinstance(config, dict):
+                    entries.append(HookEntry(source, path, event, matcher, g, i, config, plugin_root))
+    return entries
+
+
+def _load_json(path: Path) -> object:
+    try:
+        return json.loads(documents.read_text(path))
+    except (OSError, ValueError):
+        return None
+
+
+def settings_layers(cwd: Path, home: Optional[Path] = None) -> list[tuple[str, Path]]:
+    """(layer, settings file) in the order Claude Code merges them."""
+    home = home if home is not None else Path.home()
+    return [
+        ("user", home / ".claude" / "settings.json"),
+        ("project", cwd / ".claude" / "settings.json"),
+        ("local", cwd / ".claude" / "settings.local.json"),
+    ]
+
+
+def load_layers(cwd: Path, home: Optional[Path] = None) -> list[tuple[str, Path, dict]]:
+    """(layer, path, settings) for every settings file that parses to an object."""
+    layers = []
+    for source, path in settings_layers(cwd, home):
+        data = _load_json(path)
+        if isinstance(data, dict):
+            layers.append((source, path, data))
+    return layers
+
+
+def file_hooks(path: Path, source: str) -> list[HookEntry]:
+    """Hooks of one settings.json or hooks.json file."""
+    data = _load_json(path)
+    return hooks_from_object(data.get("hooks") if isinstance(data, dict) else None, source, path)
+
+
+def merged_setting(layers: list[tuple[str, Path, dict]], key: str) -> object:
+    """Value of key in the last layer that sets it (local overrides project overrides user)."""
+    value = None
+    for _, _, data in layers:
+        if key in data:
+            value = data[key]
+    return value
+
+
+def plugin_enabled(name: str, enabled: object) -> bool:
+    """False only when enabledPlugins turns the plugin ("name@marketplace") off."""
+    if not isinstance(enabled, dict):
+        return True
+    return all(value is not False for key, value in enabled.items() if key.split("@")[0] == name)
+
+
+def plugin_hooks(plugin_root: Path) -> list[HookEntry]:
+    """Hooks of one plugin, from plugin.json's "hooks" entry or hooks/hooks.json."""
+    manifest = _load_json(plugin_root / ".claude-plugin" / "plugin.json")
+    manifest = manifest if isinstance(manifest, dict) else {}
+    name = manifest.get("name") if isinstance(manifest.get("name"), str) else plugin_root.name
+    source = f"plugin:{name}"
+    declared = manifest.get("hooks")
+    if isinstance(declared, dict):
+        return hooks_from_object(declared.get("hooks", declared), source,
+                                 plugin_root / ".claude-plugin" / "plugin.json", plugin_root)
+    path = plugin_root / declared if isinstance(declared, str) else plugin_root / "hooks" / "hooks.json"
+    data = _load_json(path)
+    hooks = data.get("hooks") if isinstance(data, dict) else None
+    return hooks_from_object(hooks, source, path, plugin_root)
+
+
+def discover_hooks(cwd: Path, home: Optional[Path] = None, plugins: bool = True,
+                   extra_plugin_dirs: Iterable[Path] = ()) -> list[HookEntry]:
+    """Every hook that applies in the project, settings layers first.
+
+    Nothing applies when the merged settings set disableAllHooks; plugins
+    that enabledPlugins turns off are skipped.
+    """
+    layers = load_layers(cwd, home)
+    if merged_setting(layers, "disableAllHooks") is True:
+        return []
+    entries: list[HookEntry] = []
+    for source, path, data in layers:
+        entries.extend(hooks_from_object(data.get("hooks"), source, path))
+    roots: list[Path] = list(plugin_roots(cwd)) if plugins else []
+    roots.extend(Path(p) for p in extra_plugin_dirs)
+    enabled = merged_setting(layers, "enabledPlugins")
+    for root in dict.fromkeys(r.resolve() for r in roots):
+        hooks = plugin_hooks(root)
+        if hooks and plugin_enabled(hooks[0].source.removeprefix("plugin:"), enabled):
+            entries.extend(hooks)
+    return entries
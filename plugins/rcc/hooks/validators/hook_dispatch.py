@@ -0,0 +1,122 @@
+"""Which configured hooks fire for an event, and what they cost.
+
+Dispatch follows Claude Code:
+
+- a hook fires for its event when its matcher accepts the event's value
+  (the tool name for TOOL_EVENTS, the MATCH_FIELDS value for others);
+  matchers of NO_MATCHER_EVENTS are ignored (validators.matchers.matches)
+- identical handlers (same type and command, URL or prompt) run once
+- all hooks of one event run in parallel and the event waits for the
+  slowest blocking one; async hooks do not block. Events of one tool call
+  run one after the other (PHASES)
+
+A hook's cost is its measured latency when known (the warm p95 in
+bench_hooks.py --format json output) and otherwise its timeout, the most
+it can block.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+from .config_validator import NO_MATCHER_EVENTS
+from .hook_config import HookEntry
+from .matchers import matches
+
+# Events a tool call passes through, in order; events in one phase are
+# alternatives (a call succeeds or fails), so a phase costs its dearest event.
+PHASES: list[tuple[str, ...]] = [
+    ("PreToolUse",),
+    ("PermissionRequest",),
+    ("PostToolUse", "PostToolUseFailure"),
+]
+TOOL_PHASE_EVENTS = {event for phase in PHASES for event in phase}
+
+
+def handler_key(entry: HookEntry) -> tuple[str, str]:
+    config = entry.config
+    target = config.get("command") or config.get("url") or config.get("prompt") or ""
+    return entry.type, str(target)
+
+
+def fires(entry: HookEntry, event: str, value: str) -> bool:
+    if entry.event != event:
+        return False
+    return event in NO_MATCHER_EVENTS or matches(entry.matcher, value)
+
+
+def matching_hooks(entries: list[HookEntry], event: str, value: str,
+                   condition: Optional[Callable[[HookEntry], bool]] = None) -> list[HookEntry]:
+    """Hooks that run for event with matcher value, identical handlers once.
+
+    condition (e.g. a hook's "if" rule) filters entries before identical
+    handlers are merged, so a handler still runs when any of its entries
+    applies.
+    """
+    found: dict[tuple[str, str], HookEntry] = {}
+    for entry in entries:
+        if fires(entry, event, value) and (condition is None or condition(entry)):
+            found.setdefault(handler_key(entry), entry)
+    return list(found.values())
+
+
+def load_measured_costs(path: Path) -> dict[str, float]:
+    """Seconds by hook label and by "command:<command>", from bench_hooks.py --format json.
+
+    The command key lets a candidate config reuse the measurements of the
+    same commands under the labels of the current configuration.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    costs: dict[str, float] = {}
+    for item in data if isinstance(data, list) else []:
+        warm = item.get("warm") if isinstance(item, dict) else None
+        if isinstance(warm, dict) and warm.get("runs"):
+            costs[item["hook"]] = float(warm["p95"])
+            if item.get("command"):
+                costs.setdefault(f"command:{item['command']}", float(warm["p95"]))
+    return costs
+
+
+def hook_cost(entry: HookEntry, measured: Optional[Mapping[str, float]] = None) -> float:
+    if measured:
+        cost = measured.get(entry.label, measured.get(f"command:{entry.command}"))
+        if cost is not None:
+            return cost
+    return entry.timeout
+
+
+def event_wait(hooks: list[HookEntry], measured: Optional[Mapping[str, float]] = None) -> float:
+    """How long an event blocks: its slowest blocking hook (they run in parallel)."""
+    return max((hook_cost(h, measured) for h in hooks if not h.is_async), default=0.0)
+
+
+@dataclass
+class ToolOverhead:
+    tool: str
+    events: dict[str, list[HookEntry]] = field(default_factory=dict)
+
+    @property
+    def hook_count(self) -> int:
+        return sum(len(hooks) for hooks in self.events.values())
+
+    def hooks(self) -> list[HookEntry]:
+        return [h for hooks in self.events.values() for h in hooks]
+
+    def worst_case(self, measured: Optional[Mapping[str, float]] = None) -> float:
+        """Seconds one call can be held up: per phase, its dearest event's wait."""
+        return sum(max((event_wait(self.events.get(e, []), measured) for e in phase), default=0.0)
+                   for phase in PHASES)
+
+    def total_budget(self) -> float:
+        """Sum of the timeouts of every blocking hook that can run for one call."""
+        return sum(h.timeout for h in self.hooks() if not h.is_async)
+
+
+def tool_overhead(entries: list[HookEntry], tool: str) -> ToolOverhead:
+    overhead = ToolOverhead(tool)
+    for event in sorted(TOOL_PHASE_EVENTS):
+        hooks = matching_hooks(entries, event, tool)
+        if hooks:
+            overhead.events[event] = hooks
+    return overhead
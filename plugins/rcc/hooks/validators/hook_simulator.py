@@ -0,0 +1,198 @@
+"""Replay recorded sessions against a hook configuration.
+
+A trace is read either from Claude Code session transcripts (the JSONL files
+under ~/.claude/projects/<project>/) or from a JSONL file of hook events,
+one {"hook_event_name" or "event", "session_id", "tool_name", "tool_input",
+...} object per line, the shape of the payloads hooks receive.
+
+Transcripts are turned into the events Claude Code would have fired:
+SessionStart, then per user prompt UserPromptSubmit, per tool call
+PreToolUse and PostToolUse (PostToolUseFailure when the result is an
+error), Stop when the turn ends, and SessionEnd.
+
+Each event is dispatched as validators.hook_dispatch does, plus the
+per-hook conditions:
+
+- "if": a permission rule such as "Bash(git *)" or "Edit(*.py)"; the hook
+  only runs for that tool, and only when the call's command, file path or
+  pattern matches the glob. A trailing ":*" is a prefix match
+- "once": the hook runs at most once per session
+
+An event adds the wait of its slowest blocking hook; a session adds up its
+events. The estimate uses measured costs where given, the upper bound
+every hook's timeout.
+"""
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Optional
+
+from .config_validator import TOOL_EVENTS
+from .hook_config import MATCH_FIELDS, HookEntry
+from .hook_dispatch import event_wait, handler_key, matching_hooks
+
+# Tool input field an "if" rule's pattern is matched against
+RULE_FIELDS = {
+    "Bash": "command",
+    "Edit": "file_path",
+    "Write": "file_path",
+    "Read": "file_path",
+    "NotebookEdit": "notebook_path",
+    "Glob": "pattern",
+    "Grep": "pattern",
+    "WebFetch": "url",
+    "WebSearch": "query",
+}
+
+
+@dataclass
+class TraceEvent:
+    event: str
+    value: str = ""                 # tool name, or the MATCH_FIELDS value
+    tool_input: dict = field(default_factory=dict)
+
+
+def if_rule_matches(rule: str, tool: str, tool_input: dict) -> bool:
+    """Whether a permission-rule "if" condition selects this tool call."""
+    name, paren, pattern = rule.strip().partition("(")
+    if name.strip() != tool:
+        return False
+    if not paren:
+        return True
+    pattern = pattern.rstrip(")").strip()
+    if pattern in ("", "*"):
+        return True
+    target = tool_input.get(RULE_FIELDS.get(tool, ""), "")
+    if not isinstance(target, str):
+        return False
+    if pattern.endswith(":*"):
+        return target.startswith(pattern[:-2])
+    if fnmatchcase(target, pattern):
+        return True
+    # file rules are written relative to the project ("src/**/*.ts", "*.py")
+    return "/" in target and fnmatchcase(target.rsplit("/", 1)[1], pattern)
+
+
+def _transcript_events(records: list[dict]) -> Iterator[TraceEvent]:
+    yield TraceEvent("SessionStart", "startup")
+    in_turn = False
+    pending: dict[str, tuple[str, dict]] = {}
+    for record in records:
+        message = record.get("message")
+        if not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        blocks = content if isinstance(content, list) else []
+        if record.get("type") == "assistant":
+            for block in blocks:
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    name = str(block.get("name", ""))
+                    tool_input = block.get("input") if isinstance(block.get("input"), dict) else {}
+                    pending[str(block.get("id", ""))] = (name, tool_input)
+                    yield TraceEvent("PreToolUse", name, tool_input)
+        elif record.get("type") == "user":
+            results = [b for b in blocks if isinstance(b, dict) and b.get("type") == "tool_result"]
+            for result in results:
+                call = pending.pop(str(result.get("tool_use_id", "")), None)
+                if call is not None:
+                    event = "PostToolUseFailure" if result.get("is_error") else "PostToolUse"
+                    yield TraceEvent(event, call[0], call[1])
+            if not results and not record.get("isMeta") and not record.get("isSidechain"):
+                if in_turn:
+                    yield TraceEvent("Stop")
+                in_turn = True
+                yield TraceEvent("UserPromptSubmit")
+    if in_turn:
+        yield TraceEvent("Stop")
+    yield TraceEvent("SessionEnd", "other")
+
+
+def _hook_event(record: dict) -> Optional[TraceEvent]:
+    event = record.get("hook_event_name") or record.get("event")
+    if not isinstance(event, str):
+        return None
+    if event in TOOL_EVENTS:
+        tool_input = record.get("tool_input") if isinstance(record.get("tool_input"), dict) else {}
+        return TraceEvent(event, str(record.get("tool_name", "")), tool_input)
+    match_field = MATCH_FIELDS.get(event, ("", []))[0]
+    return TraceEvent(event, str(record.get(match_field) or record.get("value") or ""))
+
+
+def _records(path: Path) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def read_trace(paths: Iterable[Path]) -> dict[str, list[TraceEvent]]:
+    """session id -> events, from transcript files, hook-event files or dirs of them."""
+    sessions: dict[str, list[TraceEvent]] = {}
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(path.glob("*.jsonl")) if path.is_dir() else [path])
+    for path in files:
+        transcript: dict[str, list[dict]] = {}
+        for record in _records(path):
+            if record.get("type") in ("user", "assistant"):
+                session = str(record.get("sessionId") or path.stem)
+                transcript.setdefault(session, []).append(record)
+            else:
+                event = _hook_event(record)
+                if event is not None:
+                    session = str(record.get("session_id") or path.stem)
+                    sessions.setdefault(session, []).append(event)
+        for session, records in transcript.items():
+            sessions.setdefault(session, []).extend(_transcript_events(records))
+    return sessions
+
+
+@dataclass
+class SessionResult:
+    session: str
+    events: int = 0
+    tool_calls: int = 0
+    hook_runs: Counter = field(default_factory=Counter)   # hook label -> runs
+    estimated: float = 0.0        # seconds added, measured costs where known
+    upper_bound: float = 0.0      # seconds added if every hook ran to its timeout
+
+
+def simulate(entries: list[HookEntry], session: str, events: list[TraceEvent],
+             measured: Optional[Mapping[str, float]] = None) -> SessionResult:
+    result = SessionResult(session)
+    ran_once: set[tuple[str, str]] = set()
+    for trace_event in events:
+        result.events += 1
+        if trace_event.event == "PreToolUse":
+            result.tool_calls += 1
+        def applies(hook: HookEntry) -> bool:
+            return not (hook.if_rule and trace_event.event in TOOL_EVENTS) or if_rule_matches(
+                hook.if_rule, trace_event.value, trace_event.tool_input)
+
+        hooks = []
+        for hook in matching_hooks(entries, trace_event.event, trace_event.value, applies):
+            if hook.once:
+                if handler_key(hook) in ran_once:
+                    continue
+                ran_once.add(handler_key(hook))
+            hooks.append(hook)
+        for hook in hooks:
+            result.hook_runs[hook.label] += 1
+        result.estimated += event_wait(hooks, measured)
+        result.upper_bound += event_wait(hooks)
+    return result
+
+
+def simulate_sessions(entries: list[HookEntry], sessions: dict[str, list[TraceEvent]],
+                      measured: Optional[Mapping[str, float]] = None) -> list[SessionResult]:
+    return [simulate(entries, session, events, measured) for session, events in sessions.items()]
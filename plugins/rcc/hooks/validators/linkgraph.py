@@ -0,0 +1,221 @@
+"""Persistent SKILL.md → referenced-file graph with reverse edges.
+
+check_skill_md reads more than SKILL.md: link targets (which may live outside
+the skill dir) and the files next to it (for orphan detection). Editing or
+deleting one of those changes the skill's warnings without touching SKILL.md.
+The graph records, per SKILL.md, every file it links to or mentions, so the
+hook can look up exactly which skills a changed path affects.
+
+Stored in .rcc/cache/linkgraph.json as {skill: [targets]}, all paths relative
+to the project. It is built once from the skill dirs, then kept current by the
+hook (one SKILL.md at a time) and rebuilt by validate_all. A graph loaded from
+the file notices when another process (validate_all next to the daemon)
+rewrote it: it reloads before use, and when saving it re-reads the file and
+applies only the skills it refreshed itself.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+from . import documents
+from .commands import REMOVING_COMMANDS, command_paths  # noqa: F401 (re-export)
+from .discovery import cache_dir, ensure_cache_dir
+from .orphans import list_files, matcher_for
+from .scanner import scan
+from .walk import Inventory, scan_project
+
+GRAPH_VERSION = 1
+GRAPH_NAME = "linkgraph.json"
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _load_skills(path: Path) -> Optional[dict[str, list[str]]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if isinstance(data, dict) and data.get("version") == GRAPH_VERSION and isinstance(data.get("skills"), dict):
+        return data["skills"]
+    return None
+
+
+def _rel(path: Path, cwd: Path) -> str:
+    return os.path.relpath(path, cwd).replace("\\", "/")
+
+
+def skill_references(skill_md: Path, cwd: Path, text: Optional[str] = None) -> list[str]:
+    """Return the project-relative paths SKILL.md links to or mentions."""
+    doc = documents.load(skill_md) if text is None else scan(text)
+    text = doc.text
+    skill_dir = skill_md.parent
+    targets = {_rel(Path(os.path.normpath(skill_dir / link)), cwd) for link in doc.links}
+    rel_paths = [rel for rel in list_files(skill_dir) if rel != skill_md.name]
+    if rel_paths:
+        mentioned = matcher_for(rel_paths).find_all(text)
+        for rel in rel_paths:
+            if rel in mentioned or rel.rsplit("/", 1)[-1] in mentioned:
+                targets.add(_rel(skill_dir / rel, cwd))
+    return sorted(targets)
+
+
+class LinkGraph:
+    """Forward edges per SKILL.md plus an in-memory reverse index."""
+
+    def __init__(self, cwd: Path, skills: Optional[dict[str, list[str]]] = None,
+                 stamp: Optional[int] = None) -> None:
+        self.cwd = cwd
+        self.path = cache_dir(cwd) / GRAPH_NAME
+        self.skills: dict[str, list[str]] = {}
+        self._reverse: dict[str, set[str]] = {}
+        self._dirty = False
+        self._changed: set[str] = set()   # skills refreshed since the file was read
+        self.stamp = stamp                # file mtime when read or written; None when built here
+        for skill, targets in (skills or {}).items():
+            self._set(skill, targets)
+
+    def is_current(self) -> bool:
+        """False when another process rewrote the file since this graph read it."""
+        return self.stamp is None or self._dirty or _mtime(self.path) == self.stamp
+
+    def _set(self, skill: str, targets: list[str]) -> None:
+        for target in self.skills.get(skill, []):
+            dependents = self._reverse.get(target)
+            if dependents is not None:
+                dependents.discard(skill)
+                if not dependents:
+                    del self._reverse[target]
+        if targets:
+            self.skills[skill] = list(targets)
+            for target in targets:
+                self._reverse.setdefault(target, set()).add(skill)
+        else:
+            self.skills.pop(skill, None)
+
+    def refresh(self, skill_md: Path) -> None:
+        """Re-read one SKILL.md's edges, dropping them if the file is gone."""
+        skill = _rel(skill_md, self.cwd)
+        try:
+            targets = skill_references(skill_md, self.cwd)
+        except (OSError, UnicodeDecodeError):
+            targets = []
+        if targets != self.skills.get(skill, []):
+            self._set(skill, targets)
+            self._changed.add(skill)
+            self._dirty = True
+
+    def forget(self, path: Path) -> None:
+        """Drop the edges of SKILL.md files at or under a removed path."""
+        rel = _rel(path, self.cwd)
+        prefix = rel.rstrip("/") + "/"
+        for skill in [s for s in self.skills if s == rel or s.startswith(prefix)]:
+            self._set(skill, [])
+            self._changed.add(skill)
+            self._dirty = True
+
+    def dependents(self, path: Path) -> set[Path]:
+        """Return the SKILL.md files referencing path, or anything under it."""
+        rel = _rel(path, self.cwd)
+        skills = set(self._reverse.get(rel, ()))
+        if not path.is_file():
+            # A directory, or a path that no longer exists (e.g. rm -r refs/)
+            prefix = rel.rstrip("/") + "/"
+            for target, dependents in self._reverse.items():
+                if target.startswith(prefix):
+                    skills.update(dependents)
+        return {self.cwd / skill for skill in skills}
+
+    def save(self) -> None:
+        """Write the graph; a loaded graph merges its refreshed skills into the file's current one."""
+        if not self._dirty:
+            return
+        if self.stamp is not None and _mtime(self.path) != self.stamp:
+            on_disk = _load_skills(self.path)
+            if on_disk is not None:
+                ours = {skill: self.skills.get(skill, []) for skill in self._changed}
+                self.skills, self._reverse = {}, {}
+                for skill, targets in {**on_disk, **ours}.items():
+                    self._set(skill, targets)
+        payload = {"version": GRAPH_VERSION, "skills": self.skills}
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            ensure_cache_dir(self.cwd)
+            tmp.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self.stamp = _mtime(self.path)
+            self._changed.clear()
+            self._dirty = False
+        except OSError:
+            pass
+
+
+_graphs: dict[str, LinkGraph] = {}
+
+
+def build(cwd: Path, skill_mds: Iterable[Path]) -> LinkGraph:
+    """Build the graph from the given SKILL.md files."""
+    graph = LinkGraph(cwd)
+    for skill_md in skill_mds:
+        graph.refresh(skill_md)
+    graph._dirty = True
+    _graphs[str(cwd)] = graph
+    return graph
+
+
+def for_project(cwd: Path, skill_dirs: Iterable[Path],
+                inventory: Optional[Inventory] = None) -> LinkGraph:
+    """Return the project's graph, loading it from disk or building it once."""
+    graph = _graphs.get(str(cwd))
+    if graph is not None and graph.is_current():
+        return graph
+    path = cache_dir(cwd) / GRAPH_NAME
+    stamp = _mtime(path)
+    skills = _load_skills(path)
+    if skills is not None:
+        graph = LinkGraph(cwd, skills, stamp)
+        _graphs[str(cwd)] = graph
+        return graph
+    if inventory is None:
+        inventory = scan_project(cwd)
+    return build(cwd, [
+        cwd / rel for sd in skill_dirs for rel in inventory.skill_mds_under(_rel(sd, cwd))
+    ])
+
+
+def owning_skill(path: Path, skill_dirs: Iterable[Path]) -> Optional[Path]:
+    """Return the SKILL.md of the skill whose directory contains path."""
+    for skill_dir in skill_dirs:
+        if path.is_relative_to(skill_dir) and path != skill_dir:
+            for parent in path.parents:
+                if (parent / "SKILL.md").is_file():
+                    return parent / "SKILL.md"
+                if parent == skill_dir:
+                    break
+    return None
+
+
+def affected_skills(graph: LinkGraph, changed: Iterable[Path],
+                    skill_dirs: list[Path]) -> list[Path]:
+    """Return existing SKILL.md files whose warnings may depend on the changed paths.
+
+    That is the skill owning each path (its file listing changed or may have)
+    and every skill linking to or mentioning it. The changed SKILL.md files
+    themselves are excluded; removed ones are dropped from the graph.
+    """
+    changed = list(changed)
+    affected: set[Path] = set()
+    for path in changed:
+        if not path.exists():
+            graph.forget(path)
+        owner = owning_skill(path, skill_dirs)
+        if owner is not None:
+            affected.add(owner)
+        affected.update(graph.dependents(path))
+    return sorted(p for p in affected - set(changed) if p.is_file())
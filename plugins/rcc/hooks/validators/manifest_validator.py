@@ -0,0 +1,221 @@
+"""Native plugin.json / marketplace.json validation.
+
+Covers the manifest rules `claude plugin validate` enforces without starting a
+Node process, so batch runs over many plugins stay in-process. The CLI remains
+available as an optional cross-check (see validate_frontmatter.check_plugin_validate).
+"""
+
+import json
+import re
+from pathlib import Path
+from . import documents, schema
+from .constants import (
+    PLUGIN_PATH_FIELDS, PLUGIN_CONFIG_FIELDS, MARKETPLACE_PLUGIN_SOURCE_TYPES,
+)
+
+KEBAB_CASE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+SEMVER = re.compile(r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
+# Findings the CLI reports as warnings: the manifest still loads
+STYLE_FINDINGS = ('should start with "./"', "is not semver")
+
+
+def severity(finding: str) -> str:
+    """"warning" for style findings, "error" for everything that breaks loading."""
+    return "warning" if any(marker in finding for marker in STYLE_FINDINGS) else "error"
+
+
+def _load_object(path: Path, warnings: list[str]) -> dict | None:
+    try:
+        data = json.loads(documents.read_text(path))
+    except json.JSONDecodeError as e:
+        warnings.append(f"{path.name}: invalid JSON: {e}")
+        return None
+    except OSError as e:
+        warnings.append(f"{path.name}: failed to read file: {e}")
+        return None
+    if not isinstance(data, dict):
+        warnings.append(f"{path.name}: root must be an object")
+        return None
+    return data
+
+
+def _check_relative_path(value: str, root: Path, context: str) -> list[str]:
+    """Validate a path that must stay inside root; returns warnings."""
+    if value.startswith("${CLAUDE_PLUGIN_ROOT}"):
+        value = "./" + value[len("${CLAUDE_PLUGIN_ROOT}"):].lstrip("/")
+    if Path(value).is_absolute() or re.match(r"^[A-Za-z]:[\\/]", value):
+        return [f'{context}: path "{value}" must be relative to the plugin root']
+    if ".." in Path(value).parts:
+        return [f'{context}: path "{value}" must not escape the plugin root']
+    warnings: list[str] = []
+    if not value.startswith("./"):
+        warnings.append(f'{context}: path "{value}" should start with "./"')
+    if not documents.exists(root / value):
+        warnings.append(f'{context}: path "{value}" does not exist')
+    return warnings
+
+
+def _check_name(data: dict, context: str) -> list[str]:
+    name = data.get("name")
+    if name is None:
+        return [f'{context}: missing required field "name"']
+    if not isinstance(name, str) or not KEBAB_CASE.match(name):
+        return [f'{context}: name "{name}" must be kebab-case (lowercase letters, digits, hyphens)']
+    return []
+
+
+def _check_version(data: dict, context: str) -> list[str]:
+    if "version" not in data:
+        return []
+    version = data["version"]
+    if not isinstance(version, str):
+        return [f"{context}: version must be a string"]
+    if not SEMVER.match(version):
+        return [f'{context}: version "{version}" is not semver (MAJOR.MINOR.PATCH)']
+    return []
+
+
+def check_plugin_json(path: Path) -> list[str]:
+    """Validate a .claude-plugin/plugin.json manifest."""
+    warnings: list[str] = []
+    data = _load_object(path, warnings)
+    if data is None:
+        return warnings
+    ctx = "plugin.json"
+    plugin_root = path.parent.parent
+
+    for field in schema.extra_fields("plugin.json", data):
+        warnings.append(f'{ctx}: unknown field "{field}"')
+
+    warnings.extend(_check_name(data, ctx))
+    warnings.extend(_check_version(data, ctx))
+
+    for field, kind in schema.wrong_types("plugin.json", data):
+        warnings.append(f'{ctx}: "{field}" must be a {kind}')
+
+    author = data.get("author")
+    if isinstance(author, dict):
+        if not isinstance(author.get("name"), str) or not author["name"]:
+            warnings.append(f'{ctx}: author object requires a "name" string')
+        for sub in ("email", "url"):
+            if sub in author and not isinstance(author[sub], str):
+                warnings.append(f'{ctx}: author.{sub} must be a string')
+    elif author is not None and not isinstance(author, str):
+        warnings.append(f"{ctx}: author must be a string or an object")
+
+    keywords = data.get("keywords")
+    if keywords is not None and not (
+        isinstance(keywords, list) and all(isinstance(k, str) for k in keywords)
+    ):
+        warnings.append(f"{ctx}: keywords must be an array of strings")
+
+    for field in sorted(PLUGIN_PATH_FIELDS & set(data)):
+        value = data[field]
+        values = [value] if isinstance(value, str) else value
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            warnings.append(f'{ctx}: "{field}" must be a path or an array of paths')
+            continue
+        for v in values:
+            warnings.extend(_check_relative_path(v, plugin_root, f"{ctx} {field}"))
+
+    for field in sorted(PLUGIN_CONFIG_FIELDS & set(data)):
+        value = data[field]
+        if isinstance(value, str):
+            warnings.extend(_check_relative_path(value, plugin_root, f"{ctx} {field}"))
+        elif not isinstance(value, (dict, list)):
+            warnings.append(f'{ctx}: "{field}" must be a path or an inline configuration')
+
+    if "userConfig" in data and not isinstance(data["userConfig"], dict):
+        warnings.append(f'{ctx}: "userConfig" must be an object')
+
+    return warnings
+
+
+def check_marketplace_json(path: Path) -> list[str]:
+    """Validate a .claude-plugin/marketplace.json catalog."""
+    warnings: list[str] = []
+    data = _load_object(path, warnings)
+    if data is None:
+        return warnings
+    ctx = "marketplace.json"
+    market_root = path.parent.parent
+
+    for field in schema.extra_fields("marketplace.json", data):
+        warnings.append(f'{ctx}: unknown field "{field}"')
+
+    warnings.extend(_check_name(data, ctx))
+
+    owner = data.get("owner")
+    if owner is None:
+        warnings.append(f'{ctx}: missing required field "owner"')
+    elif not isinstance(owner, dict) or not isinstance(owner.get("name"), str) or not owner["name"]:
+        warnings.append(f'{ctx}: owner must be an object with a "name" string')
+
+    metadata = data.get("metadata")
+    plugin_root_prefix = ""
+    if metadata is not None:
+        if not isinstance(metadata, dict):
+            warnings.append(f"{ctx}: metadata must be an object")
+        else:
+            warnings.extend(_check_version(metadata, f"{ctx} metadata"))
+            if isinstance(metadata.get("pluginRoot"), str):
+                plugin_root_prefix = metadata["pluginRoot"]
+
+    plugins = data.get("plugins")
+    if plugins is None:
+        warnings.append(f'{ctx}: missing required field "plugins"')
+        return warnings
+    if not isinstance(plugins, list):
+        warnings.append(f"{ctx}: plugins must be an array")
+        return warnings
+
+    seen: set[str] = set()
+    for i, entry in enumerate(plugins):
+        ectx = f"{ctx} plugins[{i}]"
+        if not isinstance(entry, dict):
+            warnings.append(f"{ectx}: must be an object")
+            continue
+        warnings.extend(_check_name(entry, ectx))
+        warnings.extend(_check_version(entry, ectx))
+        name = entry.get("name")
+        if isinstance(name, str):
+            if name in seen:
+                warnings.append(f'{ectx}: duplicate plugin name "{name}"')
+            seen.add(name)
+
+        source = entry.get("source")
+        if source is None:
+            warnings.append(f'{ectx}: missing required field "source"')
+        elif isinstance(source, str):
+            base = market_root / plugin_root_prefix if plugin_root_prefix else market_root
+            warnings.extend(_check_relative_path(source, base, f"{ectx} source"))
+        elif isinstance(source, dict):
+            kind = source.get("source")
+            if kind not in MARKETPLACE_PLUGIN_SOURCE_TYPES:
+                warnings.append(
+                    f'{ectx}: source type "{kind}" is invalid '
+                    f'(valid: {", ".join(sorted(MARKETPLACE_PLUGIN_SOURCE_TYPES))})'
+                )
+            elif kind == "github" and not isinstance(source.get("repo"), str):
+                warnings.append(f'{ectx}: github source requires a "repo" string')
+            elif kind in ("url", "git-subdir") and not isinstance(source.get("url"), str):
+                warnings.append(f'{ectx}: {kind} source requires a "url" string')
+        else:
+            warnings.append(f"{ectx}: source must be a path or a source object")
+
+    return warnings
+
+
+def check_plugin_manifest(plugin_dir: Path) -> list[str]:
+    """Validate every manifest in plugin_dir/.claude-plugin/ (library entry point)."""
+    manifest_dir = plugin_dir / ".claude-plugin"
+    warnings: list[str] = []
+    plugin_json = manifest_dir / "plugin.json"
+    marketplace_json = manifest_dir / "marketplace.json"
+    if plugin_json.exists():
+        warnings.extend(check_plugin_json(plugin_json))
+    if marketplace_json.exists():
+        warnings.extend(check_marketplace_json(marketplace_json))
+    if not plugin_json.exists() and not marketplace_json.exists():
+        warnings.append(".claude-plugin/: no plugin.json or marketplace.json found")
+    return warnings
@@ -0,0 +1,315 @@
+"""Cost analysis of hook matcher regexes.
+
+Claude Code tests a hook's matcher against the tool name on every tool call,
+so a matcher that backtracks badly slows every action. analyze() reports,
+from the parsed regex alone so that its warnings are the same on every
+machine and can be cached with the file's other results:
+
+- catastrophic backtracking, found statically on the parsed regex (as in
+  safe-regex): an unbounded repeat whose body is itself variable-length
+  (nested quantifiers, "(a+)+"), or holds an alternation whose branches can
+  start with the same character or match nothing ("(a|ab)*")
+- a plain "A|B" alternation equivalent to an anchored regex over a finite
+  set of names. Plain matchers (letters, digits, "_" and "|") are compared
+  by exact name without a regex engine
+
+match_cost_us() measures the match cost per name over TOOL_NAME_CORPUS, the
+built-in tools plus typical MCP tool names. Timings depend on the machine
+and its load, so they are reported by writing-hooks' hook_overhead.py and
+never by the validators. Matchers flagged for backtracking must not be
+timed (they may not finish); timing stops at the first name that takes
+longer than MAX_SAMPLE_US.
+
+Python's re module stands in for the JavaScript engine Claude Code uses;
+the two backtrack alike on the constructs flagged here. Analyses and
+compiled patterns are memoised in-process (lru_cache), not on disk: the
+validator daemon analyses each matcher once across hook calls, one-shot
+runs once per run.
+"""
+
+import re
+import time
+import timeit
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+try:
+    from re import _parser as sre_parse   # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+from .constants import CLAUDE_CODE_TOOLS
+
+MAX_COST_US = 20.0        # per tool name; simple matchers take well under 1 µs
+MAX_SAMPLE_US = 10_000    # one name this slow ends the timing
+MAX_ALTERNATIVES = 32     # largest finite expansion offered as a plain alternation
+TOOL_NAME_CORPUS = sorted(CLAUDE_CODE_TOOLS) + [
+    "mcp__github__create_pull_request",
+    "mcp__github__get_file_contents",
+    "mcp__filesystem__read_file",
+    "mcp__filesystem__write_file",
+    "mcp__playwright__browser_navigate",
+    "mcp__plugin_rcc_memory__search_nodes",
+]
+
+PLAIN_MATCHER = re.compile(r"^[A-Za-z0-9_|]+$")
+
+_ASCII = (1 << 128) - 1
+_OTHER = 1 << 128          # any non-ASCII character
+_ALL = _ASCII | _OTHER
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT}
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: str.isdigit,
+    sre_parse.CATEGORY_SPACE: str.isspace,
+    sre_parse.CATEGORY_WORD: lambda c: c.isalnum() or c == "_",
+}
+
+
+@dataclass(frozen=True)
+class MatcherAnalysis:
+    backtracking: Optional[str]     # why the regex can backtrack catastrophically
+    alternation: Optional[str]      # equivalent plain "A|B" matcher
+
+
+def _char_mask(predicate) -> int:
+    mask = sum(1 << c for c in range(128) if predicate(chr(c)))
+    return mask | _OTHER
+
+
+_CATEGORY_MASKS = {category: _char_mask(test) for category, test in _CATEGORIES.items()}
+
+
+def _bit(code: int) -> int:
+    return 1 << code if code < 128 else _OTHER
+
+
+def _charset(items: list) -> int:
+    mask, negate = 0, False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            mask |= _bit(av)
+        elif op is sre_parse.RANGE:
+            low, high = av
+            mask |= sum(_bit(c) for c in range(low, min(high, 128) + 1)) | (_OTHER if high > 127 else 0)
+        elif op is sre_parse.CATEGORY and av in _CATEGORY_MASKS:
+            mask |= _CATEGORY_MASKS[av]
+        else:   # negated categories, Unicode classes
+            mask |= _ALL
+    return (_ALL & ~mask) | _OTHER if negate else mask
+
+
+def _first(seq) -> tuple[int, bool]:
+    """Characters a sequence can start with, and whether it can match nothing."""
+    chars = 0
+    for op, av in seq:
+        item_chars, nullable = _first_item(op, av)
+        chars |= item_chars
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _first_item(op, av) -> tuple[int, bool]:
+    if op is sre_parse.LITERAL:
+        return _bit(av), False
+    if op is sre_parse.NOT_LITERAL or op is sre_parse.ANY:
+        return _ALL, False
+    if op is sre_parse.IN:
+        return _charset(av), False
+    if op is sre_parse.SUBPATTERN:
+        return _first(av[-1])
+    if op is sre_parse.BRANCH:
+        firsts = [_first(branch) for branch in av[1]]
+        return _union(f[0] for f in firsts), any(f[1] for f in firsts)
+    if op in _REPEATS:
+        chars, nullable = _first(av[2])
+        return chars, nullable or av[0] == 0
+    if op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return 0, True
+    return _ALL, True
+
+
+def _union(masks) -> int:
+    total = 0
+    for mask in masks:
+        total |= mask
+    return total
+
+
+def _ambiguous_branch(seq) -> bool:
+    """Whether seq holds an alternation with overlapping or empty branches."""
+    for op, av in seq:
+        if op is sre_parse.BRANCH:
+            firsts = [_first(branch) for branch in av[1]]
+            if any(nullable for _, nullable in firsts):
+                return True
+            seen = 0
+            for chars, _ in firsts:
+                if chars & seen:
+                    return True
+                seen |= chars
+            if any(_ambiguous_branch(branch) for branch in av[1]):
+                return True
+        elif op is sre_parse.SUBPATTERN and _ambiguous_branch(av[-1]):
+            return True
+        elif op in _REPEATS and _ambiguous_branch(av[2]):
+            return True
+    return False
+
+
+def backtracking_risk(seq) -> Optional[str]:
+    """Describe the first construct of a parsed regex that can backtrack exponentially."""
+    for op, av in seq:
+        if op in _REPEATS:
+            low, high, body = av
+            if high == sre_parse.MAXREPEAT:
+                if any(inner in _REPEATS and inner_av[0] != inner_av[1]
+                       for inner, inner_av in _flatten(body)):
+                    return "nests quantifiers"
+                if _ambiguous_branch(body):
+                    return "repeats an alternation whose branches overlap"
+            risk = backtracking_risk(body)
+        elif op is sre_parse.SUBPATTERN:
+            risk = backtracking_risk(av[-1])
+        elif op is sre_parse.BRANCH:
+            risk = next(filter(None, (backtracking_risk(b) for b in av[1])), None)
+        else:
+            risk = None
+        if risk:
+            return risk
+    return None
+
+
+def _flatten(seq):
+    """Items of seq and of its groups, alternations and repeats."""
+    for op, av in seq:
+        yield op, av
+        if op is sre_parse.SUBPATTERN:
+            yield from _flatten(av[-1])
+        elif op is sre_parse.BRANCH:
+            for branch in av[1]:
+                yield from _flatten(branch)
+        elif op in _REPEATS:
+            yield from _flatten(av[2])
+
+
+def _expand(seq, limit: int = MAX_ALTERNATIVES) -> Optional[list[str]]:
+    """All strings a sequence of literals, classes, groups and alternations matches."""
+    results = [""]
+    for op, av in seq:
+        if op is sre_parse.LITERAL:
+            options = [chr(av)]
+        elif op is sre_parse.IN and all(item_op is sre_parse.LITERAL for item_op, _ in av):
+            options = [chr(c) for _, c in av]
+        elif op is sre_parse.SUBPATTERN and not av[1] & sre_parse.SRE_FLAG_IGNORECASE:
+            options = _expand(av[-1], limit)
+        elif op is sre_parse.BRANCH:
+            options = []
+            for branch in av[1]:
+                expanded = _expand(branch, limit)
+                if expanded is None:
+                    return None
+                options.extend(expanded)
+        elif op in _REPEATS and av[1] <= 4:
+            body = _expand(av[2], limit)
+            if body is None:
+                return None
+            options = []
+            for count in range(av[0], av[1] + 1):
+                combos = [""]
+                for _ in range(count):
+                    combos = [c + b for c in combos for b in body]
+                options.extend(combos)
+        else:
+            return None
+        if options is None or len(results) * len(options) > limit:
+            return None
+        results = [r + o for r in results for o in options]
+    return results
+
+
+def plain_alternation(matcher: str) -> Optional[str]:
+    """The plain "A|B" matcher equivalent to an anchored regex, if there is one."""
+    if PLAIN_MATCHER.match(matcher):
+        return None
+    parsed = sre_parse.parse(matcher)
+    if parsed.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return None
+    seq = list(parsed)
+    ends = {sre_parse.AT_END, sre_parse.AT_END_STRING}
+    if (len(seq) < 2 or seq[0] != (sre_parse.AT, sre_parse.AT_BEGINNING)
+            or seq[-1][0] is not sre_parse.AT or seq[-1][1] not in ends):
+        return None   # unanchored regexes also match names containing the text
+    names = _expand(seq[1:-1])
+    if not names or not all(name and PLAIN_MATCHER.match(name) for name in names):
+        return None
+    return "|".join(dict.fromkeys(names))
+
+
+def matches(matcher: str, value: str) -> bool:
+    """Whether a matcher selects value (a tool name, or the field an event matches on).
+
+    Empty and "*" match everything, plain matchers compare exact names, and
+    anything else is a regex searched in value.
+    """
+    if not matcher or matcher == "*":
+        return True
+    if PLAIN_MATCHER.match(matcher):
+        return value in matcher.split("|")
+    try:
+        return compile_matcher(matcher).search(value) is not None
+    except re.error:
+        return False
+
+
+@lru_cache(maxsize=None)
+def compile_matcher(matcher: str) -> re.Pattern:
+    return re.compile(matcher)
+
+
+def match_cost_us(matcher: str, corpus: tuple[str, ...] = tuple(TOOL_NAME_CORPUS)) -> float:
+    """Mean time in µs to test one name, best of three rounds.
+
+    A first pass times each name once; a name slower than MAX_SAMPLE_US
+    returns its time right away instead of running the rounds.
+    """
+    search = compile_matcher(matcher).search
+    for name in corpus:
+        start = time.perf_counter()
+        search(name)
+        sample_us = (time.perf_counter() - start) * 1e6
+        if sample_us > MAX_SAMPLE_US:
+            return sample_us
+    loops = 20
+
+    def round_() -> None:
+        for name in corpus:
+            search(name)
+
+    best = min(timeit.repeat(round_, number=loops, repeat=3))
+    return best / (loops * len(corpus)) * 1e6
+
+
+@lru_cache(maxsize=1024)
+def analyze(matcher: str) -> MatcherAnalysis:
+    """Analyse a matcher that compiles; raises re.error otherwise."""
+    return MatcherAnalysis(
+        backtracking=backtracking_risk(sre_parse.parse(matcher)),
+        alternation=plain_alternation(matcher),
+    )
+
+
+def matcher_warnings(matcher: str, matcher_context: str) -> list[str]:
+    """Warnings for a compiled matcher, from its structure only."""
+    analysis = analyze(matcher)
+    warnings: list[str] = []
+    if analysis.backtracking:
+        warnings.append(f"{matcher_context}: matcher '{matcher}' {analysis.backtracking} "
+                        f"and can backtrack catastrophically")
+    if analysis.alternation:
+        warnings.append(f"{matcher_context}: matcher '{matcher}' can be the plain alternation "
+                        f"'{analysis.alternation}', matched by exact name without a regex")
+    return warnings
@@ -0,0 +1,228 @@
+"""Per-phase timing of hook invocations, kept in a bounded ring buffer.
+
+Every validate_frontmatter.py call (and every payload the validator daemon
+serves) is one invocation. Its spans add up the wall time spent in each
+phase: imports, the daemon round trip, discovery, the link graph, reading
+files, the orphan scan, each validator ("validator:<name>"), the dependent
+skill re-checks, saving caches and `claude plugin validate`. Spans are
+inclusive, so "validator:skill_md" contains the "read" and "orphans" time
+it caused; the same phase entered twice in one invocation adds up.
+
+Outside `with metrics.invocation(...)` span() and timed() do nothing but
+test a global, so the validators cost the same when run from validate_all
+or tests. Recording is on by default and off with RCC_METRICS=0.
+
+Records live in .rcc/metrics/spans.ring: a fixed header followed by
+CAPACITY slots of SLOT_SIZE bytes, each a space-padded JSON line. Record n
+goes to slot n % CAPACITY, so the file never grows past its first fill and
+an append is one locked read and two small writes. `hook_metrics.py
+summary` reports percentiles per phase and per validator.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator, Optional, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are rare enough to go unlocked
+    fcntl = None
+
+METRICS_ENV = "RCC_METRICS"
+METRICS_DIR = "metrics"
+RING_NAME = "spans.ring"
+RING_VERSION = 1
+CAPACITY = 500
+SLOT_SIZE = 512
+HEADER_SIZE = 64
+VALIDATOR_PREFIX = "validator:"
+
+F = TypeVar("F", bound=Callable)
+
+
+def enabled() -> bool:
+    return os.environ.get(METRICS_ENV, "") != "0"
+
+
+def metrics_dir(cwd: Path) -> Path:
+    return cwd / ".rcc" / METRICS_DIR
+
+
+def ring_path(cwd: Path) -> Path:
+    return metrics_dir(cwd) / RING_NAME
+
+
+class Recorder:
+    """Spans of one invocation: phase -> seconds, summed over its entries."""
+
+    __slots__ = ("entry", "started", "spans", "meta")
+
+    def __init__(self, entry: str, started: Optional[float] = None) -> None:
+        self.entry = entry
+        self.started = time.perf_counter() if started is None else started
+        self.spans: dict[str, float] = {}
+        self.meta: dict[str, str] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    def as_record(self) -> dict:
+        return {
+            "t": round(time.time(), 3),
+            "entry": self.entry,
+            **self.meta,
+            "total_us": round((time.perf_counter() - self.started) * 1e6),
+            "spans": {name: round(seconds * 1e6) for name, seconds in self.spans.items()},
+        }
+
+
+_active: Optional[Recorder] = None
+
+
+@contextmanager
+def invocation(cwd: Path, entry: str, started: Optional[float] = None) -> Iterator[Optional[Recorder]]:
+    """Record the spans of the block as one invocation of entry under cwd.
+
+    started (a perf_counter value) backdates the total, e.g. to before the
+    imports. Nested invocations (the in-process fallback inside a hook call)
+    add to the outer one.
+    """
+    global _active
+    if _active is not None or not enabled():
+        yield _active
+        return
+    _active = Recorder(entry, started)
+    try:
+        yield _active
+    finally:
+        recorder, _active = _active, None
+        append(cwd, recorder.as_record())
+
+
+def annotate(**meta: str) -> None:
+    """Attach short labels (e.g. the tool name) to the current invocation."""
+    if _active is not None:
+        _active.meta.update(meta)
+
+
+def add(name: str, seconds: float) -> None:
+    """Add a duration measured elsewhere (e.g. import time) to phase name."""
+    if _active is not None:
+        _active.add(name, seconds)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    recorder = _active
+    if recorder is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, time.perf_counter() - start)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator: time every call of the function as phase name."""
+    def decorate(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _active
+            if recorder is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.add(name, time.perf_counter() - start)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def _header(next_seq: int) -> bytes:
+    text = f"rcc-metrics {RING_VERSION} {CAPACITY} {SLOT_SIZE} {next_seq}"
+    return text.encode("ascii").ljust(HEADER_SIZE - 1) + b"\n"
+
+
+def _next_seq(header: bytes) -> Optional[int]:
+    """Sequence number stored in a header of this layout, else None."""
+    parts = header.split()
+    if len(parts) != 5 or parts[:4] != _header(0).split()[:4]:
+        return None
+    try:
+        return int(parts[4])
+    except ValueError:
+        return None
+
+
+def _encode(record: dict) -> bytes:
+    """record as one slot; the smallest spans are dropped until it fits."""
+    spans = dict(record["spans"])
+    while True:
+        line = json.dumps({**record, "spans": spans}, separators=(",", ":")).encode("utf-8")
+        if len(line) < SLOT_SIZE or not spans:
+            return line[:SLOT_SIZE - 1].ljust(SLOT_SIZE - 1) + b"\n"
+        del spans[min(spans, key=spans.__getitem__)]
+
+
+def append(cwd: Path, record: dict) -> None:
+    """Write record into the next slot of the project's ring; never raises."""
+    try:
+        directory = metrics_dir(cwd)
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / ".gitignore").write_text("*\n", encoding="utf-8")
+        fd = os.open(ring_path(cwd), os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        return
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        seq = _next_seq(os.pread(fd, HEADER_SIZE, 0))
+        if seq is None:  # new file or another layout: start over
+            os.ftruncate(fd, 0)
+            seq = 0
+        record = {"seq": seq, **record}
+        os.pwrite(fd, _encode(record), HEADER_SIZE + (seq % CAPACITY) * SLOT_SIZE)
+        os.pwrite(fd, _header(seq + 1), 0)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def load(cwd: Path, last: Optional[int] = None) -> list[dict]:
+    """Stored records, oldest first; only the last ones when last is given."""
+    try:
+        data = ring_path(cwd).read_bytes()
+    except OSError:
+        return []
+    if _next_seq(data[:HEADER_SIZE]) is None:
+        return []
+    records = []
+    for offset in range(HEADER_SIZE, len(data), SLOT_SIZE):
+        line = data[offset:offset + SLOT_SIZE].strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # torn or truncated slot
+        if isinstance(record, dict) and isinstance(record.get("spans"), dict):
+            records.append(record)
+    records.sort(key=lambda r: r.get("seq", 0))
+    return records[-last:] if last else records
+
+
+def clear(cwd: Path) -> bool:
+    try:
+        ring_path(cwd).unlink()
+    except OSError:
+        return False
+    return True
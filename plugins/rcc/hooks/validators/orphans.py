@@ -0,0 +1,152 @@
+"""Indexed orphan-file detection for skill directories.
+
+A file in a skill dir is referenced when its relative path appears in a
+markdown link, or when its relative path or filename occurs anywhere in
+SKILL.md. Checking each file with `in text` costs O(files × text); here all
+names go into one Aho-Corasick automaton that finds every occurring name in a
+single pass over the text.
+
+Both expensive inputs are cached in-process (so the validator daemon and
+validate_all reuse them): directory listings are kept per directory and
+re-read only when that directory's mtime moves, and automata are kept per
+distinct listing, since SKILL.md text changes far more often than the files
+next to it.
+"""
+
+import os
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+
+from . import metrics
+
+# Listings younger than this may miss same-tick changes on coarse-mtime
+# filesystems, so they are not trusted from cache (cf. git's "racy" entries).
+RACY_SECONDS = 2.0
+MAX_MATCHERS = 64
+
+
+class PatternMatcher:
+    """Aho-Corasick automaton reporting which patterns occur in a text."""
+
+    def __init__(self, patterns: list[str]) -> None:
+        self.patterns = [p for p in dict.fromkeys(patterns) if p]
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[list[int]] = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(idx)
+
+        # Breadth-first failure links; dict_link jumps to the nearest
+        # suffix state that completes a pattern.
+        self._fail = [0] * len(self._goto)
+        self._dict_link = [-1] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                fail = self._fail[nxt]
+                self._dict_link[nxt] = fail if self._out[fail] else self._dict_link[fail]
+
+    def find_all(self, text: str) -> set[str]:
+        """Return the set of patterns occurring in text, in O(len(text) + states)."""
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        found: set[int] = set()
+        seen_states: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            # Each state's output chain needs walking only once per text.
+            s = state if out[state] else dict_link[state]
+            while s > 0 and s not in seen_states:
+                seen_states.add(s)
+                found.update(out[s])
+                s = dict_link[s]
+        return {self.patterns[i] for i in found}
+
+
+_listings: dict[str, tuple[int, list[str], list[str]]] = {}
+_matchers: "OrderedDict[tuple[str, ...], PatternMatcher]" = OrderedDict()
+
+
+def _list_dir(directory: str) -> tuple[list[str], list[str]]:
+    """Return (files, subdirs) of one directory, cached by its mtime."""
+    mtime = os.stat(directory).st_mtime_ns
+    cached = _listings.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    files: list[str] = []
+    subdirs: list[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+            else:
+                files.append(entry.name)
+    files.sort()
+    subdirs.sort()
+    if time.time() - mtime / 1e9 > RACY_SECONDS:
+        _listings[directory] = (mtime, files, subdirs)
+    return files, subdirs
+
+
+def list_files(root: Path) -> list[str]:
+    """Return every file under root as a "/"-separated relative path."""
+    result: list[str] = []
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        files, subdirs = _list_dir(os.path.join(root, rel_dir) if rel_dir else str(root))
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        result.extend(prefix + name for name in files)
+        stack.extend(prefix + name for name in reversed(subdirs))
+    return result
+
+
+def matcher_for(rel_paths: list[str]) -> PatternMatcher:
+    """Return the (cached) automaton over the paths and basenames of a listing."""
+    key = tuple(rel_paths)
+    matcher = _matchers.get(key)
+    if matcher is None:
+        patterns: list[str] = []
+        for rel in rel_paths:
+            patterns.append(rel)
+            patterns.append(rel.rsplit("/", 1)[-1])
+        matcher = PatternMatcher(patterns)
+        _matchers[key] = matcher
+        while len(_matchers) > MAX_MATCHERS:
+            _matchers.popitem(last=False)
+    else:
+        _matchers.move_to_end(key)
+    return matcher
+
+
+@metrics.timed("orphans")
+def find_orphans(skill_md: Path, text: str, links: list[str]) -> list[str]:
+    """Return relative paths of files in skill_md's dir that SKILL.md never references."""
+    skill_dir = skill_md.parent
+    rel_paths = [rel for rel in list_files(skill_dir) if rel != skill_md.name]
+    if not rel_paths:
+        return []
+    linked = {str(Path(link)).replace("\\", "/") for link in links}
+    mentioned = matcher_for(rel_paths).find_all(text)
+    return [
+        rel for rel in rel_paths
+        if rel not in linked and rel not in mentioned and rel.rsplit("/", 1)[-1] not in mentioned
+    ]
@@ -0,0 +1,90 @@
+"""Skill trigger-overlap detection that scales to thousands of skills.
+
+Two skills overlap when their descriptions share more than OVERLAP_THRESHOLD
+of the smaller trigger-word set (overlap coefficient |A ∩ B| / min(|A|, |B|)).
+Comparing every pair is O(n²); here candidate pairs come from an inverted
+index with prefix filtering (the AllPairs scheme), and only those are scored:
+
+- words are ordered by document frequency, rarest first
+- descriptions are processed by increasing word count; each is compared with
+  the earlier (smaller) descriptions that index one of its words
+- a description indexes only its prefix: its len - floor(t * len) rarest
+  words. Two sets overlapping by more than t * |B| words (B the smaller)
+  share a word that lies in B's prefix and within the first
+  |A| - floor(t * |B|) words of A: their rarest common word. So A probes
+  with each word only the indexed sets small enough for that word's rank
+
+Prefixes hold rare words, so posting lists stay short and the work grows
+close to linearly with the number of skills. The result is exact: the same
+pairs as the pairwise comparison.
+"""
+
+import math
+from bisect import bisect_right
+from collections import Counter
+from typing import Iterable, Optional
+
+OVERLAP_THRESHOLD = 0.7
+STOPWORDS = frozenset({"use", "when", "the", "a", "an", "or", "and", "to", "is", "for", "in", "of"})
+
+
+def trigger_words(description: str) -> frozenset[str]:
+    """Return the words of a description that can trigger a skill."""
+    return frozenset(description.lower().split()) - STOPWORDS
+
+
+def overlap_ratio(words_a: frozenset[str], words_b: frozenset[str]) -> float:
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / min(len(words_a), len(words_b))
+
+
+def _min_overlap_floor(size: int, threshold: float) -> int:
+    # floor(threshold * size), rounded down on float error so prefixes only
+    # get longer: a smaller set of this size needs more shared words than this.
+    return max(math.floor(threshold * size - 1e-9), 0)
+
+
+def find_overlaps(entries: Iterable[tuple[str, str]], threshold: float = OVERLAP_THRESHOLD,
+                  stats: Optional[dict[str, int]] = None) -> list[tuple[str, str, float]]:
+    """Return (name_a, name_b, ratio) for every pair of descriptions above threshold.
+
+    entries are (name, description); pairs keep the input order of their
+    names and are sorted by it. stats, when given, receives the number of
+    candidate pairs scored.
+    """
+    entries = list(entries)
+    words = [trigger_words(description) for _, description in entries]
+    frequency = Counter(w for ws in words for w in ws)
+    order = sorted((i for i, ws in enumerate(words) if ws), key=lambda i: (len(words[i]), i))
+
+    # word -> ids of earlier descriptions with the word in their prefix, and
+    # their floor values; both ascending since descriptions come by size
+    postings: dict[str, tuple[list[int], list[int]]] = {}
+    found: list[tuple[int, int, float]] = []
+    scored = 0
+    for i in order:
+        ranked = sorted(words[i], key=lambda w: (frequency[w], w))
+        size = len(ranked)
+        candidates: set[int] = set()
+        for position, word in enumerate(ranked):
+            posting = postings.get(word)
+            if posting is not None:
+                # the shared word must also lie in this description's prefix
+                # for that candidate: position < size - floor(t * |candidate|)
+                ids, floors = posting
+                candidates.update(ids[:bisect_right(floors, size - position - 1)])
+        scored += len(candidates)
+        for j in candidates:
+            ratio = overlap_ratio(words[i], words[j])
+            if ratio > threshold:
+                found.append((min(i, j), max(i, j), ratio))
+        floor = _min_overlap_floor(size, threshold)
+        for word in ranked[:size - floor]:
+            ids, floors = postings.setdefault(word, ([], []))
+            ids.append(i)
+            floors.append(floor)
+
+    if stats is not None:
+        stats["candidates"] = scored
+    return [(entries[i][0], entries[j][0], ratio) for i, j, ratio in sorted(found)]
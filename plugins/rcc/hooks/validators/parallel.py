@@ -0,0 +1,111 @@
+"""Run a batch of validator checks, optionally fanned out over worker processes.
+
+Used by validate_all. Each task is (check, path, cacheable):
+
+- cacheable checks are answered from validators.result_cache in the parent
+  when possible; only misses are sent to the process pool
+- the remaining file checks also run in the pool; they are pure functions of
+  the path, so only the path and the returned warnings cross processes
+- subprocess-based checks (`claude plugin validate`) run on a thread pool of
+  the same size, which bounds how many CLI processes are alive at once
+
+A path's result is complete once all of its checks returned; on_result is
+called then, in completion order, after its check time (seconds, summed over
+its checks, measured where they ran) was stored in timings. The returned
+dict is always in task order, so callers produce the same output whatever
+the job count.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import result_cache
+from .agent_validator import check_agent_md
+from .manifest_validator import check_marketplace_json, check_plugin_json
+from .rules_validator import check_rules_md
+from .skill_validator import check_skill_md
+
+Check = Callable[[Path], list[str]]
+Task = tuple[Check, Path, bool]
+
+# Checks a worker process can run, looked up by name (functions are not sent).
+CHECKS: dict[str, Check] = {
+    f.__name__: f
+    for f in (check_skill_md, check_agent_md, check_rules_md, check_plugin_json, check_marketplace_json)
+}
+
+
+def run_check(check_name: str, path: str) -> tuple[list[str], float]:
+    """Worker entry point; returns the warnings and the seconds the check took."""
+    return _timed(CHECKS[check_name], Path(path))
+
+
+def _timed(check: Check, arg: Path) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    warnings = check(arg)
+    return warnings, time.perf_counter() - start
+
+
+def run_checks(tasks: list[Task], cwd: Optional[Path] = None, jobs: int = 1,
+               extra: Optional[dict[Path, tuple[Check, Path]]] = None,
+               on_result: Optional[Callable[[Path, list[str]], None]] = None,
+               timings: Optional[dict[Path, float]] = None) -> dict[Path, list[str]]:
+    """Run every task and return {path: warnings} in task order.
+
+    extra maps a task path to a subprocess-based (check, argument) whose
+    warnings are appended to that path's own.
+    """
+    extra = extra or {}
+    parts: dict[Path, list[Optional[list[str]]]] = {
+        path: [None, None] if path in extra else [None] for _, path, _ in tasks
+    }
+    keys: dict[Path, result_cache.Key] = {}
+    if timings is None:
+        timings = {}
+
+    def finish(path: Path, index: int, warnings: list[str], seconds: float) -> None:
+        slots = parts[path]
+        slots[index] = warnings
+        timings[path] = timings.get(path, 0.0) + seconds
+        if on_result is not None and all(slot is not None for slot in slots):
+            on_result(path, [w for slot in slots for w in slot])
+
+    if jobs <= 1:
+        for check, path, cacheable in tasks:
+            if cacheable:
+                start = time.perf_counter()
+                warnings = result_cache.run_cached(check, path, cwd)
+                finish(path, 0, warnings, time.perf_counter() - start)
+            else:
+                finish(path, 0, *_timed(check, path))
+            if path in extra:
+                extra_check, arg = extra[path]
+                finish(path, 1, *_timed(extra_check, arg))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as procs, ThreadPoolExecutor(max_workers=jobs) as threads:
+            pending: dict[Future, tuple[Path, int]] = {}
+            for check, path, cacheable in tasks:
+                if path in extra:
+                    extra_check, arg = extra[path]
+                    pending[threads.submit(_timed, extra_check, arg)] = (path, 1)
+                if cacheable:
+                    start = time.perf_counter()
+                    key, cached = result_cache.lookup(check, path, cwd)
+                    if cached is not None:
+                        finish(path, 0, cached, time.perf_counter() - start)
+                        continue
+                    if key is not None:
+                        keys[path] = key
+                pending[procs.submit(run_check, check.__name__, str(path))] = (path, 0)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, index = pending.pop(future)
+                    warnings, seconds = future.result()
+                    if index == 0 and path in keys:
+                        result_cache.for_project(cwd).put(keys[path], warnings)
+                    finish(path, index, warnings, seconds)
+
+    return {path: [w for slot in slots for w in slot] for path, slots in parts.items()}
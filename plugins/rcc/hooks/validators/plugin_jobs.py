@@ -0,0 +1,217 @@
+"""Background, debounced `claude plugin validate` runs.
+
+Manifests are validated natively (validators.manifest_validator); the CLI is an
+opt-in cross-check enabled with RCC_PLUGIN_VALIDATE_CLI=1. It takes seconds per
+plugin, so the hook only records a request and returns. One detached worker per plugin waits until edits to that plugin have
+been quiet for DEBOUNCE_SECONDS, runs the check, and writes the result. A burst
+of manifest edits therefore coalesces into a single run.
+
+State lives in .rcc/cache/plugin-validate/, one set of files per plugin:
+
+    <key>.request   touched by the hook on every manifest edit
+    <key>.lock      held (with the worker's pid) while a worker is alive
+    <key>.json      last result: plugin dir, warnings, timestamps, reported flag
+
+The next hook invocation reports unreported results; plugin_validate.py status
+shows them on demand.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from .discovery import cache_dir, ensure_cache_dir
+
+DEBOUNCE_SECONDS = 2.0
+JOBS_DIR = "plugin-validate"
+CLI_ENV = "RCC_PLUGIN_VALIDATE_CLI"
+
+
+def cli_enabled() -> bool:
+    """True when the `claude plugin validate` cross-check is switched on."""
+    return os.environ.get(CLI_ENV, "") == "1"
+
+
+def jobs_dir(cwd: Path) -> Path:
+    return cache_dir(cwd) / JOBS_DIR
+
+
+def job_key(plugin_dir: Path) -> str:
+    return hashlib.sha1(str(plugin_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+
+
+def _job_paths(cwd: Path, plugin_dir: Path) -> tuple[Path, Path, Path]:
+    base = jobs_dir(cwd) / job_key(plugin_dir)
+    return base.with_suffix(".request"), base.with_suffix(".lock"), base.with_suffix(".json")
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists but not ours (PermissionError) or unsupported check
+    return True
+
+
+def is_locked(lock: Path) -> bool:
+    """True if a live worker holds the lock; removes locks left by dead workers."""
+    try:
+        pid = int(lock.read_text(encoding="utf-8").strip() or 0)
+    except (OSError, ValueError):
+        return False
+    if pid and _pid_alive(pid):
+        return True
+    try:
+        lock.unlink()
+    except OSError:
+        pass
+    return False
+
+
+def _acquire(lock: Path) -> bool:
+    for _ in range(2):
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if is_locked(lock):
+                return False
+            continue  # stale lock was removed; retry once
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+
+def _spawn_worker(cwd: Path, plugin_dir: Path) -> None:
+    script = Path(__file__).resolve().parent.parent / "plugin_validate.py"
+    subprocess.Popen(
+        [sys.executable, str(script), "run", str(plugin_dir), "--cwd", str(cwd)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def schedule(cwd: Path, plugin_dir: Path) -> None:
+    """Record a validation request and make sure a worker will pick it up."""
+    ensure_cache_dir(cwd)
+    jobs_dir(cwd).mkdir(exist_ok=True)
+    request, lock, _ = _job_paths(cwd, plugin_dir)
+    request.write_text(str(plugin_dir), encoding="utf-8")
+    os.utime(request)  # same content on repeat edits: bump mtime explicitly
+    if not is_locked(lock):
+        _spawn_worker(cwd, plugin_dir)
+
+
+def run_worker(cwd: Path, plugin_dir: Path, check: Callable[[Path], list[str]],
+               debounce: float = DEBOUNCE_SECONDS) -> bool:
+    """Process requests for plugin_dir until none are outstanding.
+
+    Returns False if another live worker already owns this plugin.
+    """
+    request, lock, result = _job_paths(cwd, plugin_dir)
+    handled = _read_result(result).get("requested_at", 0.0) if result.exists() else 0.0
+    while True:
+        if not _acquire(lock):
+            return False
+        try:
+            while True:
+                requested = _mtime(request)
+                if requested <= handled:
+                    break
+                wait = requested + debounce - time.time()
+                if wait > 0:
+                    time.sleep(wait)
+                    continue  # re-read: more edits may have landed meanwhile
+                warnings = check(plugin_dir)
+                handled = requested
+                _write_result(result, {
+                    "plugin_dir": str(plugin_dir),
+                    "warnings": warnings,
+                    "requested_at": requested,
+                    "finished_at": time.time(),
+                    "reported": False,
+                })
+        finally:
+            try:
+                lock.unlink()
+            except OSError:
+                pass
+        # A request that landed between the last check and the unlock saw the
+        # lock held and did not spawn a worker; pick it up here.
+        if _mtime(request) <= handled:
+            return True
+
+
+def _read_result(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_result(path: Path, data: dict) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def job_status(cwd: Path) -> list[dict]:
+    """Return one record per known plugin with its state and last result."""
+    directory = jobs_dir(cwd)
+    if not directory.is_dir():
+        return []
+    records: list[dict] = []
+    for request in sorted(directory.glob("*.request")):
+        _, lock, result = _job_paths(cwd, Path(request.read_text(encoding="utf-8")))
+        data = _read_result(result)
+        if is_locked(lock):
+            state = "running"
+        elif _mtime(request) > data.get("requested_at", 0.0):
+            state = "pending"
+        else:
+            state = "done"
+        records.append({
+            "plugin_dir": request.read_text(encoding="utf-8"),
+            "state": state,
+            "warnings": data.get("warnings", []),
+            "finished_at": data.get("finished_at"),
+        })
+    return records
+
+
+def collect_unreported(cwd: Path) -> list[tuple[Path, list[str]]]:
+    """Return finished results with warnings not yet shown, marking them reported."""
+    directory = jobs_dir(cwd)
+    if not directory.is_dir():
+        return []
+    reports: list[tuple[Path, list[str]]] = []
+    for result in sorted(directory.glob("*.json")):
+        data = _read_result(result)
+        if not data or data.get("reported", True):
+            continue
+        data["reported"] = True
+        try:
+            _write_result(result, data)
+        except OSError:
+            continue
+        if data.get("warnings"):
+            reports.append((Path(data["plugin_dir"]), list(data["warnings"])))
+    return reports
+
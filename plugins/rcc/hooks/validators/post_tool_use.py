@@ -0,0 +1,175 @@
+"""In-process validation of one PostToolUse payload.
+
+The work behind validate_frontmatter.py: route the edited file to its
+validator, re-check the skills that depend on changed paths and format the
+hook output. Imported only when the validator daemon is not answering (and
+by the daemon itself), so a warm hook call never pays for these imports.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+from . import discovery, documents, linkgraph, metrics, plugin_jobs, result_cache
+from .agent_validator import check_agent_md
+from .config_validator import check_hooks_json, check_settings_json
+from .manifest_validator import check_plugin_manifest
+from .rules_validator import check_rules_md
+from .skill_validator import check_skill_md
+from .utils import extract_markdown_links, parse_frontmatter  # noqa: F401 (re-export)
+
+
+def discover_skill_and_agent_dirs(cwd: Path) -> tuple[list[Path], list[Path]]:
+    """Find valid skill and agent directories from plugin roots and .claude/.
+
+    Served from the persistent index in .rcc/cache/ (see validators.discovery);
+    the project is only re-walked when a manifest or plugin layout changed.
+    """
+    return discovery.discover(cwd)
+
+
+@metrics.timed("plugin-validate")
+def check_plugin_validate(plugin_dir: Path) -> list[str]:
+    """Run `claude plugin validate` on plugin_dir (the dir containing .claude-plugin/).
+
+    Optional cross-check only; check_plugin_manifest covers the same rules in-process.
+    """
+    try:
+        result = subprocess.run(
+            ["claude", "plugin", "validate", str(plugin_dir)],
+            capture_output=True, text=True, timeout=30
+        )
+        output = ((result.stdout or "") + (result.stderr or "")).strip()
+        if result.returncode != 0 and output:
+            return [f"plugin validate: {line}" for line in output.splitlines() if line.strip()]
+    except FileNotFoundError:
+        pass  # claude CLI not available
+    except Exception as e:
+        return [f"plugin validate failed: {e}"]
+    return []
+
+
+def validator_phase(check) -> str:
+    """Metrics phase of a check function: check_skill_md -> "validator:skill_md"."""
+    return metrics.VALIDATOR_PREFIX + check.__name__.removeprefix("check_")
+
+
+@documents.run()
+def handle_payload(data: dict) -> dict | None:
+    """Validate the file named in a PostToolUse payload.
+
+    Edit/Write payloads check the edited file; Bash payloads that remove or
+    move files only re-check the skills referencing those paths.
+    Returns the hook output object, or None when there is nothing to report.
+    Shared by the in-process path and the validator daemon.
+    """
+    tool_input = data.get("tool_input", {})
+    cwd_str = data.get("cwd", "")
+    cwd = Path(cwd_str) if cwd_str else Path.cwd()
+    metrics.annotate(tool=str(data.get("tool_name", "")))
+
+    path: Path | None = None
+    if data.get("tool_name") == "Bash":
+        changed = linkgraph.command_paths(tool_input.get("command", ""), cwd)
+        if not changed:
+            return None
+    else:
+        file_path_str = tool_input.get("file_path", "")
+        if not file_path_str:
+            return None
+        path = Path(file_path_str)
+        if not path.is_absolute():
+            path = cwd / path
+        if not path.exists():
+            return None
+        changed = [path]
+
+    if any(p.name == "plugin.json" and p.parent.name == ".claude-plugin" for p in changed):
+        discovery.invalidate(cwd)  # a new or edited manifest may move skills/agents
+
+    with metrics.span("discovery"):
+        skill_dirs, agent_dirs = discover_skill_and_agent_dirs(cwd)
+    rules_dir = cwd / ".claude" / "rules"
+    with metrics.span("linkgraph"):
+        graph = linkgraph.for_project(cwd, skill_dirs)
+    warnings: list[str] = []
+
+    # Route to appropriate validator based on file type and location
+    check = None
+    if path is None:
+        pass  # Bash: nothing was edited in place
+    elif path.parent.name == ".claude-plugin" and path.suffix == ".json":
+        # .claude-plugin/ JSON files → native manifest checks on parent dir;
+        # the optional CLI cross-check runs debounced in the background and
+        # is reported by a later invocation
+        with metrics.span(metrics.VALIDATOR_PREFIX + "plugin_manifest"):
+            warnings = check_plugin_manifest(path.parent.parent)
+        if plugin_jobs.cli_enabled():
+            with metrics.span("plugin-jobs"):
+                plugin_jobs.schedule(cwd, path.parent.parent)
+    elif path.name == "SKILL.md" and any(path.is_relative_to(sd) for sd in skill_dirs):
+        # SKILL.md files in skill directories
+        check = check_skill_md
+        graph.refresh(path)
+    elif path.suffix == ".md" and any(path.is_relative_to(ad) for ad in agent_dirs):
+        # Agent .md files in agent directories
+        check = check_agent_md
+    elif path.suffix == ".md" and rules_dir.exists() and path.is_relative_to(rules_dir):
+        # Rule .md files in .claude/rules/
+        check = check_rules_md
+    elif path.name == "settings.json" and path.parent.name == ".claude":
+        # .claude/settings.json validation
+        check = check_settings_json
+    elif path.name == "hooks.json" and path.parent.name == "hooks":
+        # Plugin hooks/hooks.json validation
+        check = check_hooks_json
+
+    if check is not None:
+        # Unchanged content and surroundings → cached warnings (validators.result_cache)
+        with metrics.span(validator_phase(check)):
+            warnings = result_cache.run_cached(check, path, cwd)
+
+    reports = [(path, warnings)] if warnings else []
+    # Skills linking to, mentioning or containing a changed path
+    # (validators.linkgraph); a still-valid cached result means the change
+    # did not affect that skill, so it stays silent.
+    with metrics.span("dependents"):
+        for skill_md in linkgraph.affected_skills(graph, changed, skill_dirs):
+            with metrics.span(validator_phase(check_skill_md)):
+                skill_warnings = result_cache.run_if_changed(check_skill_md, skill_md, cwd)
+            if skill_warnings is not None:
+                graph.refresh(skill_md)  # new files may now be mentioned
+                if skill_warnings:
+                    reports.append((skill_md, skill_warnings))
+    with metrics.span("save"):
+        result_cache.for_project(cwd).save()
+        graph.save()
+
+    with metrics.span("plugin-jobs"):
+        for plugin_dir, plugin_warnings in plugin_jobs.collect_unreported(cwd):
+            reports.append((plugin_dir / ".claude-plugin" / "plugin.json", plugin_warnings))
+    if not reports:
+        return None
+
+    sections: list[str] = []
+    for report_path, report_warnings in reports:
+        rel = report_path.relative_to(cwd) if report_path.is_relative_to(cwd) else report_path
+        lines = "\n".join(f"  - {w}" for w in report_warnings)
+        sections.append(f"⚠ validate-frontmatter [{rel}]:\n{lines}")
+    msg = "\n".join(sections)
+    return {
+        "hookSpecificOutput": {
+            "hookEventName": "PostToolUse",
+            "additionalContext": msg,
+        },
+        "systemMessage": msg,
+    }
+
+
+def render_output(data: dict) -> str:
+    """Return the hook's stdout text for a payload ("" when silent)."""
+    try:
+        output = handle_payload(data)
+    except Exception:
+        return ""  # never block Claude on validator errors (file may be mid-edit)
+    return json.dumps(output) if output else ""
@@ -0,0 +1,215 @@
+"""On-demand cProfile capture for the validator entry points.
+
+Off unless RCC_PROFILE=1 is set or the script's --profile flag is given.
+validate_frontmatter.py (env only, it reads a hook payload), the validator
+daemon (per request), validate_all.py, plugin_validate.py, validate_plugin.py
+and validate_skill.py each profile one run as an entry:
+
+    .rcc/profiles/runs/<entry>-<time>-<pid>.prof   raw pstats of each run, the
+                                                   newest MAX_RUNS per entry kept
+    .rcc/profiles/<entry>.collapsed                stacks of all kept runs, in
+                                                   the collapsed format of
+                                                   flamegraph.pl / speedscope
+    .rcc/profiles/<entry>.top.txt                  the TOP_N functions by own time
+
+Both exports are rewritten after every profiled run; `profile_report.py
+report` rebuilds them with another N. Only the thread that started the run
+is profiled, so worker processes and threads (--jobs) are not included.
+
+cProfile keeps caller -> callee edges rather than whole stacks, so the
+collapsed stacks are rebuilt from the call graph: a function's own time is
+split over its callers in proportion to the time each edge accounts for.
+Each function's paths are computed once, recursive edges are cut and paths
+below MIN_SHARE of a function's time are dropped.
+"""
+
+import atexit
+import cProfile
+import io
+import os
+import pstats
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+PROFILE_ENV = "RCC_PROFILE"
+PROFILES_DIR = "profiles"
+RUNS_DIR = "runs"
+MAX_RUNS = 50
+TOP_N = 30
+MAX_DEPTH = 64
+MIN_SHARE = 0.001
+
+Func = tuple[str, int, str]   # pstats key: (file, line, function)
+
+_active: Optional[cProfile.Profile] = None
+
+
+def enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "") == "1"
+
+
+def profiles_dir(cwd: Path) -> Path:
+    return cwd / ".rcc" / PROFILES_DIR
+
+
+def _ensure_dirs(cwd: Path) -> Path:
+    runs = profiles_dir(cwd) / RUNS_DIR
+    runs.mkdir(parents=True, exist_ok=True)
+    ignore = profiles_dir(cwd) / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding="utf-8")
+    return runs
+
+
+def run_files(cwd: Path, entry: str) -> list[Path]:
+    """Stored runs of entry, oldest first."""
+    runs = profiles_dir(cwd) / RUNS_DIR
+    return sorted(runs.glob(f"{entry}-[0-9]*-[0-9]*.prof"), key=lambda p: p.stat().st_mtime_ns) if runs.is_dir() else []
+
+
+def entries(cwd: Path) -> list[str]:
+    runs = profiles_dir(cwd) / RUNS_DIR
+    names = {p.name.rsplit("-", 2)[0] for p in runs.glob("*.prof")} if runs.is_dir() else set()
+    return sorted(names)
+
+
+def save_run(cwd: Path, entry: str, profile: cProfile.Profile) -> Path:
+    """Store one run's stats and drop the oldest beyond MAX_RUNS."""
+    path = _ensure_dirs(cwd) / f"{entry}-{time.time_ns()}-{os.getpid()}.prof"
+    profile.dump_stats(path)
+    for old in run_files(cwd, entry)[:-MAX_RUNS]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def aggregate(paths: list[Path]) -> Optional[pstats.Stats]:
+    """Stats summed over runs; unreadable run files are skipped."""
+    stats: Optional[pstats.Stats] = None
+    for path in paths:
+        try:
+            if stats is None:
+                stats = pstats.Stats(str(path), stream=io.StringIO())
+            else:
+                stats.add(str(path))
+        except (OSError, EOFError, ValueError, TypeError):
+            continue
+    return stats
+
+
+def frame_name(func: Func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name  # built-in, e.g. "<method 'read' of '_io.BufferedReader' objects>"
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, int]:
+    """"frame;frame;frame" -> microseconds of own time, rebuilt from the call graph."""
+    raw = stats.stats  # func -> (cc, nc, tottime, cumtime, {caller: edge})
+    memo: dict[Func, list[tuple[tuple[Func, ...], float]]] = {}
+
+    def paths(func: Func, visiting: frozenset) -> list[tuple[tuple[Func, ...], float]]:
+        if func in memo:
+            return memo[func]
+        callers = {c: edge[3] for c, edge in raw[func][4].items() if c in raw and c != func}
+        total = sum(callers.values())
+        live = [c for c in callers if c not in visiting]
+        if total <= 0 or len(visiting) >= MAX_DEPTH:
+            found = [((func,), 1.0)]   # a root, or too deep to follow
+        else:
+            found = []
+            for caller in live:
+                share = callers[caller] / total
+                for stack, weight in paths(caller, visiting | {func}):
+                    if weight * share >= MIN_SHARE:
+                        found.append((stack + (func,), weight * share))
+        if len(live) == len(callers):
+            memo[func] = found   # not cut short by a cycle, so the same from any route
+        return found
+
+    stacks: dict[str, int] = {}
+    for func, (_, _, tottime, _, _) in raw.items():
+        if tottime <= 0:
+            continue
+        found = paths(func, frozenset())
+        kept = sum(weight for _, weight in found) or 1.0   # share lost to cut and dropped paths
+        for stack, weight in found or [((func,), 1.0)]:
+            us = round(tottime * weight / kept * 1e6)
+            if us:
+                key = ";".join(frame_name(f) for f in stack)
+                stacks[key] = stacks.get(key, 0) + us
+    return stacks
+
+
+def top_table(stats: pstats.Stats, runs: int, top: int = TOP_N) -> str:
+    out = io.StringIO()
+    stats.stream = out
+    print(f"{runs} run(s), top {top} functions by own time", file=out)
+    stats.sort_stats(pstats.SortKey.TIME, pstats.SortKey.CUMULATIVE).print_stats(top)
+    return out.getvalue()
+
+
+def export(cwd: Path, entry: str, top: int = TOP_N) -> Optional[tuple[Path, Path]]:
+    """Write <entry>.collapsed and <entry>.top.txt from the stored runs."""
+    files = run_files(cwd, entry)
+    stats = aggregate(files)
+    if stats is None:
+        return None
+    directory = profiles_dir(cwd)
+    collapsed = directory / f"{entry}.collapsed"
+    table = directory / f"{entry}.top.txt"
+    lines = [f"{stack} {us}" for stack, us in sorted(collapsed_stacks(stats).items())]
+    collapsed.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    table.write_text(top_table(stats, len(files), top), encoding="utf-8")
+    return collapsed, table
+
+
+def _finish(cwd: Path, entry: str, profile: cProfile.Profile) -> None:
+    """Store and export a run; profiling must never fail the validator."""
+    try:
+        save_run(cwd, entry, profile)
+        export(cwd, entry)
+    except OSError:
+        pass
+
+
+@contextmanager
+def session(cwd: Path, entry: str, force: bool = False) -> Iterator[Optional[cProfile.Profile]]:
+    """Profile the block as one run of entry when profiling is on.
+
+    Nested sessions belong to the outer one.
+    """
+    global _active
+    if _active is not None or not (force or enabled()):
+        yield None
+        return
+    _active = cProfile.Profile()
+    _active.enable()
+    try:
+        yield _active
+    finally:
+        profile, _active = _active, None
+        profile.disable()
+        _finish(cwd, entry, profile)
+
+
+def start(cwd: Path, entry: str, force: bool = False) -> None:
+    """Profile the rest of the process as one run of entry (until exit).
+
+    For script main()s that leave through sys.exit from several places.
+    """
+    global _active
+    if _active is not None or not (force or enabled()):
+        return
+    profile = _active = cProfile.Profile()
+
+    def stop() -> None:
+        global _active
+        profile.disable()
+        _active = None
+        _finish(cwd, entry, profile)
+
+    atexit.register(stop)
+    profile.enable()
@@ -0,0 +1,271 @@
+"""Content-hash result cache for the check_* validators.
+
+A check's warnings are a pure function of the file's bytes, the validator code
+and — for some checks — what exists around the file. Results are keyed by all
+three, so repeated Edits that leave a file's content and surroundings unchanged
+return the cached warnings without re-running the check:
+
+- content:  sha256 of the file bytes (plus its path, since agent names must
+            match their filename)
+- version:  fingerprint of the validator sources
+- context:  per-check fingerprint; for SKILL.md this is the skill dir listing
+            and the existence of every link target, for manifests the
+            existence of every path field they declare
+
+The cache holds one entry per (check, path), the result for the file's
+latest key, so it grows with the project rather than with the edit history
+and a full validate_all run never evicts what the next run needs. When a
+project dir is known the entries persist to .rcc/cache/results.jsonl, one
+JSON line per entry with later lines winning: a save appends only the
+entries that changed, and once stale lines outnumber live ones the file is
+re-read (picking up what other processes appended), entries of deleted
+files are dropped and it is rewritten compacted. A shared cache with nothing
+left to save reloads the file when another process (validate_all next to the
+daemon) wrote it, and a full rewrite always merges with the file first, so
+neither discards the other's newer results. Concurrent writers can at worst
+lose a line, which is only a cache miss.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import documents
+from .constants import PLUGIN_CONFIG_FIELDS, PLUGIN_PATH_FIELDS
+from .daemon import source_fingerprint
+from .discovery import cache_dir, ensure_cache_dir
+from .orphans import list_files
+
+CACHE_NAME = "results.jsonl"
+CACHE_VERSION = 2
+COMPACT_SLACK = 200   # stale lines tolerated on top of one per live entry
+
+Slot = tuple[str, str]      # (check name, path)
+Key = tuple[str, str, str]  # (check name, path, content key)
+
+_HOOKS_DIR = Path(__file__).resolve().parent.parent
+_version: Optional[str] = None
+
+
+def validator_version() -> str:
+    """Fingerprint of the validator sources, computed once per process."""
+    global _version
+    if _version is None:
+        _version = source_fingerprint(_HOOKS_DIR)
+    return _version
+
+
+def skill_context(path: Path, data: bytes) -> str:
+    """Fingerprint everything check_skill_md looks at besides SKILL.md itself."""
+    skill_dir = path.parent
+    entries = list_files(skill_dir)  # mtime-cached listing shared with orphans.py
+    # Links may escape the skill dir, so the listing alone does not cover them.
+    for link in documents.scan_data(path, data).links:
+        entries.append(f"link:{link}:{int(documents.exists(skill_dir / link))}")
+    return hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def manifest_paths(manifest: object, name: str) -> list[str]:
+    """Path-valued fields manifest_validator checks for existence, relative to their base."""
+    if not isinstance(manifest, dict):
+        return []
+    values: list = []
+    if name == "marketplace.json":
+        metadata = manifest.get("metadata")
+        prefix = metadata.get("pluginRoot") if isinstance(metadata, dict) else None
+        prefix = prefix if isinstance(prefix, str) else ""
+        plugins = manifest.get("plugins")
+        for entry in plugins if isinstance(plugins, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("source"), str):
+                values.append(os.path.join(prefix, entry["source"]) if prefix else entry["source"])
+        return values
+    for field in PLUGIN_PATH_FIELDS | PLUGIN_CONFIG_FIELDS:
+        value = manifest.get(field)
+        values.extend([value] if isinstance(value, str) else value if isinstance(value, list) else [])
+    return [v for v in values if isinstance(v, str)]
+
+
+def manifest_context(path: Path, data: bytes) -> str:
+    """Fingerprint the existence of the paths plugin.json / marketplace.json declare."""
+    try:
+        manifest = json.loads(data)
+    except ValueError:
+        return ""
+    root = path.parent.parent
+    entries = []
+    for value in sorted(set(manifest_paths(manifest, path.name))):
+        if value.startswith("${CLAUDE_PLUGIN_ROOT}"):
+            value = "./" + value[len("${CLAUDE_PLUGIN_ROOT}"):].lstrip("/")
+        entries.append(f"{value}:{int(os.path.exists(root / value))}")
+    return hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+# Checks whose result depends on more than the file content.
+CONTEXT_FINGERPRINTS: dict[str, Callable[[Path, bytes], str]] = {
+    "check_skill_md": skill_context,
+    "check_plugin_json": manifest_context,
+    "check_marketplace_json": manifest_context,
+}
+
+
+def make_key(check_name: str, path: Path, data: bytes) -> Key:
+    """Return the cache key for running check_name on path with content data."""
+    context_fn = CONTEXT_FINGERPRINTS.get(check_name)
+    context = context_fn(path, data) if context_fn else ""
+    h = hashlib.sha256()
+    for part in (check_name, str(path), validator_version(), context):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    h.update(data)
+    return check_name, str(path), h.hexdigest()
+
+
+class ResultCache:
+    """Latest result per (check, path), persisted under cwd when given."""
+
+    def __init__(self, cwd: Optional[Path] = None) -> None:
+        self.cwd = cwd
+        self.path = cache_dir(cwd) / CACHE_NAME if cwd is not None else None
+        self._entries: dict[Slot, tuple[str, list[str]]] = {}
+        self._changed: set[Slot] = set()
+        self._lines = 0   # entry lines in the file as last read or written
+        self._stamp: Optional[tuple[int, int]] = None   # file (mtime, size) as last read or written
+        if self.path is not None:
+            self._load()
+
+    def _file_stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def is_current(self) -> bool:
+        """False when another process wrote the file and this cache has nothing to save."""
+        return self.path is None or bool(self._changed) or self._file_stamp() == self._stamp
+
+    def _read(self) -> tuple[dict[Slot, tuple[str, list[str]]], int]:
+        entries: dict[Slot, tuple[str, list[str]]] = {}
+        lines = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                header = f.readline()
+                if json.loads(header).get("version") != CACHE_VERSION:
+                    return {}, 0
+                for line in f:
+                    try:
+                        check, path, key, warnings = json.loads(line)
+                    except (ValueError, TypeError):
+                        continue   # torn line from an interrupted append
+                    entries[check, path] = (key, warnings)
+                    lines += 1
+        except (OSError, ValueError, AttributeError):
+            return {}, 0
+        return entries, lines
+
+    def _load(self) -> None:
+        self._stamp = self._file_stamp()
+        self._entries, self._lines = self._read()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Key) -> Optional[list[str]]:
+        entry = self._entries.get(key[:2])
+        return entry[1] if entry is not None and entry[0] == key[2] else None
+
+    def put(self, key: Key, warnings: list[str]) -> None:
+        slot = key[:2]
+        self._entries[slot] = (key[2], list(warnings))
+        self._changed.add(slot)
+
+    @staticmethod
+    def _line(slot: Slot, entry: tuple[str, list[str]]) -> str:
+        return json.dumps([*slot, *entry]) + "\n"
+
+    def save(self) -> None:
+        """Append the changed entries, or rewrite the file compacted once it is mostly stale."""
+        if self.path is None or not self._changed:
+            return
+        try:
+            ensure_cache_dir(self.cwd)
+            if self._lines == 0 or self._lines + len(self._changed) > 2 * len(self._entries) + COMPACT_SLACK:
+                self._compact()
+            else:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(self._line(slot, self._entries[slot]) for slot in self._changed))
+                self._lines += len(self._changed)
+            self._stamp = self._file_stamp()
+            self._changed.clear()
+        except OSError:
+            pass
+
+    def _compact(self) -> None:
+        entries, _ = self._read()   # what other processes saved since we loaded
+        entries.update((slot, self._entries[slot]) for slot in self._changed)
+        self._entries = {slot: entry for slot, entry in entries.items() if os.path.exists(slot[1])}
+        self._write(self._entries)
+
+    def _write(self, entries: dict[Slot, tuple[str, list[str]]]) -> None:
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": CACHE_VERSION}) + "\n")
+            f.write("".join(self._line(slot, entry) for slot, entry in entries.items()))
+        os.replace(tmp, self.path)
+        self._lines = len(entries)
+
+
+_caches: dict[Optional[str], ResultCache] = {}
+
+
+def for_project(cwd: Optional[Path]) -> ResultCache:
+    """Return the shared cache for a project (in-memory only when cwd is None)."""
+    key = str(cwd) if cwd is not None else None
+    cache = _caches.get(key)
+    if cache is None or not cache.is_current():
+        cache = ResultCache(cwd)
+        _caches[key] = cache
+    return cache
+
+
+def lookup(check: Callable[[Path], list[str]], path: Path,
+           cwd: Optional[Path] = None) -> tuple[Optional[Key], Optional[list[str]]]:
+    """Return (key, cached warnings or None); key is None if path is unreadable."""
+    try:
+        data = documents.read(path).data
+    except OSError:
+        return None, None
+    key = make_key(check.__name__, path, data)
+    warnings = for_project(cwd).get(key)
+    return key, (list(warnings) if warnings is not None else None)
+
+
+def run_cached(check: Callable[[Path], list[str]], path: Path,
+               cwd: Optional[Path] = None) -> list[str]:
+    """Run check on path, reusing a cached result when nothing it reads changed.
+
+    Callers persist new entries with for_project(cwd).save() once per batch.
+    """
+    key, warnings = lookup(check, path, cwd)
+    if warnings is None:
+        warnings = check(path)
+        if key is not None:
+            for_project(cwd).put(key, warnings)
+    return list(warnings)
+
+
+def run_if_changed(check: Callable[[Path], list[str]], path: Path,
+                   cwd: Optional[Path] = None) -> Optional[list[str]]:
+    """Like run_cached, but return None when a cached result was still valid.
+
+    Used for files re-checked because something they depend on changed: a
+    cache hit means that change did not affect them.
+    """
+    key, warnings = lookup(check, path, cwd)
+    if key is None or warnings is not None:
+        return None
+    warnings = check(path)
+    for_project(cwd).put(key, warnings)
+    return list(warnings)
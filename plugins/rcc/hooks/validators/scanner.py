@@ -0,0 +1,181 @@
+"""Single-pass Markdown scanner shared by all validators.
+
+One linear pass over a component file yields everything the validators look
+at: frontmatter fields, links outside code, code span/fence ranges, headings
+and hook-only variable occurrences outside code. The scanner never uses
+backtracking patterns over unbounded input, so large or unterminated fences
+cost O(n) instead of degrading like ```[\\s\\S]*?```.
+
+Semantics:
+- Frontmatter: the text starts with "---" and closes at the next "\\n---";
+  fields are "key: value" lines (values stripped, quotes kept).
+- Fences: a line indented by at most 3 spaces opening with 3+ backticks or
+  tildes; closed by a line of the same character at least as long. An
+  unterminated fence runs to the end of the file.
+- Code spans: a backtick run closed by the next run of equal length on the
+  same line.
+- Links: [text](target) in prose, where text has no "]" and target no ")";
+  http(s) targets are dropped.
+"""
+
+import re
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .constants import HOOKS_ONLY_VARS
+
+_FENCE_OPEN = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?[ \t]*$")
+_BACKTICK_RUN = re.compile(r"`+")
+_BRACKET = re.compile(r"[\[\]]")
+
+
+@dataclass
+class MarkdownDoc:
+    """Compact parsed view of a Markdown component file."""
+
+    text: str
+    frontmatter: Optional[dict[str, str]] = None
+    frontmatter_open: bool = False   # starts with "---", even if unterminated
+    body_start: int = 0              # offset just past the closing "---" line
+    links: list[str] = field(default_factory=list)
+    code_ranges: list[tuple[int, int]] = field(default_factory=list)
+    headings: list[tuple[int, str]] = field(default_factory=list)
+    hook_vars: list[str] = field(default_factory=list)
+    line_count: int = 0
+
+    @property
+    def body(self) -> str:
+        return self.text[self.body_start:]
+
+
+def split_frontmatter(text: str) -> tuple[Optional[dict[str, str]], int]:
+    """Return (fields, body_start); fields is None without a closed block."""
+    if not text.startswith("---"):
+        return None, 0
+    end = text.find("\n---", 3)
+    if end == -1:
+        return None, 0
+    fields: dict[str, str] = {}
+    for line in text[3:end].strip().splitlines():
+        line = line.strip()
+        if ":" in line:
+            key, value = line.split(":", 1)
+            key = key.strip()
+            if key:
+                fields[key] = value.strip()
+    newline = text.find("\n", end + 4)
+    return fields, (len(text) if newline == -1 else newline + 1)
+
+
+def _code_spans(line: str, offset: int) -> list[tuple[int, int]]:
+    """Return code span ranges in one line; each backtick run is visited once."""
+    runs = [(m.start(), m.end()) for m in _BACKTICK_RUN.finditer(line)]
+    if len(runs) < 2:
+        return []
+    by_len: dict[int, deque[int]] = defaultdict(deque)
+    for idx, (start, end) in enumerate(runs):
+        by_len[end - start].append(idx)
+    spans: list[tuple[int, int]] = []
+    k = 0
+    while k < len(runs):
+        start, end = runs[k]
+        queue = by_len[end - start]
+        while queue and queue[0] <= k:
+            queue.popleft()
+        if queue:
+            j = queue.popleft()
+            spans.append((offset + start, offset + runs[j][1]))
+            k = j + 1
+        else:
+            k += 1
+    return spans
+
+
+def _links(segment: str) -> list[str]:
+    """Find [text](target) links in a prose segment in linear time."""
+    links: list[str] = []
+    open_pos = -1
+    resume = 0
+    for m in _BRACKET.finditer(segment):
+        i = m.start()
+        if i < resume:
+            continue
+        if segment[i] == "[":
+            if open_pos < 0:
+                open_pos = i
+            continue
+        # "]": a link needs an unmatched "[" before it and "(" right after
+        if open_pos >= 0 and segment.startswith("(", i + 1):
+            close = segment.find(")", i + 2)
+            if close == -1:
+                break  # no later link can close either
+            if close > i + 2:
+                links.append(segment[i + 2:close])
+                resume = close + 1
+        open_pos = -1
+    return links
+
+
+def scan(text: str) -> MarkdownDoc:
+    """Scan a Markdown document once and return its parsed view."""
+    doc = MarkdownDoc(text=text, frontmatter_open=text.startswith("---"))
+    doc.frontmatter, doc.body_start = split_frontmatter(text)
+
+    prose: list[tuple[int, int]] = []
+    fence_char = ""
+    fence_len = 0
+    fence_start = 0
+    seg_start = 0
+    offset = 0
+    lines = text.splitlines(keepends=True)
+    doc.line_count = len(lines)
+
+    for line in lines:
+        stripped = line.rstrip("\r\n")
+        if fence_char:
+            closing = stripped.lstrip(" ")
+            if (len(stripped) - len(closing) <= 3 and closing.startswith(fence_char * fence_len)
+                    and not closing.lstrip(fence_char).strip()):
+                doc.code_ranges.append((fence_start, offset + len(line)))
+                fence_char = ""
+                seg_start = offset + len(line)
+            offset += len(line)
+            continue
+
+        m = _FENCE_OPEN.match(stripped)
+        if m and not (m.group(1)[0] == "`" and "`" in m.group(2)):
+            prose.append((seg_start, offset))
+            fence_char, fence_len, fence_start = m.group(1)[0], len(m.group(1)), offset
+            offset += len(line)
+            continue
+
+        h = _HEADING.match(stripped)
+        if h:
+            title = re.sub(r"[ \t]+#+$", "", h.group(2) or "").strip()
+            doc.headings.append((len(h.group(1)), title))
+
+        for start, end in _code_spans(stripped, offset):
+            doc.code_ranges.append((start, end))
+            prose.append((seg_start, start))
+            seg_start = end
+        offset += len(line)
+
+    if fence_char:
+        doc.code_ranges.append((fence_start, len(text)))  # unterminated fence
+    else:
+        prose.append((seg_start, len(text)))
+
+    for start, end in prose:
+        if start >= end:
+            continue
+        segment = text[start:end]
+        for link in _links(segment):
+            if not link.startswith("http://") and not link.startswith("https://"):
+                doc.links.append(link)
+        for var in HOOKS_ONLY_VARS:
+            if var in segment:
+                doc.hook_vars.append(var)
+
+    return doc
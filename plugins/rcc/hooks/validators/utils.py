@@ -1,28 +1,24 @@
 """Utility functions for configuration validation."""
 
-import re
 from typing import Dict, Optional
 
+from .scanner import scan, split_frontmatter
+
+
 def parse_frontmatter(text: str) -> Optional[Dict[str, str]]:
     """Extract frontmatter fields. Returns None if no frontmatter block."""
-    if not text.startswith("---"):
-        return None
-    end = text.find("\n---", 3)
-    if end == -1:
-        return None
-    block = text[3:end].strip()
-    fields: Dict[str, str] = {}
-    for line in block.splitlines():
-        line = line.strip()
-        if ":" in line:
-            key = line.split(":", 1)[0].strip()
-            if key:
-                fields[key] = line.split(":", 1)[1].strip()
-    return fields
+    return split_frontmatter(text)[0]
 
 
 def extract_markdown_links(text: str) -> list[str]:
-    """Return relative paths from markdown links [text](path), excluding http(s)."""
-    pattern = r'\[(?:[^\]]*)\]\(([^)]+)\)'
-    links = re.findall(pattern, text)
-    return [l for l in links if not l.startswith("http://") and not l.startswith("https://")]
\ No newline at end of file
+    """Return relative paths from markdown links [text](path) outside code, excluding http(s)."""
+    return scan(text).links
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of samples; 0.0 when there are none."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(int(-(-q * len(ordered) // 100)), 1)   # ceil(q/100 * n)
+    return ordered[min(rank, len(ordered)) - 1]
@@ -0,0 +1,218 @@
+"""One pruned traversal of the project, classified in a single pass.
+
+Discovery and validate_all need the plugin manifests, SKILL.md files and
+component .md files of a project. Inside a git checkout the file list comes
+from `git ls-files` (tracked plus untracked-but-not-ignored), which reads the
+index instead of the filesystem. Elsewhere the tree is walked once, pruning
+PRUNED_DIRS and anything matched by .gitignore files along the way.
+
+Projects often gitignore .claude/, but the skills, agents and rules in it
+are still validated: CLAUDE_COMPONENT_DIRS are always walked in full and
+added to either listing.
+
+Every path is "/"-separated and relative to the project root.
+"""
+
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Never descended into, ignored or not: VCS metadata, dependency trees,
+# virtualenvs, tool caches and build output.
+PRUNED_DIRS = frozenset({
+    ".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache", "dist", "build", ".rcc",
+})
+GIT_TIMEOUT = 10
+# Validated even when ignored
+CLAUDE_COMPONENT_DIRS = (".claude/skills", ".claude/agents", ".claude/rules")
+
+
+@dataclass
+class Inventory:
+    """Component candidates found in one pass over the project."""
+
+    plugin_manifests: list[str] = field(default_factory=list)  # */.claude-plugin/plugin.json
+    marketplaces: list[str] = field(default_factory=list)      # */.claude-plugin/marketplace.json
+    skill_mds: list[str] = field(default_factory=list)         # every SKILL.md
+    markdown: dict[str, list[str]] = field(default_factory=dict)  # dir → .md names directly in it
+
+    def skill_mds_under(self, directory: str) -> list[str]:
+        prefix = "" if directory in ("", ".") else directory.rstrip("/") + "/"
+        return [p for p in self.skill_mds if p.startswith(prefix)]
+
+    def markdown_in(self, directory: str) -> list[str]:
+        base = "" if directory in ("", ".") else directory.rstrip("/") + "/"
+        return [base + name for name in self.markdown.get(directory.rstrip("/"), [])]
+
+
+def classify(paths: Iterable[str]) -> Inventory:
+    """Sort project files into the buckets the validators look at."""
+    inv = Inventory()
+    for rel in paths:
+        parent, _, name = rel.rpartition("/")
+        if parent == ".claude-plugin" or parent.endswith("/.claude-plugin"):
+            if name == "plugin.json":
+                inv.plugin_manifests.append(rel)
+            elif name == "marketplace.json":
+                inv.marketplaces.append(rel)
+        elif name.endswith(".md"):
+            if name == "SKILL.md":
+                inv.skill_mds.append(rel)
+            inv.markdown.setdefault(parent or ".", []).append(name)
+    for bucket in (inv.plugin_manifests, inv.marketplaces, inv.skill_mds, *inv.markdown.values()):
+        bucket.sort()
+    return inv
+
+
+def git_files(cwd: Path) -> Optional[list[str]]:
+    """Return tracked and unignored untracked files under cwd, or None outside git."""
+    try:
+        # -t tags each entry; with -d, files deleted from the worktree but
+        # still in the index are listed a second time with tag "R"
+        proc = subprocess.run(
+            ["git", "ls-files", "-z", "-t", "--cached", "--deleted", "--others", "--exclude-standard"],
+            cwd=cwd, capture_output=True, timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    present: set[str] = set()
+    deleted: set[str] = set()
+    for entry in proc.stdout.decode("utf-8", errors="surrogateescape").split("\0"):
+        if len(entry) > 2:
+            (deleted if entry[0] == "R" else present).add(entry[2:])
+    return sorted(p for p in present - deleted if not PRUNED_DIRS.intersection(p.split("/")[:-1]))
+
+
+def _translate(pattern: str) -> str:
+    """Translate one gitignore glob into a regex body (no anchors)."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif ch == "*":
+            out.append("[^/]*")
+            i += 1
+        elif ch == "?":
+            out.append("[^/]")
+            i += 1
+        elif ch == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(ch))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                out.append("[" + ("^" + body[1:] if body.startswith("!") else body) + "]")
+                i = end + 1
+        else:
+            if ch == "\\" and i + 1 < len(pattern):
+                i += 1
+                ch = pattern[i]
+            out.append(re.escape(ch))
+            i += 1
+    return "".join(out)
+
+
+class GitIgnore:
+    """The rules of one .gitignore file, matched relative to its directory."""
+
+    def __init__(self, base: str, lines: Iterable[str]) -> None:
+        self.base = base
+        self.rules: list[tuple[re.Pattern[str], bool, bool]] = []
+        for line in lines:
+            line = line.rstrip("\n")
+            if not line.endswith("\\ "):
+                line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line
+            body = _translate(line.lstrip("/"))
+            regex = body if anchored else "(?:.*/)?" + body
+            self.rules.append((re.compile(regex + r"\Z"), negate, dir_only))
+
+    def match(self, rel: str, is_dir: bool) -> Optional[bool]:
+        """True/False if the last matching rule ignores/re-includes rel, else None."""
+        if self.base:
+            if not rel.startswith(self.base + "/"):
+                return None
+            rel = rel[len(self.base) + 1:]
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if (is_dir or not dir_only) and regex.match(rel):
+                result = not negate
+        return result
+
+
+def walk_files(cwd: Path) -> list[str]:
+    """Walk cwd once, pruning PRUNED_DIRS and gitignored paths."""
+    files: list[str] = []
+    ignores: dict[str, list[GitIgnore]] = {}
+
+    for dirpath, dirnames, filenames in os.walk(cwd):
+        rel_dir = os.path.relpath(dirpath, cwd).replace("\\", "/")
+        rel_dir = "" if rel_dir == "." else rel_dir
+        parent = rel_dir.rpartition("/")[0]
+        active = list(ignores.get(parent, [])) if rel_dir else []
+        if ".gitignore" in filenames:
+            try:
+                with open(os.path.join(dirpath, ".gitignore"), encoding="utf-8", errors="replace") as f:
+                    active.append(GitIgnore(rel_dir, f))
+            except OSError:
+                pass
+        ignores[rel_dir] = active
+
+        def ignored(rel: str, is_dir: bool) -> bool:
+            result = False
+            for gi in active:
+                verdict = gi.match(rel, is_dir)
+                if verdict is not None:
+                    result = verdict
+            return result
+
+        prefix = rel_dir + "/" if rel_dir else ""
+        dirnames[:] = sorted(
+            d for d in dirnames if d not in PRUNED_DIRS and not ignored(prefix + d, True)
+        )
+        files.extend(prefix + name for name in sorted(filenames) if not ignored(prefix + name, False))
+    return sorted(files)
+
+
+def component_dir_files(cwd: Path) -> list[str]:
+    """Every file under CLAUDE_COMPONENT_DIRS, ignored or not (PRUNED_DIRS still pruned)."""
+    files: list[str] = []
+    for component_dir in CLAUDE_COMPONENT_DIRS:
+        for dirpath, dirnames, filenames in os.walk(cwd / component_dir):
+            dirnames[:] = [d for d in dirnames if d not in PRUNED_DIRS]
+            prefix = os.path.relpath(dirpath, cwd).replace("\\", "/") + "/"
+            files.extend(prefix + name for name in filenames)
+    return files
+
+
+def project_files(cwd: Path) -> list[str]:
+    """Return the project's files: from the git index when possible, else walked."""
+    files = git_files(cwd)
+    if files is None:
+        files = walk_files(cwd)
+    return sorted(set(files).union(component_dir_files(cwd)))
+
+
+def scan_project(cwd: Path) -> Inventory:
+    """Traverse the project once and classify its component files."""
+    return classify(project_files(cwd))
@@ -0,0 +1,192 @@
+"""File watchers for validate_all --watch.
+
+Two implementations with the same interface: InotifyWatcher (Linux, via
+ctypes, no dependencies) and PollingWatcher (anywhere; compares mtimes and
+sizes every interval). Both watch a set of root directories recursively,
+skipping walk.PRUNED_DIRS, and report changed paths.
+
+wait(timeout) returns the set of changed paths, an empty set on timeout, or
+None when events were lost (inotify queue overflow) and the caller should
+revalidate everything.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .walk import PRUNED_DIRS
+
+# Seconds without new events before a batch of changes is validated.
+DEBOUNCE_SECONDS = 0.3
+POLL_INTERVAL = 1.0
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+_EVENT = struct.Struct("iIII")
+
+
+def _walk_dirs(root: Path) -> Iterable[str]:
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in PRUNED_DIRS]
+        yield dirpath
+
+
+def _dedupe(roots: Iterable[Path]) -> list[Path]:
+    """Drop missing roots and roots nested inside another root."""
+    result: list[Path] = []
+    for root in sorted({r for r in roots if r.is_dir()}):
+        if not any(root.is_relative_to(kept) for kept in result):
+            result.append(root)
+    return result
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime, size) snapshots."""
+
+    def __init__(self, roots: Iterable[Path], interval: float = POLL_INTERVAL) -> None:
+        self.roots = _dedupe(roots)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        for root in self.roots:
+            for dirpath in _walk_dirs(root):
+                try:
+                    entries = list(os.scandir(dirpath))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[set[Path]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {Path(p) for p in current.keys() ^ self._snapshot.keys()}
+            changed.update(Path(p) for p, stamp in current.items()
+                           if self._snapshot.get(p, stamp) != stamp)
+            self._snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(remaining, 0.0))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watches on the roots; new subdirectories are added as they appear."""
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+        for root in _dedupe(roots):
+            self._add_tree(str(root))
+
+    def _add_tree(self, root: str) -> None:
+        for dirpath in _walk_dirs(Path(root)):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = dirpath
+
+    def _read(self) -> Optional[set[Path]]:
+        changed: set[Path] = set()
+        overflow = False
+        while True:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + _EVENT.size <= len(buf):
+                wd, mask, _, name_len = _EVENT.unpack_from(buf, offset)
+                name = buf[offset + _EVENT.size:offset + _EVENT.size + name_len].rstrip(b"\0")
+                offset += _EVENT.size + name_len
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                directory = self._dirs.get(wd)
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                changed.add(Path(path))
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) \
+                        and os.path.basename(path) not in PRUNED_DIRS:
+                    self._add_tree(path)
+        return None if overflow else changed
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[set[Path]]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        return self._read()
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(roots: Iterable[Path], polling: bool = False):
+    """Return an InotifyWatcher where supported, else a PollingWatcher."""
+    roots = list(roots)
+    if not polling and hasattr(os, "O_CLOEXEC"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass  # no inotify (macOS, Windows, exhausted watch limit)
+    return PollingWatcher(roots)
+
+
+def next_batch(watcher, debounce: float = DEBOUNCE_SECONDS,
+               timeout: Optional[float] = None) -> Optional[set[Path]]:
+    """Block until something changes, then gather events until quiet for debounce.
+
+    Returns None if events were lost, an empty set if timeout passed first.
+    """
+    first = watcher.wait(timeout)
+    if not first:
+        return first
+    batch: Optional[set[Path]] = set(first)
+    while True:
+        more = watcher.wait(debounce)
+        if more is None:
+            batch = None
+        elif not more:
+            return batch
+        elif batch is not None:
+            batch.update(more)
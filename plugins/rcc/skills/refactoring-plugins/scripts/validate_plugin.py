@@ -3,11 +3,27 @@
 Claude Code Plugin Health Check
 
 Validates a plugin directory against official Claude Code best practices.
-Integrates with `claude plugin validate` when available, then runs extended checks.
+Checks manifests in-process (the same rules as `claude plugin validate`), then
+runs extended checks. Pass --cli to also cross-check with the official CLI.
 
 Usage:
-    python validate_plugin.py <plugin-directory>
-    uv run validate_plugin.py <plugin-directory>
+    python validate_plugin.py <plugin-directory> [--cli] [--format text|jsonl|sarif] [--profile]
+    python validate_plugin.py --marketplace [<repo-root>] [--jobs N] [--cli] [--format ...]
+    uv run validate_plugin.py <plugin-directory> [--cli] [--format text|jsonl|sarif]
+
+--format jsonl streams one JSON record per finding to stdout as it is found;
+--format sarif prints a SARIF 2.1.0 log. Both suppress the text report.
+
+--marketplace reads <repo-root>/.claude-plugin/marketplace.json once, checks
+the catalog, then validates every plugin it lists with a local source on a
+thread pool. Parsed manifests and the marketplace lookup behind the version
+sync check are shared between plugins (SharedCache). Trigger overlaps between
+skills of different plugins, and blocks of text copied between them, are
+reported with the catalog.
+
+Library use: validate_plugin() and validate_marketplace() keep no global
+state and return PluginReport / MarketplaceReport objects, so any number of
+plugins can be validated in one process or concurrently.
 
 Exit codes:
     0 = pass
@@ -24,42 +40,171 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-
-ERRORS: list[str] = []
-WARNINGS: list[str] = []
-INFOS: list[str] = []
-
-
-def error(msg: str) -> None:
-    ERRORS.append(msg)
-    print(f"  \u274c {msg}")
-
-
-def warn(msg: str) -> None:
-    WARNINGS.append(msg)
-    print(f"  \u26a0\ufe0f  {msg}")
-
-
-def info(msg: str) -> None:
-    INFOS.append(msg)
-    print(f"  \u2139\ufe0f  {msg}")
-
-
-def ok(msg: str) -> None:
-    print(f"  \u2705 {msg}")
+from typing import Callable
+
+# Shared validators live in the plugin's hooks/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
+from validators import documents, profiling  # noqa: E402
+from validators.manifest_validator import check_marketplace_json, check_plugin_manifest, severity  # noqa: E402
+from validators.formats import Finding, JsonlWriter, write_sarif  # noqa: E402
+from validators.duplicates import find_duplicates, skill_content_files  # noqa: E402
+from validators.overlap import find_overlaps  # noqa: E402
+
+MARKETPLACE_JSON = Path(".claude-plugin") / "marketplace.json"
+
+
+class SharedCache:
+    """Lookups shared by every plugin validated in one process (thread-safe).
+
+    JSON files are parsed once per path and the nearest marketplace.json is
+    resolved once per directory, so a marketplace run parses its catalog once
+    however many plugins it lists.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._json: dict[Path, tuple[object, str | None]] = {}
+        self._manifest_findings: dict[Path, list[str]] = {}
+        self._marketplaces: dict[Path, Path | None] = {}
+
+    def load_json(self, path: Path) -> tuple[object, str | None]:
+        """Return (data, None) or (None, error message) for a JSON file."""
+        with self._lock:
+            cached = self._json.get(path)
+        if cached is None:
+            try:
+                cached = (json.loads(documents.read_text(path)), None)
+            except (json.JSONDecodeError, OSError, UnicodeDecodeError) as e:
+                cached = (None, str(e))
+            with self._lock:
+                self._json[path] = cached
+        return cached
+
+    def manifest_findings(self, plugin_dir: Path) -> list[str]:
+        """check_plugin_manifest, run once per plugin dir."""
+        with self._lock:
+            cached = self._manifest_findings.get(plugin_dir)
+        if cached is None:
+            cached = check_plugin_manifest(plugin_dir)
+            with self._lock:
+                self._manifest_findings[plugin_dir] = cached
+        return list(cached)
+
+    def marketplace_for(self, plugin_dir: Path) -> Path | None:
+        """Nearest marketplace.json in the four directories above plugin_dir."""
+        with self._lock:
+            if plugin_dir in self._marketplaces:
+                return self._marketplaces[plugin_dir]
+        found = None
+        check_dir = plugin_dir
+        for _ in range(4):
+            check_dir = check_dir.parent
+            candidate = check_dir / MARKETPLACE_JSON
+            if candidate.exists():
+                found = candidate
+                break
+        with self._lock:
+            self._marketplaces[plugin_dir] = found
+        return found
+
+
+@dataclass
+class PluginReport:
+    """Findings of one plugin health check.
+
+    Checks write to the report they are given. Text output is kept in lines
+    and also passed to echo when set; each finding is passed to on_finding
+    when set, timed from the start of its section. A finding's path is the
+    file it is about (path=), else the plugin directory.
+    """
+
+    plugin_dir: Path
+    name: str = ""
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    infos: list[str] = field(default_factory=list)
+    findings: list[Finding] = field(default_factory=list)
+    lines: list[str] = field(default_factory=list)
+    triggers: list[tuple[str, str]] = field(default_factory=list)   # (skill, description)
+    seconds: float = 0.0
+    echo: Callable[[str], None] | None = field(default=None, repr=False, compare=False)
+    on_finding: Callable[[Finding], None] | None = field(default=None, repr=False, compare=False)
+    _section_start: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def say(self, line: str = "") -> None:
+        self.lines.append(line)
+        if self.echo is not None:
+            self.echo(line)
+
+    def heading(self, title: str) -> None:
+        self.say(f"\n--- {title} ---")
+        self._section_start = time.perf_counter()
+
+    def _record(self, severity: str, msg: str, path: Path | None) -> None:
+        finding = Finding.of(str(path or self.plugin_dir), msg, severity, time.perf_counter() - self._section_start)
+        self.findings.append(finding)
+        if self.on_finding is not None:
+            self.on_finding(finding)
+
+    def error(self, msg: str, path: Path | None = None) -> None:
+        self.errors.append(msg)
+        self.say(f"  \u274c {msg}")
+        self._record("error", msg, path)
+
+    def warn(self, msg: str, path: Path | None = None) -> None:
+        self.warnings.append(msg)
+        self.say(f"  \u26a0\ufe0f  {msg}")
+        self._record("warning", msg, path)
+
+    def info(self, msg: str, path: Path | None = None) -> None:
+        self.infos.append(msg)
+        self.say(f"  \u2139\ufe0f  {msg}")
+        self._record("info", msg, path)
+
+    def ok(self, msg: str) -> None:
+        self.say(f"  \u2705 {msg}")
 
 
 # ============================================================
-# 0. Official CLI validation
+# 0. Manifest schema validation
 # ============================================================
-def run_official_validate(plugin_dir: Path) -> None:
-    """Run `claude plugin validate` if the CLI is available."""
-    print("\n--- Official CLI Validation ---")
+def run_manifest_schema_validate(report: PluginReport, plugin_dir: Path, shared: SharedCache) -> None:
+    """Check plugin.json / marketplace.json in-process (no Node start-up)."""
+    report.heading("Manifest Schema")
+
+    findings = shared.manifest_findings(plugin_dir)
+    for finding in findings:
+        # findings name their manifest first ("plugin.json: ...", ".claude-plugin/: ...")
+        source = finding.split(":", 1)[0].split(" ", 1)[0]
+        path = plugin_dir / ".claude-plugin" / (source if source.endswith(".json") else "")
+        if severity(finding) == "error":
+            report.error(finding, path)
+        else:
+            report.warn(finding, path)
+    if not findings:
+        report.ok("Manifest schema valid")
+
+
+def run_official_validate(report: PluginReport, plugin_dir: Path) -> None:
+    """Run `claude plugin validate` if the CLI is available (optional cross-check)."""
+    report.heading("Official CLI Validation")
 
     claude_bin = shutil.which("claude")
     if not claude_bin:
-        info("claude CLI not found in PATH, skipping official validation")
+        report.info("claude CLI not found in PATH, skipping official validation")
         return
 
     try:
@@ -70,76 +215,78 @@ def run_official_validate(plugin_dir: Path) -> None:
             timeout=30,
         )
         if result.returncode == 0:
-            ok("claude plugin validate passed")
+            report.ok("claude plugin validate passed")
         else:
-            error(f"claude plugin validate failed:\n{result.stderr or result.stdout}")
+            report.error(f"claude plugin validate failed:\n{result.stderr or result.stdout}")
 
         # Print output for visibility
         output = (result.stdout or "").strip()
         if output:
             for line in output.split("\n"):
-                print(f"    {line}")
+                report.say(f"    {line}")
 
     except subprocess.TimeoutExpired:
-        warn("claude plugin validate timed out (30s)")
+        report.warn("claude plugin validate timed out (30s)")
     except FileNotFoundError:
-        info("claude CLI not executable, skipping official validation")
+        report.info("claude CLI not executable, skipping official validation")
     except Exception as e:
-        warn(f"claude plugin validate error: {e}")
+        report.warn(f"claude plugin validate error: {e}")
 
 
 # ============================================================
 # 1. Manifest validation
 # ============================================================
-def validate_manifest(plugin_dir: Path) -> dict:
+def validate_manifest(report: PluginReport, plugin_dir: Path, shared: SharedCache) -> dict:
     """Validate .claude-plugin/plugin.json."""
-    print("\n--- Manifest ---")
+    report.heading("Manifest")
     manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
 
     if not manifest_path.exists():
-        error("Missing .claude-plugin/plugin.json")
+        report.error("Missing .claude-plugin/plugin.json", manifest_path)
         return {}
 
-    ok("plugin.json exists")
+    report.ok("plugin.json exists")
 
-    try:
-        data = json.loads(manifest_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        error(f"plugin.json is not valid JSON: {e}")
+    data, problem = shared.load_json(manifest_path)
+    if problem is not None:
+        report.error(f"plugin.json is not valid JSON: {problem}", manifest_path)
+        return {}
+    if not isinstance(data, dict):
+        report.error("plugin.json root must be an object", manifest_path)
         return {}
 
-    ok("Valid JSON syntax")
+    report.ok("Valid JSON syntax")
 
     # Required: name
     name = data.get("name", "")
     if not name:
-        error("Missing required field: name")
+        report.error("Missing required field: name", manifest_path)
     elif not re.match(r"^[a-z0-9][a-z0-9-]*$", name):
-        error(f"Invalid name '{name}': must be lowercase kebab-case")
+        report.error(f"Invalid name '{name}': must be lowercase kebab-case", manifest_path)
     else:
-        ok(f"name: {name}")
+        report.ok(f"name: {name}")
 
     reserved = {"helper", "utils", "anthropic", "claude"}
     if name.lower() in reserved:
-        warn(f"Name '{name}' uses reserved word")
+        report.warn(f"Name '{name}' uses reserved word", manifest_path)
 
     # Recommended: description, version
     for field in ("description", "version"):
         val = data.get(field)
         if not val:
-            warn(f"Missing recommended field: {field}")
+            report.warn(f"Missing recommended field: {field}", manifest_path)
         else:
-            ok(f"{field}: {val}")
+            report.ok(f"{field}: {val}")
 
     # Version format
     version = data.get("version", "")
     if version and not re.match(r"^\d+\.\d+\.\d+", version):
-        warn(f"Version '{version}' does not follow semver (MAJOR.MINOR.PATCH)")
+        report.warn(f"Version '{version}' does not follow semver (MAJOR.MINOR.PATCH)", manifest_path)
 
     # Optional fields
     for field in ("author", "license", "keywords"):
         if not data.get(field):
-            info(f"Optional field missing: {field}")
+            report.info(f"Optional field missing: {field}", manifest_path)
 
     return data
 
@@ -147,16 +294,16 @@ def validate_manifest(plugin_dir: Path) -> dict:
 # ============================================================
 # 2. Directory structure
 # ============================================================
-def validate_structure(plugin_dir: Path) -> None:
+def validate_structure(report: PluginReport, plugin_dir: Path) -> None:
     """Validate plugin directory structure."""
-    print("\n--- Directory Structure ---")
+    report.heading("Directory Structure")
 
     # Anti-pattern: components inside .claude-plugin/
     claude_plugin_dir = plugin_dir / ".claude-plugin"
     for dirname in ("commands", "agents", "skills", "hooks"):
         bad_path = claude_plugin_dir / dirname
         if bad_path.exists():
-            error(f"{dirname}/ found inside .claude-plugin/ \u2014 must be at plugin root")
+            report.error(f"{dirname}/ found inside .claude-plugin/ \u2014 must be at plugin root", bad_path)
 
     # Component directories at root
     component_count = 0
@@ -165,34 +312,34 @@ def validate_structure(plugin_dir: Path) -> None:
         if comp_dir.is_dir():
             items = [p for p in comp_dir.iterdir() if p.is_dir() or p.suffix == ".md"]
             count = len(items)
-            ok(f"{dirname}/ exists ({count} items)")
+            report.ok(f"{dirname}/ exists ({count} items)")
             component_count += count
 
     if component_count == 0:
-        warn("No component directories found (skills/, commands/, agents/)")
+        report.warn("No component directories found (skills/, commands/, agents/)")
 
     # README
     if (plugin_dir / "README.md").exists():
-        ok("README.md exists")
+        report.ok("README.md exists")
     else:
-        warn("Missing README.md")
+        report.warn("Missing README.md", plugin_dir / "README.md")
 
 
 # ============================================================
 # 3. Skills validation
 # ============================================================
-def validate_skills(plugin_dir: Path) -> None:
+def validate_skills(report: PluginReport, plugin_dir: Path) -> None:
     """Validate all skills in the plugin."""
-    print("\n--- Skills ---")
+    report.heading("Skills")
     skills_dir = plugin_dir / "skills"
 
     if not skills_dir.is_dir():
-        info("No skills/ directory")
+        report.info("No skills/ directory")
         return
 
     skill_dirs = [p for p in skills_dir.iterdir() if p.is_dir()]
     if not skill_dirs:
-        info("No skills found")
+        report.info("No skills found")
         return
 
     descriptions: list[tuple[str, str]] = []
@@ -202,97 +349,84 @@ def validate_skills(plugin_dir: Path) -> None:
         skill_md = sd / "SKILL.md"
 
         if not skill_md.exists():
-            error(f"Skill '{sname}' missing SKILL.md")
+            report.error(f"Skill '{sname}' missing SKILL.md", sd)
             continue
 
         # Gerund naming
         if not re.search(r"(ing$|ing-)", sname):
-            warn(f"Skill '{sname}' does not use gerund form (verb+-ing)")
+            report.warn(f"Skill '{sname}' does not use gerund form (verb+-ing)", skill_md)
 
-        content = skill_md.read_text(encoding="utf-8")
+        doc = documents.load(skill_md)
 
         # Frontmatter check
-        if not content.startswith("---"):
-            error(f"Skill '{sname}': missing YAML frontmatter")
+        if not doc.frontmatter_open:
+            report.error(f"Skill '{sname}': missing YAML frontmatter", skill_md)
             continue
 
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            error(f"Skill '{sname}': invalid frontmatter format")
+        if doc.frontmatter is None:
+            report.error(f"Skill '{sname}': invalid frontmatter format", skill_md)
             continue
 
-        # Parse frontmatter
-        fm = {}
-        for line in parts[1].strip().split("\n"):
-            if ":" in line:
-                key, val = line.split(":", 1)
-                fm[key.strip()] = val.strip().strip('"').strip("'")
+        fm = {key: val.strip('"').strip("'") for key, val in doc.frontmatter.items()}
 
         desc = fm.get("description", "")
         if desc:
             descriptions.append((sname, desc))
             if "use when" not in desc.lower():
-                warn(f"Skill '{sname}': description missing 'Use when' triggers")
+                report.warn(f"Skill '{sname}': description missing 'Use when' triggers", skill_md)
         else:
-            warn(f"Skill '{sname}': missing description in frontmatter")
+            report.warn(f"Skill '{sname}': missing description in frontmatter", skill_md)
 
         # Line count
-        lines = len(content.split("\n"))
+        lines = len(doc.text.split("\n"))
         if lines > 300:
-            warn(f"Skill '{sname}': {lines} lines (recommend < 300, use references/)")
+            report.warn(f"Skill '{sname}': {lines} lines (recommend < 300, use references/)", skill_md)
 
         # Mandatory sections
-        body = parts[2] if len(parts) > 2 else ""
-        body_lower = body.lower()
+        body_lower = doc.body.lower()
         for section in ("task initialization", "red flags", "rationalizations", "flowchart"):
             if section not in body_lower:
-                warn(f"Skill '{sname}': missing '{section}' section")
+                report.warn(f"Skill '{sname}': missing '{section}' section", skill_md)
 
-        ok(f"Skill '{sname}': valid ({lines} lines)")
+        report.ok(f"Skill '{sname}': valid ({lines} lines)")
 
     # Cross-skill: trigger overlap detection
+    report.triggers = descriptions
     if len(descriptions) > 1:
-        _check_trigger_overlap(descriptions)
+        _check_trigger_overlap(report, descriptions, skills_dir)
 
 
-def _check_trigger_overlap(descriptions: list[tuple[str, str]]) -> None:
+def _check_trigger_overlap(report: PluginReport, descriptions: list[tuple[str, str]], skills_dir: Path) -> None:
     """Check for overlapping triggers between skills."""
-    for i, (name_a, desc_a) in enumerate(descriptions):
-        for name_b, desc_b in descriptions[i + 1 :]:
-            # Simple heuristic: check if trigger phrases overlap significantly
-            words_a = set(desc_a.lower().split()) - {"use", "when", "the", "a", "an", "or", "and", "to", "is", "for", "in", "of"}
-            words_b = set(desc_b.lower().split()) - {"use", "when", "the", "a", "an", "or", "and", "to", "is", "for", "in", "of"}
-            overlap = words_a & words_b
-            ratio = len(overlap) / min(len(words_a), len(words_b)) if words_a and words_b else 0
-            if ratio > 0.7:
-                warn(f"Possible trigger overlap between '{name_a}' and '{name_b}'")
+    for name_a, name_b, _ in find_overlaps(descriptions):
+        report.warn(f"Possible trigger overlap between '{name_a}' and '{name_b}'", skills_dir / name_a / "SKILL.md")
 
 
 # ============================================================
 # 4. Commands validation
 # ============================================================
-def validate_commands(plugin_dir: Path) -> None:
+def validate_commands(report: PluginReport, plugin_dir: Path) -> None:
     """Validate command files."""
-    print("\n--- Commands ---")
+    report.heading("Commands")
     cmds_dir = plugin_dir / "commands"
 
     if not cmds_dir.is_dir():
-        info("No commands/ directory")
+        report.info("No commands/ directory")
         return
 
     cmd_files = list(cmds_dir.glob("*.md"))
     if not cmd_files:
-        info("No commands found")
+        report.info("No commands found")
         return
 
     for cf in sorted(cmd_files):
         cname = cf.stem
-        content = cf.read_text(encoding="utf-8")
+        content = documents.read_text(cf)
 
         if not content.startswith("---"):
-            warn(f"Command '{cname}': missing YAML frontmatter")
+            report.warn(f"Command '{cname}': missing YAML frontmatter", cf)
         else:
-            ok(f"Command '{cname}': valid")
+            report.ok(f"Command '{cname}': valid")
 
         # Check for orphan commands (references non-existent skill)
         if "invoke" in content.lower() or "skill" in content.lower():
@@ -303,51 +437,51 @@ def validate_commands(plugin_dir: Path) -> None:
                     skill_name = match.group(1)
                     skill_path = plugin_dir / "skills" / skill_name / "SKILL.md"
                     if not skill_path.exists():
-                        warn(f"Command '{cname}' references skill '{skill_name}' which was not found locally")
+                        report.warn(f"Command '{cname}' references skill '{skill_name}' which was not found locally", cf)
 
 
 # ============================================================
 # 5. Agents validation
 # ============================================================
-def validate_agents(plugin_dir: Path) -> None:
+def validate_agents(report: PluginReport, plugin_dir: Path) -> None:
     """Validate agent files."""
-    print("\n--- Agents ---")
+    report.heading("Agents")
     agents_dir = plugin_dir / "agents"
 
     if not agents_dir.is_dir():
-        info("No agents/ directory")
+        report.info("No agents/ directory")
         return
 
     agent_files = list(agents_dir.glob("*.md"))
     if not agent_files:
-        info("No agents found")
+        report.info("No agents found")
         return
 
     for af in sorted(agent_files):
         aname = af.stem
-        content = af.read_text(encoding="utf-8")
+        content = documents.read_text(af)
 
         if "context:" not in content:
-            warn(f"Agent '{aname}': missing context isolation (recommend context: fork)")
+            report.warn(f"Agent '{aname}': missing context isolation (recommend context: fork)", af)
 
         if "tools:" not in content:
-            warn(f"Agent '{aname}': missing tools specification")
+            report.warn(f"Agent '{aname}': missing tools specification", af)
 
-        ok(f"Agent '{aname}': valid")
+        report.ok(f"Agent '{aname}': valid")
 
 
 # ============================================================
 # 6. Path safety
 # ============================================================
-def validate_paths(plugin_dir: Path) -> None:
+def validate_paths(report: PluginReport, plugin_dir: Path) -> None:
     """Check for absolute paths in configuration files."""
-    print("\n--- Path Safety ---")
+    report.heading("Path Safety")
 
     config_files = list((plugin_dir / ".claude-plugin").glob("*.json"))
     found_abs = False
 
     for cf in config_files:
-        content = cf.read_text(encoding="utf-8")
+        content = documents.read_text(cf)
         # Find absolute paths (not URLs)
         for i, line in enumerate(content.split("\n"), 1):
             # Skip comment lines and URLs
@@ -356,45 +490,37 @@ def validate_paths(plugin_dir: Path) -> None:
                 continue
             # Check for absolute paths like /Users/, /home/, C:\, etc.
             if re.search(r'["\']/(Users|home|opt|usr|var|tmp)/', line) or re.search(r'["\'][A-Z]:\\', line):
-                warn(f"Absolute path in {cf.name}:{i}: {stripped}")
+                report.warn(f"Absolute path in {cf.name}:{i}: {stripped}", cf)
                 found_abs = True
 
     if not found_abs:
-        ok("No absolute paths in config")
+        report.ok("No absolute paths in config")
 
 
 # ============================================================
 # 7. Version sync
 # ============================================================
-def validate_version_sync(plugin_dir: Path, manifest_data: dict) -> None:
+def validate_version_sync(report: PluginReport, plugin_dir: Path, manifest_data: dict,
+                          shared: SharedCache) -> None:
     """Check version sync with marketplace.json."""
-    print("\n--- Version Sync ---")
+    report.heading("Version Sync")
 
     plugin_name = manifest_data.get("name", "")
     plugin_ver = manifest_data.get("version", "")
 
     if not plugin_ver:
-        info("No version in plugin.json, skipping sync check")
+        report.info("No version in plugin.json, skipping sync check", plugin_dir / ".claude-plugin" / "plugin.json")
         return
 
     # Search for marketplace.json in parent directories
-    marketplace_path = None
-    check_dir = plugin_dir
-    for _ in range(4):
-        check_dir = check_dir.parent
-        candidate = check_dir / ".claude-plugin" / "marketplace.json"
-        if candidate.exists():
-            marketplace_path = candidate
-            break
-
+    marketplace_path = shared.marketplace_for(plugin_dir)
     if not marketplace_path:
-        info("No marketplace.json found for version sync check")
+        report.info("No marketplace.json found for version sync check")
         return
 
-    try:
-        market_data = json.loads(marketplace_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        warn("marketplace.json exists but is not readable/valid")
+    market_data, problem = shared.load_json(marketplace_path)
+    if problem is not None or not isinstance(market_data, dict):
+        report.warn("marketplace.json exists but is not readable/valid", marketplace_path)
         return
 
     # Check plugin entry version
@@ -402,74 +528,247 @@ def validate_version_sync(plugin_dir: Path, manifest_data: dict) -> None:
         if p.get("name") == plugin_name:
             market_ver = p.get("version", "")
             if market_ver and market_ver != plugin_ver:
-                error(f"Version mismatch: plugin.json ({plugin_ver}) != marketplace ({market_ver})")
+                report.error(f"Version mismatch: plugin.json ({plugin_ver}) != marketplace ({market_ver})",
+                             plugin_dir / ".claude-plugin" / "plugin.json")
             elif market_ver:
-                ok(f"Version sync: plugin.json ({plugin_ver}) = marketplace ({market_ver})")
+                report.ok(f"Version sync: plugin.json ({plugin_ver}) = marketplace ({market_ver})")
             break
 
     # Check metadata version
     meta_ver = market_data.get("metadata", {}).get("version", "")
     if meta_ver and meta_ver != plugin_ver:
-        info(f"Marketplace metadata version ({meta_ver}) differs from plugin ({plugin_ver})")
+        report.info(f"Marketplace metadata version ({meta_ver}) differs from plugin ({plugin_ver})", marketplace_path)
+
+
+# ============================================================
+# 8. Duplicate content
+# ============================================================
+def _skill_dirs(plugin_dir: Path) -> list[Path]:
+    skills_dir = plugin_dir / "skills"
+    return sorted(p for p in skills_dir.iterdir() if p.is_dir()) if skills_dir.is_dir() else []
+
+
+def _duplicate_message(block, root: Path) -> str:
+    def where(path: Path, lines: tuple[int, int]) -> str:
+        return f"{path.relative_to(root).as_posix()}:{lines[0]}-{lines[1]}"
+
+    return (f"Duplicated block ({block.words} words, {block.line_count} lines): "
+            f"{where(block.path_a, block.lines_a)} ~ {where(block.path_b, block.lines_b)}")
+
+
+def validate_duplicates(report: PluginReport, plugin_dir: Path) -> None:
+    """Check for blocks copied between SKILL.md bodies and references/*.md."""
+    report.heading("Duplicate Content")
+
+    blocks = find_duplicates(skill_content_files(_skill_dirs(plugin_dir)))
+    for block in blocks:
+        report.warn(_duplicate_message(block, plugin_dir), block.path_a)
+    if not blocks:
+        report.ok("No duplicated blocks in skills")
 
 
 # ============================================================
 # Main
 # ============================================================
-def validate_plugin(plugin_dir: Path) -> bool:
-    """Run all validations on a plugin directory."""
-    print(f"\n{'=' * 50}")
-    print(f"Plugin Health Check: {plugin_dir.name}")
-    print(f"Path: {plugin_dir}")
-    print(f"{'=' * 50}")
+@documents.run()
+def validate_plugin(plugin_dir: Path, cli: bool = False, shared: SharedCache | None = None,
+                    echo: Callable[[str], None] | None = None,
+                    on_finding: Callable[[Finding], None] | None = None) -> PluginReport:
+    """Run all validations on a plugin directory and return its report."""
+    shared = shared or SharedCache()
+    report = PluginReport(plugin_dir, echo=echo, on_finding=on_finding)
+    start = time.perf_counter()
+    report.say(f"\n{'=' * 50}")
+    report.say(f"Plugin Health Check: {plugin_dir.name}")
+    report.say(f"Path: {plugin_dir}")
+    report.say(f"{'=' * 50}")
 
     if not plugin_dir.is_dir():
-        error(f"Not a directory: {plugin_dir}")
-        return False
+        report.error(f"Not a directory: {plugin_dir}")
+        report.seconds = time.perf_counter() - start
+        return report
 
-    # 0. Official CLI validation
-    run_official_validate(plugin_dir)
+    # 0. Manifest schema (+ optional official CLI cross-check)
+    run_manifest_schema_validate(report, plugin_dir, shared)
+    if cli:
+        run_official_validate(report, plugin_dir)
 
     # 1. Manifest
-    manifest_data = validate_manifest(plugin_dir)
+    manifest_data = validate_manifest(report, plugin_dir, shared)
+    report.name = manifest_data.get("name", "") if isinstance(manifest_data.get("name"), str) else ""
 
     # 2. Structure
-    validate_structure(plugin_dir)
+    validate_structure(report, plugin_dir)
 
     # 3. Skills
-    validate_skills(plugin_dir)
+    validate_skills(report, plugin_dir)
 
     # 4. Commands
-    validate_commands(plugin_dir)
+    validate_commands(report, plugin_dir)
 
     # 5. Agents
-    validate_agents(plugin_dir)
+    validate_agents(report, plugin_dir)
 
     # 6. Path safety
-    validate_paths(plugin_dir)
+    validate_paths(report, plugin_dir)
 
     # 7. Version sync
     if manifest_data:
-        validate_version_sync(plugin_dir, manifest_data)
+        validate_version_sync(report, plugin_dir, manifest_data, shared)
+
+    # 8. Duplicate content
+    validate_duplicates(report, plugin_dir)
 
     # Summary
-    print(f"\n{'=' * 50}")
-    print("Summary")
-    print(f"{'=' * 50}")
-    print(f"  Errors:   {len(ERRORS)}")
-    print(f"  Warnings: {len(WARNINGS)}")
-    print(f"  Info:     {len(INFOS)}")
-    print()
-
-    if ERRORS:
-        print(f"\u274c Health check FAILED with {len(ERRORS)} error(s)")
-        return False
-    elif WARNINGS:
-        print(f"\u26a0\ufe0f  Health check PASSED with {len(WARNINGS)} warning(s)")
-        return True
+    report.say(f"\n{'=' * 50}")
+    report.say("Summary")
+    report.say(f"{'=' * 50}")
+    report.say(f"  Errors:   {len(report.errors)}")
+    report.say(f"  Warnings: {len(report.warnings)}")
+    report.say(f"  Info:     {len(report.infos)}")
+    report.say()
+
+    if report.errors:
+        report.say(f"\u274c Health check FAILED with {len(report.errors)} error(s)")
+    elif report.warnings:
+        report.say(f"\u26a0\ufe0f  Health check PASSED with {len(report.warnings)} warning(s)")
     else:
-        print("\u2705 Health check PASSED")
-        return True
+        report.say("\u2705 Health check PASSED")
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+# ============================================================
+# Marketplace mode
+# ============================================================
+@dataclass
+class MarketplaceReport:
+    """Catalog findings plus one PluginReport per listed plugin, in catalog order."""
+
+    path: Path
+    catalog: list[Finding] = field(default_factory=list)
+    plugins: list[PluginReport] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)   # entries without a local source
+    overlaps: list[Finding] = field(default_factory=list)   # trigger overlaps between plugins
+    duplicates: list[Finding] = field(default_factory=list)   # blocks copied between plugins
+    seconds: float = 0.0
+
+    @property
+    def catalog_errors(self) -> list[Finding]:
+        return [f for f in self.catalog if f.severity == "error"]
+
+    @property
+    def passed(self) -> bool:
+        return not self.catalog_errors and all(r.passed for r in self.plugins)
+
+    @property
+    def findings(self) -> list[Finding]:
+        """Findings about the marketplace as a whole (not in any PluginReport)."""
+        return self.catalog + self.overlaps + self.duplicates
+
+
+def marketplace_plugin_dirs(marketplace_path: Path, data: dict) -> tuple[list[Path], list[str]]:
+    """Return the plugin dirs of local (relative path) sources, and the names of the others."""
+    root = marketplace_path.parent.parent
+    metadata = data.get("metadata")
+    prefix = metadata.get("pluginRoot") if isinstance(metadata, dict) else None
+    base = root / prefix if isinstance(prefix, str) else root
+    dirs: list[Path] = []
+    skipped: list[str] = []
+    for entry in data.get("plugins") or []:
+        if not isinstance(entry, dict):
+            continue
+        source = entry.get("source")
+        if isinstance(source, str):
+            path = Path(os.path.normpath(base / source))
+            if path not in dirs:
+                dirs.append(path)
+        else:
+            skipped.append(str(entry.get("name", "?")))
+    return dirs, skipped
+
+
+@documents.run()
+def validate_marketplace(root: Path, cli: bool = False, jobs: int | None = None,
+                         shared: SharedCache | None = None,
+                         on_report: Callable[[PluginReport], None] | None = None) -> MarketplaceReport:
+    """Validate root/.claude-plugin/marketplace.json and every plugin it lists.
+
+    Plugins are checked on a pool of jobs threads (default: one per CPU) that
+    share one SharedCache; on_report is called in the calling thread as each
+    plugin finishes, while the report lists plugins in catalog order.
+    """
+    shared = shared or SharedCache()
+    marketplace_path = root / MARKETPLACE_JSON
+    result = MarketplaceReport(marketplace_path)
+    start = time.perf_counter()
+
+    data, problem = shared.load_json(marketplace_path)
+    if problem is not None or not isinstance(data, dict):
+        message = f"marketplace.json: {problem}" if problem else "marketplace.json: root must be an object"
+        result.catalog.append(Finding.of(str(marketplace_path), message, "error"))
+        result.seconds = time.perf_counter() - start
+        return result
+    result.catalog = [Finding.of(str(marketplace_path), w, severity(w), time.perf_counter() - start)
+                      for w in check_marketplace_json(marketplace_path)]
+
+    plugin_dirs, result.skipped = marketplace_plugin_dirs(marketplace_path, data)
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(plugin_dirs) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(validate_plugin, d, cli, shared) for d in plugin_dirs]
+        for future in as_completed(futures):
+            if on_report is not None:
+                on_report(future.result())
+    result.plugins = [future.result() for future in futures]   # in catalog order
+    result.overlaps = cross_plugin_overlaps(result)
+    result.duplicates = cross_plugin_duplicates(result, root)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def cross_plugin_overlaps(result: MarketplaceReport) -> list[Finding]:
+    """Trigger overlaps between skills of different plugins (within-plugin ones are in each report)."""
+    entries = [((report.name or report.plugin_dir.name, skill), description)
+               for report in result.plugins for skill, description in report.triggers]
+    labels = {key: f"{key[0]}:{key[1]}" for key, _ in entries}
+    skill_mds = {(report.name or report.plugin_dir.name, skill): report.plugin_dir / "skills" / skill / "SKILL.md"
+                 for report in result.plugins for skill, _ in report.triggers}
+    return [
+        Finding.of(str(skill_mds[a]), f"Possible trigger overlap between '{labels[a]}' and '{labels[b]}'")
+        for a, b, _ in find_overlaps(entries) if a[0] != b[0]
+    ]
+
+
+def cross_plugin_duplicates(result: MarketplaceReport, root: Path) -> list[Finding]:
+    """Blocks copied between skills of different plugins."""
+    owner: dict[Path, Path] = {}
+    for report in result.plugins:
+        for path in skill_content_files(_skill_dirs(report.plugin_dir)):
+            owner[path] = report.plugin_dir
+    return [
+        Finding.of(str(block.path_a), _duplicate_message(block, root))
+        for block in find_duplicates(owner) if owner[block.path_a] != owner[block.path_b]
+    ]
+
+
+def marketplace_summary(result: MarketplaceReport) -> list[str]:
+    lines = [f"\n{'=' * 50}", f"Marketplace: {result.path}", f"{'=' * 50}"]
+    for finding in result.catalog:
+        mark = "\u274c" if finding.severity == "error" else "\u26a0\ufe0f "
+        lines.append(f"  {mark} {finding.message}")
+    for name in result.skipped:
+        lines.append(f"  \u2139\ufe0f  Plugin '{name}' has a remote source, skipped")
+    for finding in result.overlaps + result.duplicates:
+        lines.append(f"  \u26a0\ufe0f  {finding.message}")
+    for report in result.plugins:
+        mark = "\u2705" if report.passed else "\u274c"
+        lines.append(f"  {mark} {report.name or report.plugin_dir.name}: "
+                     f"{len(report.errors)} error(s), {len(report.warnings)} warning(s)")
+    failed = sum(1 for r in result.plugins if not r.passed)
+    lines.append("")
+    lines.append(f"{len(result.plugins)} plugin(s) checked in {result.seconds:.2f}s, {failed} failed"
+                 + (", catalog has errors" if result.catalog_errors else ""))
+    return lines
 
 
 def main() -> None:
@@ -477,13 +776,58 @@ def main() -> None:
         description="Claude Code Plugin Health Check",
         epilog="Validates plugin structure against official best practices.",
     )
-    parser.add_argument("path", help="Path to plugin directory")
+    parser.add_argument("path", nargs="?",
+                        help="Plugin directory (with --marketplace: repo root, default: current directory)")
+    parser.add_argument("--cli", action="store_true",
+                        help="Also cross-check with `claude plugin validate` (slow)")
+    parser.add_argument("--marketplace", action="store_true",
+                        help="Validate every plugin listed in <path>/.claude-plugin/marketplace.json")
+    parser.add_argument("--jobs", "-j", type=int, default=0, metavar="N",
+                        help="Plugins checked at once in --marketplace mode (default: one per CPU)")
+    parser.add_argument("--format", choices=("text", "jsonl", "sarif"), default="text",
+                        help="Output format (default: text)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile this run into .rcc/profiles/ (also RCC_PROFILE=1)")
 
     args = parser.parse_args()
-    plugin_path = Path(args.path).resolve()
+    if args.path is None and not args.marketplace:
+        parser.error("the plugin directory is required unless --marketplace is given")
+    profiling.start(Path.cwd(), "validate-plugin", force=args.profile)
+    target = Path(args.path or ".").resolve()
+    out = sys.stdout
+    jsonl = JsonlWriter(out) if args.format == "jsonl" else None
+
+    if args.marketplace:
+        def on_report(report: PluginReport) -> None:
+            if jsonl is not None:
+                for finding in report.findings:
+                    jsonl.finding(finding)
+                jsonl.file_done(str(report.plugin_dir), len(report.findings), report.seconds)
+
+        result = validate_marketplace(target, cli=args.cli, jobs=args.jobs or None, on_report=on_report)
+        if jsonl is not None:
+            for finding in result.findings:
+                jsonl.finding(finding)
+            jsonl.file_done(str(result.path), len(result.findings), result.seconds)
+        elif args.format == "sarif":
+            findings = result.findings + [f for r in result.plugins for f in r.findings]
+            write_sarif(findings, out, "rcc-validate-plugin")
+        else:
+            for report in result.plugins:
+                print(report.text)
+            print("\n".join(marketplace_summary(result)))
+        sys.exit(0 if result.passed else 1)
 
-    success = validate_plugin(plugin_path)
-    sys.exit(0 if success else 1)
+    if args.format == "text":
+        report = validate_plugin(target, cli=args.cli, echo=print)
+    else:
+        report = validate_plugin(target, cli=args.cli,
+                                 on_finding=jsonl.finding if jsonl is not None else None)
+        if jsonl is not None:
+            jsonl.file_done(str(target), len(report.findings), report.seconds)
+        else:
+            write_sarif(report.findings, out, "rcc-validate-plugin")
+    sys.exit(0 if report.passed else 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Hook latency benchmark
+
+Finds every command hook that applies in a project (user, project and local
+settings plus the project's plugins, see validators.hook_config), feeds each
+one a synthetic event payload that its event and matcher accept, and times
+it over several runs:
+
+- cold runs each get a fresh, empty PYTHONPYCACHEPREFIX, so Python hooks
+  recompile their modules as on the first call after an update
+- warm runs follow one discarded warm-up run and share a bytecode cache
+
+Each hook's cold and warm p50 / p95 / max are reported. A hook is flagged
+when its p95 reaches NEAR_TIMEOUT_RATIO of its timeout (declared, or Claude
+Code's default for the type), or when a run timed out.
+
+Hooks really run: a PostToolUse formatter really formats. Tool payloads
+point at a scratch file outside the project unless --file names one.
+HTTP, prompt and agent hooks are listed but not run.
+
+Usage:
+    python bench_hooks.py [<project-dir>] [--runs N] [--event E] [--source S]
+                          [--file PATH] [--plugin-dir DIR] [--no-plugins]
+                          [--list] [--format text|json]
+
+Exit codes:
+    0 = no hook near its timeout
+    1 = at least one hook flagged
+"""
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+# Shared validators live in the plugin's hooks/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
+from validators.config_validator import TOOL_EVENTS  # noqa: E402
+from validators.hook_config import MATCH_FIELDS, HookEntry, discover_hooks  # noqa: E402
+from validators.matchers import TOOL_NAME_CORPUS, matches  # noqa: E402
+from validators.utils import percentile  # noqa: E402
+
+DEFAULT_RUNS = 5
+NEAR_TIMEOUT_RATIO = 0.5
+TIMEOUT_CAP = 60.0   # longest a single run may take, whatever the hook declares
+PREFERRED_TOOLS = ["Edit", "Write", "Bash", "Read", "Glob", "Grep", "MultiEdit", "NotebookEdit"]
+
+
+def sample_tool_input(tool: str, file_path: str) -> dict:
+    inputs = {
+        "Edit": {"file_path": file_path, "old_string": "old", "new_string": "new"},
+        "Write": {"file_path": file_path, "content": "print('hello')\n"},
+        "Read": {"file_path": file_path},
+        "NotebookEdit": {"notebook_path": file_path, "new_source": ""},
+        "Bash": {"command": "git status", "description": "Show working tree status"},
+        "Glob": {"pattern": "**/*.py"},
+        "Grep": {"pattern": "TODO"},
+        "WebFetch": {"url": "https://example.com", "prompt": "Summarize"},
+        "WebSearch": {"query": "claude code hooks"},
+        "Agent": {"description": "Explore", "prompt": "Find the tests", "subagent_type": "Explore"},
+    }
+    return inputs.get(tool, {})
+
+
+def pick_trigger(entry: HookEntry) -> Optional[str]:
+    """A tool name (or match-field value) the hook's matcher accepts; None if none does."""
+    if entry.event in TOOL_EVENTS:
+        candidates = PREFERRED_TOOLS + [t for t in TOOL_NAME_CORPUS if t not in PREFERRED_TOOLS]
+    elif entry.event in MATCH_FIELDS:
+        candidates = MATCH_FIELDS[entry.event][1]
+        if not candidates:   # free-form field such as FileChanged's file_path
+            return entry.matcher.split("|")[0] if entry.matcher not in ("", "*") else "settings.json"
+    else:
+        return ""
+    return next((c for c in candidates if matches(entry.matcher, c)), None)
+
+
+def make_payload(entry: HookEntry, trigger: str, cwd: Path, scratch: Path, file_path: str) -> dict:
+    payload: dict = {
+        "session_id": "hook-bench",
+        "transcript_path": str(scratch / "transcript.jsonl"),
+        "cwd": str(cwd),
+        "permission_mode": "default",
+        "hook_event_name": entry.event,
+    }
+    if entry.event in TOOL_EVENTS:
+        payload.update(tool_name=trigger, tool_input=sample_tool_input(trigger, file_path),
+                       tool_use_id="toolu_bench")
+        if entry.event == "PostToolUse":
+            payload["tool_response"] = {"success": True, "filePath": file_path}
+        elif entry.event == "PostToolUseFailure":
+            payload["error"] = "Command failed"
+    elif entry.event in MATCH_FIELDS:
+        payload[MATCH_FIELDS[entry.event][0]] = trigger
+    elif entry.event == "UserPromptSubmit":
+        payload["prompt"] = "Add a test for the parser"
+    if entry.event in ("Stop", "SubagentStop"):
+        payload["stop_hook_active"] = False
+    return payload
+
+
+@dataclass
+class Run:
+    seconds: float
+    returncode: Optional[int]   # None when the run timed out
+
+
+@dataclass
+class HookBenchmark:
+    entry: HookEntry
+    trigger: Optional[str] = None
+    skipped: Optional[str] = None
+    cold: list[Run] = field(default_factory=list)
+    warm: list[Run] = field(default_factory=list)
+
+    @staticmethod
+    def stats(runs: list[Run]) -> tuple[float, float, float]:
+        times = [r.seconds for r in runs]
+        return percentile(times, 50), percentile(times, 95), max(times, default=0.0)
+
+    @property
+    def timed_out(self) -> int:
+        return sum(r.returncode is None for r in self.cold + self.warm)
+
+    @property
+    def p95(self) -> float:
+        return max(self.stats(self.cold)[1], self.stats(self.warm)[1])
+
+    @property
+    def near_timeout(self) -> bool:
+        return self.skipped is None and (
+            self.timed_out > 0 or self.p95 >= NEAR_TIMEOUT_RATIO * self.entry.timeout)
+
+    def to_dict(self) -> dict:
+        data = {
+            "hook": self.entry.label, "path": str(self.entry.path), "command": self.entry.command,
+            "timeout": self.entry.timeout, "async": self.entry.is_async, "trigger": self.trigger,
+            "skipped": self.skipped, "timed_out": self.timed_out, "near_timeout": self.near_timeout,
+        }
+        for name, runs in (("cold", self.cold), ("warm", self.warm)):
+            p50, p95, worst = self.stats(runs)
+            data[name] = {"runs": len(runs), "p50": p50, "p95": p95, "max": worst,
+                          "failures": sum(r.returncode not in (0, None) for r in runs)}
+        return data
+
+
+def run_hook(entry: HookEntry, payload: bytes, env: dict[str, str], cwd: Path, cap: float) -> Run:
+    limit = min(entry.timeout, cap)
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(entry.command, shell=True, input=payload, cwd=cwd, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=limit)
+    except subprocess.TimeoutExpired:
+        return Run(limit, None)
+    return Run(time.perf_counter() - start, result.returncode)
+
+
+def benchmark(entry: HookEntry, cwd: Path, scratch: Path, runs: int,
+              file_path: str, cap: float = TIMEOUT_CAP) -> HookBenchmark:
+    result = HookBenchmark(entry)
+    if entry.type != "command" or not entry.command:
+        result.skipped = f"{entry.type or 'untyped'} hooks are not run"
+        return result
+    result.trigger = pick_trigger(entry)
+    if result.trigger is None:
+        result.skipped = f"no known {'tool' if entry.event in TOOL_EVENTS else 'value'} matches '{entry.matcher}'"
+        return result
+
+    payload = json.dumps(make_payload(entry, result.trigger, cwd, scratch, file_path)).encode()
+    env = {**os.environ, "CLAUDE_PROJECT_DIR": str(cwd)}
+    if entry.plugin_root is not None:
+        env["CLAUDE_PLUGIN_ROOT"] = str(entry.plugin_root)
+        env["CLAUDE_PLUGIN_DATA"] = str(scratch / "plugin-data")
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(dir=scratch) as pycache:
+            result.cold.append(run_hook(entry, payload, {**env, "PYTHONPYCACHEPREFIX": pycache}, cwd, cap))
+    warm_env = {**env, "PYTHONPYCACHEPREFIX": str(scratch / "pycache")}
+    run_hook(entry, payload, warm_env, cwd, cap)
+    for _ in range(runs):
+        result.warm.append(run_hook(entry, payload, warm_env, cwd, cap))
+    return result
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds < 10 else f"{seconds:.1f}s"
+
+
+def print_report(results: list[HookBenchmark]) -> None:
+    width = max([len(r.entry.label) for r in results] + [4])
+    print(f"{'hook':<{width}}  {'trigger':<12} {'cold p50':>9} {'p95':>7} {'max':>7}"
+          f"  {'warm p50':>9} {'p95':>7} {'max':>7}  {'timeout':>7}")
+    for r in results:
+        if r.skipped:
+            print(f"{r.entry.label:<{width}}  skipped: {r.skipped}")
+            continue
+        cold, warm = r.stats(r.cold), r.stats(r.warm)
+        print(f"{r.entry.label:<{width}}  {(r.trigger or '-')[:12]:<12} "
+              f"{_ms(cold[0]):>9} {_ms(cold[1]):>7} {_ms(cold[2]):>7}  "
+              f"{_ms(warm[0]):>9} {_ms(warm[1]):>7} {_ms(warm[2]):>7}  "
+              f"{r.entry.timeout:>6.0f}s{' async' if r.entry.is_async else ''}")
+    flagged = [r for r in results if r.near_timeout]
+    for r in flagged:
+        reason = (f"{r.timed_out} run(s) did not finish in time" if r.timed_out
+                  else f"p95 {_ms(r.p95)} is {r.p95 / r.entry.timeout:.0%} of its {r.entry.timeout:.0f}s timeout")
+        print(f"⚠ {r.entry.label}: {reason}")
+    for r in results:
+        failures = sum(run.returncode not in (0, None) for run in r.cold + r.warm)
+        if failures:
+            print(f"ℹ {r.entry.label}: non-zero exit in {failures}/{len(r.cold) + len(r.warm)} runs")
+    print(f"\n{len(results)} hook(s), {len(flagged)} near timeout")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the latency of every configured command hook")
+    parser.add_argument("path", nargs="?", default=".", help="Project directory (default: current directory)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, metavar="N",
+                        help=f"Cold and warm runs per hook (default: {DEFAULT_RUNS})")
+    parser.add_argument("--event", action="append", default=[], help="Only hooks of this event (repeatable)")
+    parser.add_argument("--source", action="append", default=[],
+                        help="Only hooks from this layer: user, project, local or plugin:<name> (repeatable)")
+    parser.add_argument("--file", help="File path put in tool payloads (default: a scratch file)")
+    parser.add_argument("--plugin-dir", action="append", default=[], help="Extra plugin root (repeatable)")
+    parser.add_argument("--no-plugins", action="store_true", help="Skip the project's plugins")
+    parser.add_argument("--home", type=Path, help="Home directory for the user layer (default: ~)")
+    parser.add_argument("--list", action="store_true", help="List the hooks and their triggers without running them")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format (default: text)")
+    args = parser.parse_args()
+
+    cwd = Path(args.path).resolve()
+    entries = [
+        e for e in discover_hooks(cwd, args.home, plugins=not args.no_plugins, extra_plugin_dirs=args.plugin_dir)
+        if (not args.event or e.event in args.event) and (not args.source or e.source in args.source)
+    ]
+    if args.list:
+        for e in entries:
+            print(f"{e.label}  trigger={pick_trigger(e)!r}  timeout={e.timeout:.0f}s  {e.type}: {e.command}")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="hook-bench-") as tmp:
+        scratch = Path(tmp)
+        sample = scratch / "sample.py"
+        sample.write_text("print('hello')\n", encoding="utf-8")
+        (scratch / "transcript.jsonl").touch()
+        file_path = str(Path(args.file).resolve()) if args.file else str(sample)
+        results = []
+        for entry in entries:
+            if args.format == "text":
+                print(f"… {entry.label}", file=sys.stderr)
+            results.append(benchmark(entry, cwd, scratch, max(args.runs, 1), file_path))
+
+    if args.format == "json":
+        json.dump([r.to_dict() for r in results], sys.stdout, indent=2)
+        print()
+    else:
+        print_report(results)
+    sys.exit(1 if any(r.near_timeout for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Per-tool hook overhead report
+
+One Edit can fire PreToolUse and PostToolUse hooks from the user, project
+and local settings and from every enabled plugin at once. This merges all
+those layers (validators.hook_config), resolves which hooks fire for each
+tool name with Claude Code's matcher semantics (validators.hook_dispatch)
+and reports per tool:
+
+- hooks:       how many distinct hooks can run for one call
+- worst case:  how long one call can be held up. Hooks of one event run in
+               parallel, so each event waits for its slowest blocking hook;
+               PreToolUse, PermissionRequest and PostToolUse run in turn
+- budget:      the sum of all blocking hooks' timeouts
+- measured:    the worst case from measured latencies, with --measured
+               <bench_hooks.py --format json output>
+
+Tools are the built-in tools, typical MCP tools and every tool name the
+matchers spell out. HOT_TOOLS, called in almost every turn, are marked and
+listed hook by hook. The text report ends with the measured match cost of
+each regex matcher (validators.matchers.match_cost_us), which the settings
+validators leave out because timings vary with the machine.
+
+Usage:
+    python hook_overhead.py [<project-dir>] [--measured bench.json] [--all]
+                            [--plugin-dir DIR] [--no-plugins] [--format text|json]
+"""
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Shared validators live in the plugin's hooks/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
+from validators.hook_config import HookEntry, discover_hooks  # noqa: E402
+from validators.hook_dispatch import (  # noqa: E402
+    TOOL_PHASE_EVENTS, ToolOverhead, hook_cost, load_measured_costs, tool_overhead,
+)
+from validators.matchers import (  # noqa: E402
+    MAX_COST_US, PLAIN_MATCHER, TOOL_NAME_CORPUS, analyze, match_cost_us, plain_alternation,
+)
+
+HOT_TOOLS = ("Edit", "Write", "Bash")
+
+
+def tool_names(entries: list[HookEntry]) -> list[str]:
+    """Known tools plus every name a tool-event matcher lists."""
+    names = list(TOOL_NAME_CORPUS)
+    for entry in entries:
+        if entry.event not in TOOL_PHASE_EVENTS or entry.matcher in ("", "*"):
+            continue
+        listed = entry.matcher if PLAIN_MATCHER.match(entry.matcher) else plain_alternation(entry.matcher)
+        names.extend((listed or "").split("|"))
+    return [n for n in dict.fromkeys(names) if n]
+
+
+def overhead_report(entries: list[HookEntry], measured: Optional[dict[str, float]] = None,
+                    include_idle: bool = False) -> list[ToolOverhead]:
+    """ToolOverhead per tool, most expensive first."""
+    rows = [tool_overhead(entries, tool) for tool in tool_names(entries)]
+    if not include_idle:
+        rows = [r for r in rows if r.hook_count]
+    return sorted(rows, key=lambda r: (-r.worst_case(measured), -r.hook_count, r.tool))
+
+
+def matcher_costs(entries: list[HookEntry]) -> dict[str, Optional[float]]:
+    """µs per tool name of each regex matcher on tool events; None when it can backtrack."""
+    costs: dict[str, Optional[float]] = {}
+    for entry in entries:
+        matcher = entry.matcher
+        if (entry.event not in TOOL_PHASE_EVENTS or matcher in ("", "*") or matcher in costs
+                or PLAIN_MATCHER.match(matcher)):
+            continue
+        try:
+            costs[matcher] = None if analyze(matcher).backtracking else match_cost_us(matcher)
+        except re.error:
+            continue
+    return costs
+
+
+def print_matcher_costs(costs: dict[str, Optional[float]]) -> None:
+    if not costs:
+        return
+    print(f"\nmatcher cost per tool name (limit {MAX_COST_US:.0f} µs):")
+    slowest_first = sorted(costs, key=lambda m: -(costs[m] if costs[m] is not None else float("inf")))
+    for matcher in slowest_first:
+        cost = costs[matcher]
+        if cost is None:
+            print(f"  ⚠ {matcher}  not timed, can backtrack catastrophically")
+        else:
+            print(f"  {'⚠' if cost > MAX_COST_US else ' '} {matcher}  {cost:.2f} µs")
+
+
+def _row_dict(row: ToolOverhead, measured: Optional[dict[str, float]]) -> dict:
+    return {
+        "tool": row.tool,
+        "hot": row.tool in HOT_TOOLS,
+        "hooks": row.hook_count,
+        "events": {event: [h.label for h in hooks] for event, hooks in row.events.items()},
+        "worst_case_seconds": row.worst_case(),
+        "timeout_budget_seconds": row.total_budget(),
+        "measured_seconds": row.worst_case(measured) if measured else None,
+    }
+
+
+def print_report(rows: list[ToolOverhead], measured: Optional[dict[str, float]]) -> None:
+    width = max([len(r.tool) for r in rows] + [4]) + 2
+    header = f"{'tool':<{width}} {'hooks':>5} {'pre':>4} {'perm':>4} {'post':>4} {'worst case':>11} {'budget':>8}"
+    print(header + (f" {'measured':>9}" if measured else ""))
+    for r in rows:
+        pre = len(r.events.get("PreToolUse", []))
+        perm = len(r.events.get("PermissionRequest", []))
+        post = len(r.events.get("PostToolUse", [])) + len(r.events.get("PostToolUseFailure", []))
+        name = ("★ " if r.tool in HOT_TOOLS else "  ") + r.tool
+        line = (f"{name:<{width}} {r.hook_count:>5} {pre:>4} {perm:>4} {post:>4} "
+                f"{r.worst_case():>10.0f}s {r.total_budget():>7.0f}s")
+        if measured:
+            line += f" {r.worst_case(measured) * 1000:>7.0f}ms"
+        print(line)
+
+    hot = [r for r in rows if r.tool in HOT_TOOLS]
+    for r in hot:
+        print(f"\n★ {r.tool}:")
+        for event, hooks in r.events.items():
+            for h in hooks:
+                measured_cost = measured and (h.label in measured or f"command:{h.command}" in measured)
+                cost = f"{hook_cost(h, measured) * 1000:.0f}ms measured" if measured_cost else f"timeout {h.timeout:.0f}s"
+                print(f"  {event:<18} {h.label}  ({cost}{', async' if h.is_async else ''})")
+    if not rows:
+        print("No hook fires on tool calls.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report the hook overhead each tool call carries")
+    parser.add_argument("path", nargs="?", default=".", help="Project directory (default: current directory)")
+    parser.add_argument("--measured", type=Path, help="bench_hooks.py --format json output with measured latencies")
+    parser.add_argument("--all", action="store_true", help="Also list tools no hook fires for")
+    parser.add_argument("--plugin-dir", action="append", default=[], help="Extra plugin root (repeatable)")
+    parser.add_argument("--no-plugins", action="store_true", help="Skip the project's plugins")
+    parser.add_argument("--home", type=Path, help="Home directory for the user layer (default: ~)")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format (default: text)")
+    args = parser.parse_args()
+
+    cwd = Path(args.path).resolve()
+    entries = discover_hooks(cwd, args.home, plugins=not args.no_plugins, extra_plugin_dirs=args.plugin_dir)
+    measured = load_measured_costs(args.measured) if args.measured else None
+    rows = overhead_report(entries, measured, include_idle=args.all)
+    if args.format == "json":
+        json.dump([_row_dict(r, measured) for r in rows], sys.stdout, indent=2)
+        print()
+    else:
+        print_report(rows, measured)
+        print_matcher_costs(matcher_costs(entries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Hook dispatch simulator
+
+Replays recorded sessions against a candidate hook configuration before it
+is rolled out, and estimates the latency it adds to each session. Traces
+are Claude Code session transcripts (a transcript file or a
+~/.claude/projects/<project>/ dir) or JSONL files of hook event payloads;
+see validators.hook_simulator for how events, matchers, "if" and "once"
+are resolved.
+
+The candidate is one or more --config files (settings.json or hooks.json
+shape); without one, the hooks currently configured for the project are
+simulated. --compare also simulates the current configuration and shows
+the difference.
+
+Costs are measured latencies from bench_hooks.py --format json (--measured)
+where available, and hook timeouts otherwise; the upper bound always uses
+timeouts.
+
+Usage:
+    python simulate_hooks.py <trace> [<trace> ...] [--config FILE ...] [--compare]
+                             [--measured bench.json] [--project DIR] [--format text|json]
+"""
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+# Shared validators live in the plugin's hooks/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
+from validators.hook_config import HookEntry, discover_hooks, file_hooks  # noqa: E402
+from validators.hook_dispatch import load_measured_costs  # noqa: E402
+from validators.hook_simulator import SessionResult, read_trace, simulate_sessions  # noqa: E402
+
+TOP_HOOKS = 10
+
+
+def candidate_hooks(configs: list[Path], project: Path, home: Optional[Path]) -> list[HookEntry]:
+    if not configs:
+        return discover_hooks(project, home)
+    return [entry for path in configs for entry in file_hooks(path, f"config:{path.name}")]
+
+
+def totals(results: list[SessionResult]) -> dict:
+    runs: Counter = Counter()
+    for r in results:
+        runs.update(r.hook_runs)
+    count = max(len(results), 1)
+    return {
+        "sessions": len(results),
+        "tool_calls": sum(r.tool_calls for r in results),
+        "hook_runs": sum(runs.values()),
+        "estimated_seconds": sum(r.estimated for r in results),
+        "upper_bound_seconds": sum(r.upper_bound for r in results),
+        "mean_estimated_seconds": sum(r.estimated for r in results) / count,
+        "runs_per_hook": dict(runs.most_common()),
+    }
+
+
+def _session_dict(r: SessionResult) -> dict:
+    return {"session": r.session, "events": r.events, "tool_calls": r.tool_calls,
+            "hook_runs": sum(r.hook_runs.values()), "estimated_seconds": r.estimated,
+            "upper_bound_seconds": r.upper_bound}
+
+
+def _s(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.1f}s"
+
+
+def print_report(results: list[SessionResult], baseline: Optional[list[SessionResult]]) -> None:
+    before = {r.session: r for r in baseline or []}
+    header = f"{'session':<14} {'events':>7} {'tool calls':>10} {'hook runs':>9} {'estimate':>9} {'upper bound':>11}"
+    print(header + (f" {'Δ estimate':>11}" if baseline is not None else ""))
+    for r in results:
+        line = (f"{r.session[:14]:<14} {r.events:>7} {r.tool_calls:>10} {sum(r.hook_runs.values()):>9} "
+                f"{_s(r.estimated):>9} {_s(r.upper_bound):>11}")
+        if baseline is not None:
+            delta = r.estimated - (before[r.session].estimated if r.session in before else 0.0)
+            line += f" {'+' if delta >= 0 else '-'}{_s(abs(delta)):>10}"
+        print(line)
+
+    summary = totals(results)
+    print(f"\n{summary['sessions']} session(s), {summary['tool_calls']} tool calls, "
+          f"{summary['hook_runs']} hook runs: {_s(summary['estimated_seconds'])} added "
+          f"({_s(summary['mean_estimated_seconds'])} per session), "
+          f"upper bound {_s(summary['upper_bound_seconds'])}")
+    if baseline is not None:
+        base = totals(baseline)
+        delta = summary["estimated_seconds"] - base["estimated_seconds"]
+        print(f"current configuration: {_s(base['estimated_seconds'])} added; "
+              f"candidate {'adds' if delta >= 0 else 'saves'} {_s(abs(delta))}")
+    if summary["runs_per_hook"]:
+        print("\nMost frequent hooks:")
+        for label, runs in list(summary["runs_per_hook"].items())[:TOP_HOOKS]:
+            print(f"  {runs:>6}  {label}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded sessions against a hook configuration")
+    parser.add_argument("traces", nargs="+", type=Path,
+                        help="Transcript .jsonl files, dirs of them, or JSONL hook-event files")
+    parser.add_argument("--config", action="append", type=Path, default=[],
+                        help="Candidate settings.json / hooks.json (repeatable; default: current project hooks)")
+    parser.add_argument("--compare", action="store_true", help="Also simulate the current project hooks")
+    parser.add_argument("--measured", type=Path, help="bench_hooks.py --format json output with measured latencies")
+    parser.add_argument("--project", type=Path, default=Path("."), help="Project directory (default: .)")
+    parser.add_argument("--home", type=Path, help="Home directory for the user layer (default: ~)")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format (default: text)")
+    args = parser.parse_args()
+
+    missing = [str(p) for p in args.traces + args.config if not p.exists()]
+    if missing:
+        parser.error(f"not found: {', '.join(missing)}")
+    project = args.project.resolve()
+    sessions = read_trace(args.traces)
+    measured = load_measured_costs(args.measured) if args.measured else None
+    results = simulate_sessions(candidate_hooks(args.config, project, args.home), sessions, measured)
+    baseline = None
+    if args.compare:
+        baseline = simulate_sessions(discover_hooks(project, args.home), sessions, measured)
+
+    if args.format == "json":
+        data = {"sessions": [_session_dict(r) for r in results], "totals": totals(results)}
+        if baseline is not None:
+            data["baseline"] = {"sessions": [_session_dict(r) for r in baseline], "totals": totals(baseline)}
+        json.dump(data, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
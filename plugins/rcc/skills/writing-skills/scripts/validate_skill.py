@@ -1,23 +1,49 @@
 #!/usr/bin/env python3
-"""Validate a Claude Code skill structure and content."""
+"""Validate a Claude Code skill structure and content.
+
+--format jsonl streams one JSON record per finding to stdout; --format sarif
+prints a SARIF 2.1.0 log. Both replace the text output.
+"""
 
 import argparse
+import contextlib
+import io
 import re
 import sys
+import time
 from pathlib import Path
+from typing import Callable, Optional
+
+# Shared validators live in the plugin's hooks/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
+from validators import documents, profiling  # noqa: E402
+from validators.formats import Finding, JsonlWriter, write_sarif  # noqa: E402
+from validators.scanner import MarkdownDoc  # noqa: E402
 
 ERRORS = []
 WARNINGS = []
 
+# Machine-readable output: each finding also goes to SINK, timed from the
+# start of the run.
+SINK: Optional[Callable[[Finding], None]] = None
+_run = {"path": "", "start": 0.0}
+
+
+def _emit(severity: str, msg: str) -> None:
+    if SINK is not None:
+        SINK(Finding.of(_run["path"], msg, severity, time.perf_counter() - _run["start"]))
+
 
 def error(msg: str) -> None:
     """Record an error message."""
     ERRORS.append(f"❌ {msg}")
+    _emit("error", msg)
 
 
 def warn(msg: str) -> None:
     """Record a warning message."""
     WARNINGS.append(f"⚠️  {msg}")
+    _emit("warning", msg)
 
 
 def ok(msg: str) -> None:
@@ -40,25 +66,17 @@ def validate_structure(skill_dir: Path) -> None:
     ok("SKILL.md exists")
 
 
-def validate_frontmatter(content: str) -> dict:
+def validate_frontmatter(doc: MarkdownDoc) -> dict:
     """Validate YAML frontmatter."""
-    if not content.startswith("---"):
+    if not doc.frontmatter_open:
         error("Missing YAML frontmatter (must start with ---)")
         return {}
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    if doc.frontmatter is None:
         error("Invalid frontmatter format (missing closing ---)")
         return {}
 
-    frontmatter = parts[1].strip()
-
-    # Parse simple YAML
-    data = {}
-    for line in frontmatter.split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            data[key.strip()] = value.strip()
+    data = doc.frontmatter
 
     _validate_name_field(data)
     _validate_description_field(data)
@@ -99,13 +117,12 @@ def _validate_description_field(data: dict) -> None:
         ok(f"description: {desc[:50]}...")
 
 
-def validate_body(content: str) -> None:
+def validate_body(doc: MarkdownDoc) -> None:
     """Validate SKILL.md body."""
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    if doc.frontmatter is None:
         return
 
-    body = parts[2].strip()
+    body = doc.body.strip()
     lines = body.split("\n")
 
     # Check length (house rule < 300; official recommendation < 500).
@@ -122,17 +139,19 @@ def validate_body(content: str) -> None:
         warn("'When to use' should be in description, not body")
 
 
+@documents.run()
 def validate_skill(skill_dir: Path) -> bool:
     """Run all validations."""
+    _run.update(path=str(skill_dir / "SKILL.md"), start=time.perf_counter())
     print(f"\nValidating: {skill_dir}\n")
 
     validate_structure(skill_dir)
     if ERRORS:
         return False
 
-    content = (skill_dir / "SKILL.md").read_text()
-    validate_frontmatter(content)
-    validate_body(content)
+    doc = documents.load(skill_dir / "SKILL.md")
+    validate_frontmatter(doc)
+    validate_body(doc)
 
     # Print results
     print()
@@ -155,9 +174,34 @@ def main() -> None:
     """Entry point for skill validation CLI."""
     parser = argparse.ArgumentParser(description="Validate a skill")
     parser.add_argument("path", help="Path to skill directory")
+    parser.add_argument("--format", choices=("text", "jsonl", "sarif"), default="text",
+                        help="Output format (default: text)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile this run into .rcc/profiles/ (also RCC_PROFILE=1)")
 
     args = parser.parse_args()
-    success = validate_skill(Path(args.path))
+    profiling.start(Path.cwd(), "validate-skill", force=args.profile)
+    if args.format == "text":
+        success = validate_skill(Path(args.path))
+        sys.exit(0 if success else 1)
+
+    global SINK
+    out = sys.stdout
+    findings: list[Finding] = []
+    jsonl = JsonlWriter(out) if args.format == "jsonl" else None
+
+    def sink(finding: Finding) -> None:
+        findings.append(finding)
+        if jsonl is not None:
+            jsonl.finding(finding)
+
+    SINK = sink
+    with contextlib.redirect_stdout(io.StringIO()):
+        success = validate_skill(Path(args.path))
+    if jsonl is not None:
+        jsonl.file_done(_run["path"], len(findings), time.perf_counter() - _run["start"])
+    else:
+        write_sarif(findings, out, "rcc-validate-skill")
     sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark trigger-overlap detection: indexed (validators.overlap) vs pairwise.
+
+Usage:
+    python tests/hooks/bench_trigger_overlap.py [--sizes 500,1000,...] [--pairwise-max N]
+
+Descriptions are synthetic: 3-8 words from a fixed, Zipf-distributed set of
+common words plus 5-16 words of one topic; the number of topics grows with
+the catalog, as aggregated marketplaces add domains rather than repeat them.
+One near-copy is planted per 50 skills. The indexed time per
+skill should stay roughly flat as the number of skills doubles; the pairwise
+time quadruples.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "plugins/rcc/hooks"))
+from validators.overlap import OVERLAP_THRESHOLD, find_overlaps, overlap_ratio, trigger_words  # noqa: E402
+
+COMMON_WORDS = 300      # words any skill may use ("create", "review", "test", ...)
+SKILLS_PER_TOPIC = 20   # new skills bring new domains: topics grow with the catalog
+TOPIC_WORDS = 40
+
+
+def make_descriptions(n: int, seed: int = 0) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    common = [f"c{i}" for i in range(COMMON_WORDS)]
+    cum_weights = list(itertools.accumulate(1 / (i + 1) for i in range(COMMON_WORDS)))
+    topics = max(n // SKILLS_PER_TOPIC, 1)
+    entries: list[tuple[str, str]] = []
+    for i in range(n):
+        if i % 50 == 49:
+            _, base = entries[rng.randrange(len(entries))]
+            picked = base.split()[2:]
+            picked[rng.randrange(len(picked))] = f"t{rng.randrange(topics)}-{rng.randrange(TOPIC_WORDS)}"
+        else:
+            topic = rng.randrange(topics)
+            picked = (rng.choices(common, cum_weights=cum_weights, k=rng.randint(3, 8))
+                      + [f"t{topic}-{w}" for w in rng.sample(range(TOPIC_WORDS), rng.randint(5, 16))])
+        entries.append((f"skill-{i}", "Use when " + " ".join(picked)))
+    return entries
+
+
+def pairwise(entries: list[tuple[str, str]]) -> list[tuple[str, str, float]]:
+    words = [trigger_words(d) for _, d in entries]
+    found = []
+    for i in range(len(entries)):
+        for j in range(i + 1, len(entries)):
+            ratio = overlap_ratio(words[i], words[j])
+            if ratio > OVERLAP_THRESHOLD:
+                found.append((entries[i][0], entries[j][0], ratio))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,2000,4000,8000,16000,32000")
+    parser.add_argument("--pairwise-max", type=int, default=4000,
+                        help="Largest size also run pairwise (default: 4000)")
+    args = parser.parse_args()
+
+    print(f"{'skills':>8} {'indexed s':>10} {'us/skill':>9} {'candidates':>11} {'pairs':>6} {'pairwise s':>11}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        entries = make_descriptions(n)
+        stats: dict[str, int] = {}
+        start = time.perf_counter()
+        found = find_overlaps(entries, stats=stats)
+        indexed = time.perf_counter() - start
+        brute = ""
+        if n <= args.pairwise_max:
+            start = time.perf_counter()
+            expected = pairwise(entries)
+            brute = f"{time.perf_counter() - start:.3f}"
+            assert [p[:2] for p in found] == [p[:2] for p in expected], "indexed result differs"
+        print(f"{n:>8} {indexed:>10.3f} {indexed / n * 1e6:>9.1f} {stats['candidates']:>11} "
+              f"{len(found):>6} {brute:>11}")
+
+
+if __name__ == "__main__":
+    main()
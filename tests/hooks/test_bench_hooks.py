@@ -0,0 +1,61 @@
+"""Tests for the hook latency benchmark (writing-hooks/scripts/bench_hooks.py)."""
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/skills/writing-hooks/scripts/bench_hooks.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load bench_hooks as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("bench_hooks", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _write_settings(project: Path, hooks: dict) -> None:
+    (project / ".claude").mkdir(parents=True, exist_ok=True)
+    (project / ".claude" / "settings.json").write_text(json.dumps({"hooks": hooks}))
+
+
+def test_discovers_hooks_from_settings_layers_and_plugins(tmp_path):
+    mod = _load_module()
+    from validators.hook_config import discover_hooks
+    home, project = tmp_path / "home", tmp_path / "project"
+    _write_settings(home, {"PreToolUse": [{"matcher": "Bash", "hooks": [{"type": "command", "command": "a"}]}]})
+    _write_settings(project, {"PostToolUse": [{"matcher": "Edit", "hooks": [{"type": "command", "command": "b"}]}]})
+    plugin = project / "plugins" / "p"
+    (plugin / ".claude-plugin").mkdir(parents=True)
+    (plugin / ".claude-plugin" / "plugin.json").write_text('{"name": "p"}')
+    (plugin / "hooks").mkdir()
+    (plugin / "hooks" / "hooks.json").write_text(json.dumps(
+        {"hooks": {"Stop": [{"hooks": [{"type": "prompt", "prompt": "x"}]}]}}))
+
+    entries = discover_hooks(project, home)
+    assert [(e.source, e.event, e.matcher) for e in entries] == [
+        ("user", "PreToolUse", "Bash"), ("project", "PostToolUse", "Edit"), ("plugin:p", "Stop", ""),
+    ]
+    assert entries[2].timeout == 30 and entries[2].plugin_root == plugin.resolve()
+    assert mod.pick_trigger(entries[0]) == "Bash"
+
+
+def test_benchmark_times_hook_and_flags_p95_near_timeout(tmp_path):
+    mod = _load_module()
+    from validators.hook_config import discover_hooks
+    slow = f'{sys.executable} -c "import sys, time; sys.stdin.read(); time.sleep(0.6)"'
+    fast = f'{sys.executable} -c "import sys, json; json.load(sys.stdin)"'
+    _write_settings(tmp_path, {"PostToolUse": [
+        {"matcher": "^(Write|Edit)$", "hooks": [{"type": "command", "command": slow, "timeout": 1}]},
+        {"matcher": "Edit", "hooks": [{"type": "command", "command": fast, "timeout": 30}]},
+        {"matcher": "mcp__none__.*", "hooks": [{"type": "command", "command": fast}]},
+    ]})
+    entries = discover_hooks(tmp_path, tmp_path / "home", plugins=False)
+    results = [mod.benchmark(e, tmp_path, tmp_path, runs=1, file_path=str(tmp_path / "x.py")) for e in entries]
+
+    assert results[0].trigger == "Edit" and len(results[0].cold) == len(results[0].warm) == 1
+    assert results[0].near_timeout
+    assert not results[1].near_timeout and results[1].warm[0].returncode == 0
+    assert results[2].skipped == "no known tool matches 'mcp__none__.*'"
@@ -0,0 +1,63 @@
+"""Tests for the hook phase metrics (validators/metrics.py, hook_metrics.py)."""
+import importlib.util
+import io
+import json
+import sys
+import types
+from pathlib import Path
+
+HOOKS = Path(__file__).parent.parent.parent / "plugins/rcc/hooks"
+
+
+def _load_module(name: str) -> types.ModuleType:
+    """Load a hook script as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location(name, HOOKS / f"{name}.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_ring_buffer_keeps_the_last_capacity_records(tmp_path, monkeypatch):
+    _load_module("hook_metrics")
+    from validators import metrics
+    monkeypatch.setattr(metrics, "CAPACITY", 4)
+    for i in range(10):
+        with metrics.invocation(tmp_path, "hook"):
+            with metrics.span("discovery"):
+                pass
+            metrics.add("imports", i / 1000)
+    ring = metrics.ring_path(tmp_path)
+    assert ring.stat().st_size == metrics.HEADER_SIZE + 4 * metrics.SLOT_SIZE
+    records = metrics.load(tmp_path)
+    assert [r["seq"] for r in records] == [6, 7, 8, 9]
+    assert records[-1]["spans"]["imports"] == 9000
+    assert (tmp_path / ".rcc" / "metrics" / ".gitignore").read_text() == "*\n"
+
+    monkeypatch.setenv(metrics.METRICS_ENV, "0")
+    with metrics.invocation(tmp_path, "hook"):
+        pass
+    assert len(metrics.load(tmp_path)) == 4
+
+
+def test_hook_call_records_phases_and_validators(tmp_path, monkeypatch):
+    frontmatter = _load_module("validate_frontmatter")
+    summary_mod = _load_module("hook_metrics")
+    skill = tmp_path / ".claude" / "skills" / "foo" / "SKILL.md"
+    skill.parent.mkdir(parents=True)
+    skill.write_text("---\nname: foo\ndescription: Use when testing metrics\n---\n# Foo\n")
+    payload = {"tool_name": "Edit", "cwd": str(tmp_path), "tool_input": {"file_path": str(skill)}}
+    monkeypatch.setattr(frontmatter.daemon, "request", lambda cwd, raw: None)
+    monkeypatch.setattr(sys, "stdin", types.SimpleNamespace(buffer=io.BytesIO(json.dumps(payload).encode())))
+    try:
+        frontmatter.main()
+    except SystemExit:
+        pass
+
+    record, = frontmatter.metrics.load(tmp_path)
+    assert record["entry"] == "hook" and record["tool"] == "Edit"
+    assert {"imports", "daemon", "discovery", "read", "validator:skill_md"} <= set(record["spans"])
+    assert record["total_us"] >= record["spans"]["validator:skill_md"]
+
+    summary = summary_mod.summarize([record])
+    assert next(iter(summary["phases"])) == "total"
+    assert summary["validators"]["skill_md"]["count"] == 1
@@ -0,0 +1,72 @@
+"""Tests for the per-tool hook overhead report (writing-hooks/scripts/hook_overhead.py)."""
+import importlib.util
+import json
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/skills/writing-hooks/scripts/hook_overhead.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load hook_overhead as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("hook_overhead", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _hook(command: str, timeout: int, **extra) -> dict:
+    return {"type": "command", "command": command, "timeout": timeout, **extra}
+
+
+def _settings(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+def _plugin(root: Path, name: str, hooks: dict) -> None:
+    (root / ".claude-plugin").mkdir(parents=True)
+    (root / ".claude-plugin" / "plugin.json").write_text(json.dumps({"name": name}))
+    _settings(root / "hooks" / "hooks.json", {"hooks": hooks})
+
+
+def test_overhead_merges_layers_and_waits_for_slowest_hook_per_event(tmp_path):
+    mod = _load_module()
+    from validators.hook_config import discover_hooks
+    home, project = tmp_path / "home", tmp_path / "project"
+    _settings(home / ".claude" / "settings.json", {"hooks": {
+        "PreToolUse": [{"matcher": "Bash", "hooks": [_hook("guard", 5)]}],
+        "PostToolUse": [{"matcher": "Edit|Write", "hooks": [_hook("fmt", 30), _hook("notify", 60, **{"async": True})]}],
+    }})
+    _settings(project / ".claude" / "settings.json", {"hooks": {
+        "PostToolUse": [{"matcher": "^(Edit|MultiEdit)$", "hooks": [_hook("lint", 20), _hook("fmt", 30)]}],
+    }})
+    _settings(project / ".claude" / "settings.local.json", {"enabledPlugins": {"off@market": False}})
+    _plugin(project / "plugins" / "on", "on", {"PostToolUse": [{"matcher": "*", "hooks": [_hook("audit", 10)]}]})
+    _plugin(project / "plugins" / "off", "off", {"PostToolUse": [{"matcher": "*", "hooks": [_hook("slow", 600)]}]})
+
+    rows = {r.tool: r for r in mod.overhead_report(discover_hooks(project, home))}
+    edit = rows["Edit"]
+    # fmt is declared twice but runs once; async notify never blocks
+    assert sorted(h.command for h in edit.hooks()) == ["audit", "fmt", "lint", "notify"]
+    assert edit.worst_case() == 30 and edit.total_budget() == 60
+    assert rows["Bash"].worst_case() == 5 + 10
+    assert "MultiEdit" in rows and "slow" not in [h.command for r in rows.values() for h in r.hooks()]
+    assert next(iter(rows)) == "Edit"    # most expensive first
+
+    measured = {h.label: 0.2 for h in edit.hooks()}
+    assert edit.worst_case(measured) == 0.2
+
+
+def test_matcher_costs_time_regex_matchers_only(tmp_path):
+    mod = _load_module()
+    from validators.hook_config import discover_hooks
+    project = tmp_path / "project"
+    _settings(project / ".claude" / "settings.json", {"hooks": {"PreToolUse": [
+        {"matcher": "Edit|Write", "hooks": [_hook("a", 5)]},
+        {"matcher": "^mcp__.*", "hooks": [_hook("b", 5)]},
+        {"matcher": "(\\w+)+!", "hooks": [_hook("c", 5)]},
+    ]}})
+    costs = mod.matcher_costs(discover_hooks(project, tmp_path / "home", plugins=False))
+    assert set(costs) == {"^mcp__.*", "(\\w+)+!"}
+    assert costs["(\\w+)+!"] is None and costs["^mcp__.*"] > 0
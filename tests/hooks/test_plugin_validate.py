@@ -0,0 +1,65 @@
+"""Tests for the background plugin-validate jobs (plugin_validate.py)."""
+import importlib.util
+import os
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/hooks/plugin_validate.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load plugin_validate as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("plugin_validate", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _make_plugin(tmp_path: Path) -> Path:
+    plugin_dir = tmp_path / "my-plugin"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text('{"name":"x"}')
+    return plugin_dir
+
+
+def test_burst_of_requests_coalesces_into_one_run(tmp_path, monkeypatch):
+    mod = _load_module()
+    jobs = mod.plugin_jobs
+    plugin_dir = _make_plugin(tmp_path)
+    spawned = []
+    monkeypatch.setattr(jobs, "_spawn_worker", lambda cwd, pd: spawned.append(pd))
+    for _ in range(3):
+        jobs.schedule(tmp_path, plugin_dir)
+    calls = []
+
+    def check(pd):
+        calls.append(pd)
+        return ["plugin validate: bad manifest"]
+
+    assert jobs.run_worker(tmp_path, plugin_dir, check, debounce=0)
+    assert len(calls) == 1
+    assert jobs.job_status(tmp_path)[0]["state"] == "done"
+
+
+def test_finished_result_is_reported_once(tmp_path, monkeypatch):
+    mod = _load_module()
+    jobs = mod.plugin_jobs
+    plugin_dir = _make_plugin(tmp_path)
+    monkeypatch.setattr(jobs, "_spawn_worker", lambda cwd, pd: None)
+    jobs.schedule(tmp_path, plugin_dir)
+    jobs.run_worker(tmp_path, plugin_dir, lambda pd: ["plugin validate: oops"], debounce=0)
+    assert jobs.collect_unreported(tmp_path) == [(plugin_dir, ["plugin validate: oops"])]
+    assert jobs.collect_unreported(tmp_path) == []
+
+
+def test_schedule_skips_spawn_while_worker_alive(tmp_path, monkeypatch):
+    mod = _load_module()
+    jobs = mod.plugin_jobs
+    plugin_dir = _make_plugin(tmp_path)
+    spawned = []
+    monkeypatch.setattr(jobs, "_spawn_worker", lambda cwd, pd: spawned.append(pd))
+    jobs.schedule(tmp_path, plugin_dir)
+    _, lock, _ = jobs._job_paths(tmp_path, plugin_dir)
+    lock.write_text(str(os.getpid()))
+    jobs.schedule(tmp_path, plugin_dir)
+    assert len(spawned) == 1
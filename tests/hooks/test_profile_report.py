@@ -0,0 +1,73 @@
+"""Tests for the on-demand profiling mode (validators/profiling.py, profile_report.py)."""
+import importlib.util
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/hooks/profile_report.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load profile_report as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("profile_report", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _leaf(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _walk(depth: int) -> int:
+    return _leaf(50000) if depth == 0 else _walk(depth - 1)
+
+
+def _work() -> int:
+    return _walk(3) + _leaf(2000)
+
+
+def test_session_is_off_unless_enabled(tmp_path, monkeypatch):
+    profiling = _load_module().profiling
+    monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+    with profiling.session(tmp_path, "hook") as profile:
+        _work()
+    assert profile is None
+    assert not profiling.profiles_dir(tmp_path).exists()
+
+
+def test_runs_aggregate_into_collapsed_stacks_and_top_table(tmp_path, monkeypatch):
+    profiling = _load_module().profiling
+    monkeypatch.setattr(profiling, "MAX_RUNS", 2)
+    monkeypatch.setenv(profiling.PROFILE_ENV, "1")
+    for _ in range(3):
+        with profiling.session(tmp_path, "validate-all"):
+            with profiling.session(tmp_path, "nested"):   # part of the outer run
+                _work()
+
+    assert len(profiling.run_files(tmp_path, "validate-all")) == 2
+    assert profiling.entries(tmp_path) == ["validate-all"]
+    directory = profiling.profiles_dir(tmp_path)
+    assert (directory / ".gitignore").read_text() == "*\n"
+    assert (directory / "validate-all.top.txt").read_text().startswith("2 run(s), top")
+
+    stacks = {}
+    for line in (directory / "validate-all.collapsed").read_text().splitlines():
+        stack, _, us = line.rpartition(" ")
+        stacks[stack] = int(us)
+    names = {";".join(frame.split(" ")[0] for frame in stack.split(";")): us for stack, us in stacks.items()}
+    # own time is split over the call paths (25x more work via _walk, so
+    # scheduling noise cannot flip the order); self-recursion folds into one frame
+    direct = names["_work;_leaf;<built-in;<genexpr>"]
+    via_walk = names["_work;_walk;_leaf;<built-in;<genexpr>"]
+    assert via_walk > direct > 0
+    assert not any(name.startswith(("_walk", "_leaf", "<genexpr>")) for name in names)
+
+
+def test_rejected_invocation_leaves_no_profile(tmp_path):
+    validate_all = SCRIPT.parent / "validate_all.py"
+    result = subprocess.run([sys.executable, str(validate_all), "--watch", "--format", "jsonl", "--profile"],
+                            cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 2 and "--watch only writes" in result.stderr
+    assert not (tmp_path / ".rcc" / "profiles").exists()
@@ -0,0 +1,111 @@
+"""Tests for the hook dispatch simulator (writing-hooks/scripts/simulate_hooks.py)."""
+import importlib.util
+import json
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/skills/writing-hooks/scripts/simulate_hooks.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load simulate_hooks as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("simulate_hooks", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _transcript(path: Path) -> None:
+    def assistant(*calls):
+        return {"type": "assistant", "sessionId": "s1", "message": {"content": [
+            {"type": "tool_use", "id": cid, "name": name, "input": tool_input} for cid, name, tool_input in calls]}}
+
+    def results(*ids, error=False):
+        return {"type": "user", "sessionId": "s1", "message": {"content": [
+            {"type": "tool_result", "tool_use_id": cid, "is_error": error} for cid in ids]}}
+
+    records = [
+        {"type": "user", "sessionId": "s1", "message": {"content": "fix the parser"}},
+        assistant(("t1", "Edit", {"file_path": "/p/src/parser.py"}), ("t2", "Bash", {"command": "git status"})),
+        results("t1", "t2"),
+        assistant(("t3", "Edit", {"file_path": "/p/README.md"})),
+        results("t3"),
+        assistant(("t4", "Bash", {"command": "pytest -q"})),
+        results("t4", error=True),
+        {"type": "user", "sessionId": "s1", "message": {"content": "thanks"}},
+    ]
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+
+def test_simulator_replays_transcript_with_if_and_once(tmp_path):
+    mod = _load_module()
+    _transcript(tmp_path / "s1.jsonl")
+    config = tmp_path / "candidate.json"
+    config.write_text(json.dumps({"hooks": {
+        "SessionStart": [{"hooks": [{"type": "command", "command": "warm", "timeout": 10, "once": True}]}],
+        "PostToolUse": [{"matcher": "Edit|Write", "hooks": [
+            {"type": "command", "command": "ruff", "timeout": 20, "if": "Edit(*.py)"},
+            {"type": "command", "command": "fmt", "timeout": 5},
+        ]}],
+        "PostToolUseFailure": [{"matcher": "Bash", "hooks": [{"type": "command", "command": "log", "timeout": 2}]}],
+        "Stop": [{"hooks": [{"type": "command", "command": "verify", "timeout": 60, "once": True}]}],
+    }}))
+
+    sessions = mod.read_trace([tmp_path / "s1.jsonl"])
+    events = [e.event for e in sessions["s1"]]
+    assert events.count("PreToolUse") == 4 and events.count("Stop") == 2
+    assert events.count("PostToolUseFailure") == 1 and events[-1] == "SessionEnd"
+
+    entries = mod.candidate_hooks([config], tmp_path, None)
+    result, = mod.simulate_sessions(entries, sessions, measured={entries[1].label: 0.5})
+    runs = {label.split()[1] + " " + label.split()[-1]: n for label, n in result.hook_runs.items()}
+    # ruff only runs for the .py edit, Stop's "once" hook only in the first turn
+    assert runs == {"SessionStart[*] #0.0": 1, "PostToolUse[Edit|Write] #0.0": 1,
+                    "PostToolUse[Edit|Write] #0.1": 2, "PostToolUseFailure[Bash] #0.0": 1, "Stop[*] #0.0": 1}
+    assert result.tool_calls == 4
+    assert result.upper_bound == 10 + 20 + 5 + 2 + 60
+    assert result.estimated == 10 + 5 + 5 + 2 + 60     # ruff measured at 0.5s, under fmt's 5s timeout
+
+
+def test_simulator_reads_hook_event_payloads_and_if_rules(tmp_path):
+    mod = _load_module()
+    from validators.hook_simulator import if_rule_matches
+    (tmp_path / "events.jsonl").write_text("\n".join(json.dumps(r) for r in [
+        {"session_id": "a", "hook_event_name": "SessionStart", "source": "resume"},
+        {"session_id": "a", "hook_event_name": "PreToolUse", "tool_name": "Bash", "tool_input": {"command": "ls"}},
+        {"session_id": "b", "event": "PostToolUse", "tool_name": "Write", "tool_input": {}},
+    ]))
+    sessions = mod.read_trace([tmp_path])
+    assert [(e.event, e.value) for e in sessions["a"]] == [("SessionStart", "resume"), ("PreToolUse", "Bash")]
+    assert [(e.event, e.value) for e in sessions["b"]] == [("PostToolUse", "Write")]
+
+    assert if_rule_matches("Bash(git *)", "Bash", {"command": "git push"})
+    assert if_rule_matches("Bash(npm run test:*)", "Bash", {"command": "npm run test -- -x"})
+    assert not if_rule_matches("Bash(git *)", "Edit", {"file_path": "git x"})
+    assert not if_rule_matches("Edit(*.ts)", "Edit", {"file_path": "/p/a.py"})
+
+
+def test_simulator_applies_if_rules_before_merging_identical_handlers(tmp_path):
+    mod = _load_module()
+    from validators.hook_simulator import TraceEvent
+    config = tmp_path / "candidate.json"
+    config.write_text(json.dumps({"hooks": {"PostToolUse": [
+        {"matcher": "Edit", "hooks": [{"type": "command", "command": "lint", "if": "Edit(*.ts)"}]},
+        {"matcher": "Edit", "hooks": [{"type": "command", "command": "lint", "if": "Edit(*.py)"}]},
+    ]}}))
+    entries = mod.candidate_hooks([config], tmp_path, None)
+    events = {"s": [TraceEvent("PostToolUse", "Edit", {"file_path": "/p/a.py"}),
+                    TraceEvent("PostToolUse", "Edit", {"file_path": "/p/a.md"})]}
+    result, = mod.simulate_sessions(entries, events)
+    assert sum(result.hook_runs.values()) == 1
+
+
+def test_frontmatter_hook_runs_only_for_bash_calls_that_remove_files():
+    mod = _load_module()
+    from validators.hook_config import plugin_hooks
+    from validators.hook_simulator import TraceEvent
+    entries = plugin_hooks(SCRIPT.parents[3])
+    events = {"s": [TraceEvent("PostToolUse", "Bash", {"command": command})
+                    for command in ("git status", "pytest -q", "rm -r skills/old", "git mv a.md b.md")]}
+    result, = mod.simulate_sessions(entries, events)
+    assert sum(result.hook_runs.values()) == 2
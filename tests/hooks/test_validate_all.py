@@ -0,0 +1,223 @@
+"""Tests for the batch validator (validate_all.py)."""
+import importlib.util
+import json
+import subprocess
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/hooks/validate_all.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load validate_all as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("validate_all", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _make_project(tmp_path: Path) -> None:
+    plugin_dir = tmp_path / "my-plugin"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text('{"name":"Bad Name"}')
+    for i in range(6):
+        skill_dir = plugin_dir / "skills" / f"skill-{i}"
+        skill_dir.mkdir(parents=True)
+        extra = "tags: x\n" if i % 2 else ""
+        (skill_dir / "SKILL.md").write_text(f"---\nname: skill-{i}\ndescription: x\n{extra}---\n# Body\n")
+    (plugin_dir / "agents").mkdir()
+    (plugin_dir / "agents" / "helper.md").write_text("---\nname: helper\ndescription: x\n---\n")
+
+
+def test_parallel_run_matches_serial_run(tmp_path):
+    mod = _load_module()
+    _make_project(tmp_path)
+    serial = mod.validate_all(tmp_path)
+    (tmp_path / ".rcc" / "cache" / "results.jsonl").unlink()  # make workers do the work
+    streamed = []
+    parallel = mod.validate_all(tmp_path, jobs=3, on_result=lambda rel, w: streamed.append(rel))
+    assert parallel == serial
+    assert list(parallel) == list(serial)
+    assert sorted(streamed) == sorted(
+        [f"my-plugin/skills/skill-{i}/SKILL.md" for i in range(6)]
+        + ["my-plugin/agents/helper.md", "my-plugin/.claude-plugin/plugin.json"]
+    )
+
+
+def test_cli_cross_check_warnings_follow_native_ones(tmp_path, monkeypatch):
+    mod = _load_module()
+    _make_project(tmp_path)
+    # CLI checks run on threads, so the patched function is the one called
+    monkeypatch.setattr(mod, "check_plugin_validate", lambda plugin_dir: ["plugin validate: cli"])
+    results = mod.validate_all(tmp_path, cli_cross_check=True, jobs=2)
+    warnings = results["my-plugin/.claude-plugin/plugin.json"]
+    assert warnings[-1] == "plugin validate: cli"
+    assert len(warnings) > 1
+
+
+def _git(tmp_path: Path, *args: str) -> None:
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                   cwd=tmp_path, check=True, capture_output=True)
+
+
+def test_changed_since_validates_only_affected_components(tmp_path):
+    mod = _load_module()
+    _make_project(tmp_path)
+    plugin_dir = tmp_path / "my-plugin"
+    (plugin_dir / "shared.md").write_text("# Shared")
+    linking = plugin_dir / "skills" / "skill-0" / "SKILL.md"
+    linking.write_text("---\nname: skill-0\ndescription: x\n---\n[shared](../../shared.md)\n")
+    (plugin_dir / "skills" / "skill-2" / "notes.md").write_text("# Notes")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    mod.validate_all(tmp_path)  # persists the link graph
+
+    (plugin_dir / "shared.md").unlink()
+    (plugin_dir / "skills" / "skill-2" / "notes.md").write_text("# Notes, edited")
+    changed = mod.changes.changed_paths(tmp_path, since="HEAD")
+    assert changed == [plugin_dir / "shared.md", plugin_dir / "skills" / "skill-2" / "notes.md"]
+
+    streamed = []
+    results = mod.validate_all(tmp_path, changed=changed, on_result=lambda rel, w: streamed.append(rel))
+    assert sorted(streamed) == [
+        "my-plugin/.claude-plugin/plugin.json",  # a path inside the plugin was deleted
+        "my-plugin/skills/skill-0/SKILL.md",     # links to the deleted file
+        "my-plugin/skills/skill-2/SKILL.md",     # owns the edited reference
+    ]
+    assert "broken link: ../../shared.md" in results["my-plugin/skills/skill-0/SKILL.md"]
+
+
+def test_gitignored_claude_dir_is_still_validated(tmp_path):
+    mod = _load_module()
+    (tmp_path / ".gitignore").write_text(".claude/\n")
+    for sub, body in (("skills/local/SKILL.md", "---\nname: local\ndescription: x\ntags: x\n---\n"),
+                      ("agents/helper.md", "---\nname: helper\n---\n"),
+                      ("rules/style.md", "---\nbogus: x\n---\n")):
+        (tmp_path / ".claude" / sub).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / ".claude" / sub).write_text(body)
+    _git(tmp_path, "init", "-q")
+    results = mod.validate_all(tmp_path)
+    assert set(results) == {".claude/skills/local/SKILL.md", ".claude/agents/helper.md", ".claude/rules/style.md"}
+
+
+def test_changed_manifest_validates_whole_plugin(tmp_path):
+    mod = _load_module()
+    _make_project(tmp_path)
+    plugin_json = tmp_path / "my-plugin" / ".claude-plugin" / "plugin.json"
+    results = mod.validate_all(tmp_path, changed=[plugin_json])
+    full = mod.validate_all(tmp_path)
+    assert results == full
+
+
+def test_history_reports_new_and_fixed_warnings(tmp_path):
+    mod = _load_module()
+    history = mod.history
+    assert not history.record(tmp_path, {"a/SKILL.md": ["w1"], "b/SKILL.md": []}, full=True).has_baseline
+    delta = history.record(tmp_path, {"a/SKILL.md": [], "b/SKILL.md": ["w2"]}, full=True)
+    assert delta.new == {"b/SKILL.md": ["w2"]}
+    assert delta.fixed == {"a/SKILL.md": ["w1"]}
+    # A scoped run merges into the stored state; deleted components count as fixed
+    delta = history.record(tmp_path, {}, full=False, removed=["b/SKILL.md"])
+    assert delta.fixed == {"b/SKILL.md": ["w2"]}
+    assert history.load(tmp_path) == {"a/SKILL.md": []}
+
+
+def test_report_includes_delta_section(tmp_path):
+    mod = _load_module()
+    delta = mod.history.Delta(new={"x/SKILL.md": ["broken link: a.md"]})
+    report = mod.write_report({"x/SKILL.md": ["broken link: a.md"]}, tmp_path, tmp_path / "r.md", delta=delta)
+    text = report.read_text()
+    assert "## Changes since last run" in text
+    assert "- `x/SKILL.md`: broken link: a.md" in text
+
+
+def test_manifest_results_are_cached_until_declared_path_appears(tmp_path):
+    mod = _load_module()
+    plugin_dir = tmp_path / "p"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    manifest = plugin_dir / ".claude-plugin" / "plugin.json"
+    manifest.write_text('{"name": "p", "commands": "./commands"}')
+    rc = mod.result_cache
+    first = rc.run_cached(mod.check_plugin_json, manifest, tmp_path)
+    assert any("commands" in w for w in first)
+    assert rc.lookup(mod.check_plugin_json, manifest, tmp_path)[1] == first
+    (plugin_dir / "commands").mkdir()
+    assert rc.lookup(mod.check_plugin_json, manifest, tmp_path)[1] is None
+
+
+def test_polling_watcher_reports_created_modified_and_deleted_files(tmp_path):
+    mod = _load_module()
+    (tmp_path / "keep.md").write_text("a")
+    (tmp_path / "gone.md").write_text("a")
+    watcher = mod.watch_module.PollingWatcher([tmp_path], interval=0.01)
+    (tmp_path / "keep.md").write_text("changed size")
+    (tmp_path / "gone.md").unlink()
+    (tmp_path / "new.md").write_text("a")
+    assert watcher.wait(1.0) == {tmp_path / "keep.md", tmp_path / "gone.md", tmp_path / "new.md"}
+    assert watcher.wait(0.05) == set()
+
+
+def test_watch_revalidates_changed_skill_and_rewrites_report(tmp_path):
+    mod = _load_module()
+    _make_project(tmp_path)
+    skill_md = tmp_path / "my-plugin" / "skills" / "skill-0" / "SKILL.md"
+    updates = []
+
+    def edit_soon():
+        time.sleep(0.3)
+        skill_md.write_text("---\nname: skill-0\ndescription: x\n---\n[a](missing.md)\n")
+
+    threading.Thread(target=edit_soon).start()
+    report = mod.watch(tmp_path, output=tmp_path / "watch.md", polling=True,
+                       on_update=updates.append, max_cycles=1)
+    assert "broken link: missing.md" in report.read_text()
+    assert "1 re-checked" in updates[-1] and "+1 new" in updates[-1]
+
+
+def test_jsonl_format_streams_findings_and_file_records(tmp_path):
+    _make_project(tmp_path)
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--format", "jsonl"],
+                          cwd=tmp_path, capture_output=True, text=True)
+    assert proc.returncode == 1
+    records = [json.loads(line) for line in proc.stdout.splitlines()]
+    files = [r for r in records if r["type"] == "file"]
+    findings = [r for r in records if r["type"] == "finding"]
+    assert len(files) == 8
+    assert sum(r["findings"] for r in files) == len(findings)
+    extra = next(r for r in findings if r["path"] == "my-plugin/skills/skill-1/SKILL.md")
+    assert extra["rule_id"] == "frontmatter-extra-field"
+    assert extra["severity"] == "warning"
+    assert extra["duration_ms"] >= 0
+    assert not (tmp_path / ".rcc" / "validation").exists()
+
+
+def test_sarif_log_indexes_rules():
+    mod = _load_module()
+    findings = [mod.formats.Finding.of("a/SKILL.md", "Broken link: 'x.md' does not exist"),
+                mod.formats.Finding.of("b.md", "Missing required field: 'name'", "error")]
+    run = mod.formats.sarif_log(findings, "t")["runs"][0]
+    rules = [r["id"] for r in run["tool"]["driver"]["rules"]]
+    assert rules == ["broken-link", "frontmatter-missing"]
+    assert [(r["ruleIndex"], r["level"]) for r in run["results"]] == [(0, "warning"), (1, "error")]
+    assert mod.formats.rule_id("hooks.PreToolUse[0]: timeout should be seconds (got 5000)") \
+        == "timeout-should-be-seconds"
+
+
+def test_each_component_file_is_read_once_per_run(tmp_path, monkeypatch):
+    mod = _load_module()
+    _make_project(tmp_path)
+    reads = []
+    read_bytes, read_text = Path.read_bytes, Path.read_text
+    monkeypatch.setattr(Path, "read_bytes", lambda self: (reads.append(self.name), read_bytes(self))[1])
+    monkeypatch.setattr(Path, "read_text",
+                        lambda self, *a, **kw: (reads.append(self.name), read_text(self, *a, **kw))[1])
+
+    mod.validate_all(tmp_path)
+
+    assert reads.count("SKILL.md") == 6  # cache key, check and link graph share one read
+    assert reads.count("helper.md") == 1
+    assert mod.documents._active.get() is None
@@ -1,6 +1,7 @@
 """Tests for validate_frontmatter.py hook script."""
 import importlib.util
 import json
+import os
 import subprocess
 import sys
 import types
@@ -203,6 +204,33 @@ def test_check_agent_md_allowed_fields_no_warn(tmp_path):
     assert warnings == []
 
 
+def test_check_agent_md_reports_enum_and_required_fields_in_order(tmp_path):
+    mod = _load_module()
+    (tmp_path / "my-agent.md").write_text("---\nmodel: gpt\ncolor: teal\ntags: x\n---\n")
+    warnings = mod.check_agent_md(tmp_path / "my-agent.md")
+    assert warnings == [
+        'extra frontmatter field: "tags"',
+        'invalid model "gpt" (valid: haiku, inherit, opus, sonnet)',
+        'invalid color "teal" (valid: blue, cyan, green, orange, pink, purple, red, yellow)',
+        'missing required field "name"',
+        'missing required field "description"',
+    ]
+
+
+def test_schema_hook_checks_follow_hook_type_tables():
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import schema
+    assert schema.check_hook({"type": "http", "url": "u", "async": True, "headers": [], "timeout": 900}, 2) == [
+        "hook[2]: unexpected field 'async' for 'http' hook",
+        "hook[2]: timeout should be 1-600 seconds",
+        "hook[2]: 'headers' must be an object",
+    ]
+    assert schema.check_hook({"type": "agent"}, 0) == ["hook[0]: 'agent' type requires 'prompt' field"]
+    assert schema.check_hook({"type": "shell"}, 0) == [
+        "hook[0]: invalid type 'shell' (must be: agent, command, http, prompt)"
+    ]
+
+
 def test_check_rules_md_extra_field_warns(tmp_path):
     mod = _load_module()
     (tmp_path / "my-rule.md").write_text("---\npaths: src/**\ntags: bad\n---\n# Rule\n")
@@ -291,3 +319,484 @@ def test_hook_silent_on_valid_skill(tmp_path):
     (skill_dir / "SKILL.md").write_text("---\nname: my-skill\ndescription: x\n---\n# Body\n")
     result = run_hook(str(skill_dir / "SKILL.md"), str(tmp_path))
     assert result == {}
+
+
+def test_discover_persists_index_under_rcc_cache(tmp_path):
+    mod = _load_module()
+    (tmp_path / ".claude" / "skills").mkdir(parents=True)
+    mod.discover_skill_and_agent_dirs(tmp_path)
+    index = json.loads((tmp_path / ".rcc" / "cache" / "discovery.json").read_text())
+    assert index["skill_dirs"] == [".claude/skills"]
+    assert (tmp_path / ".rcc" / "cache" / ".gitignore").read_text() == "*\n"
+
+
+def test_discover_reuses_fresh_index_without_walking(tmp_path, monkeypatch):
+    mod = _load_module()
+    plugin_dir = tmp_path / "my-plugin"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text('{"name":"x"}')
+    (plugin_dir / "skills").mkdir()
+    first = mod.discover_skill_and_agent_dirs(tmp_path)
+
+    def no_walk(cwd):
+        raise AssertionError("index should not be rebuilt")
+
+    monkeypatch.setattr(mod.discovery, "find_plugin_manifests", no_walk)
+    assert mod.discover_skill_and_agent_dirs(tmp_path) == first
+
+
+def test_discover_rebuilds_when_plugin_added(tmp_path):
+    mod = _load_module()
+    (tmp_path / "plugins").mkdir()
+    skill_dirs, _ = mod.discover_skill_and_agent_dirs(tmp_path)
+    assert skill_dirs == []
+    plugin_dir = tmp_path / "plugins" / "new-plugin"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text('{"name":"x"}')
+    (plugin_dir / "skills").mkdir()
+    skill_dirs, _ = mod.discover_skill_and_agent_dirs(tmp_path)
+    assert plugin_dir / "skills" in skill_dirs
+
+
+def test_result_cache_returns_cached_warnings_for_unchanged_file(tmp_path):
+    mod = _load_module()
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: my-skill\ntags: foo\n---\n# Body\n")
+    calls = []
+
+    def check(path):
+        calls.append(path)
+        return mod.check_skill_md(path)
+
+    check.__name__ = "check_skill_md"
+    first = mod.result_cache.run_cached(check, skill_md, tmp_path)
+    second = mod.result_cache.run_cached(check, skill_md, tmp_path)
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_result_cache_misses_when_skill_dir_listing_changes(tmp_path):
+    mod = _load_module()
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: my-skill\ndescription: y\n---\n# Body\n")
+    assert mod.result_cache.run_cached(mod.check_skill_md, skill_md, tmp_path) == []
+    (skill_dir / "orphan.md").write_text("# Orphan")
+    warnings = mod.result_cache.run_cached(mod.check_skill_md, skill_md, tmp_path)
+    assert any("orphan.md" in w for w in warnings)
+
+
+def test_shared_result_cache_reloads_results_saved_by_another_process(tmp_path):
+    mod = _load_module()
+    rc = mod.result_cache
+    agent_md = tmp_path / "agent.md"
+    agent_md.write_text("x")
+    shared = rc.for_project(tmp_path)
+    other = rc.ResultCache(tmp_path)
+    other.put(("check_agent_md", str(agent_md), "v1"), ["from validate_all"])
+    other.save()
+    assert rc.for_project(tmp_path) is not shared
+    assert rc.for_project(tmp_path).get(("check_agent_md", str(agent_md), "v1")) == ["from validate_all"]
+
+
+def test_result_cache_keeps_one_entry_per_path_and_appends_changes(tmp_path, monkeypatch):
+    mod = _load_module()
+    rc = mod.result_cache
+    monkeypatch.setattr(rc, "COMPACT_SLACK", -2)   # compact at the second stale line
+    files = [tmp_path / f"{name}.md" for name in "abc"]
+    for f in files:
+        f.write_text("x")
+    cache = rc.ResultCache(tmp_path)
+    for f in files:
+        cache.put(("check_agent_md", str(f), "v1"), [])
+    cache.save()
+    cache.put(("check_agent_md", str(files[0]), "v2"), ["w"])   # replaces, not adds
+    cache.save()
+    lines = (tmp_path / ".rcc" / "cache" / rc.CACHE_NAME).read_text().splitlines()
+    assert len(lines) == 1 + 4   # header, first save, then only the changed entry
+    assert len(cache) == 3
+    reloaded = rc.ResultCache(tmp_path)
+    assert reloaded.get(("check_agent_md", str(files[0]), "v2")) == ["w"]
+    assert reloaded.get(("check_agent_md", str(files[0]), "v1")) is None
+
+    # another process appends; compaction keeps its lines and drops deleted files
+    other = rc.ResultCache(tmp_path)
+    other.put(("check_agent_md", str(files[1]), "v2"), ["other"])
+    other.save()
+    files[2].unlink()
+    cache.put(("check_agent_md", str(files[0]), "v3"), [])
+    cache.put(("check_agent_md", str(files[0]), "v4"), [])
+    cache.save()
+    final = rc.ResultCache(tmp_path)
+    assert len(final) == 2
+    assert final.get(("check_agent_md", str(files[1]), "v2")) == ["other"]
+    assert final.get(("check_agent_md", str(files[0]), "v4")) == []
+
+
+def _manifest_validator():
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import manifest_validator
+    return manifest_validator
+
+
+def test_check_plugin_json_valid_manifest_no_warn(tmp_path):
+    mv = _manifest_validator()
+    (tmp_path / ".claude-plugin").mkdir()
+    (tmp_path / "skills").mkdir()
+    (tmp_path / ".claude-plugin" / "plugin.json").write_text(
+        '{"name":"my-plugin","version":"1.2.3","author":{"name":"A"},"skills":"./skills"}'
+    )
+    assert mv.check_plugin_manifest(tmp_path) == []
+
+
+def test_check_plugin_json_reports_schema_errors(tmp_path):
+    mv = _manifest_validator()
+    (tmp_path / ".claude-plugin").mkdir()
+    (tmp_path / ".claude-plugin" / "plugin.json").write_text(
+        '{"name":"My Plugin","version":"v1","agents":"/abs/agents","tags":[]}'
+    )
+    warnings = mv.check_plugin_manifest(tmp_path)
+    assert any("kebab-case" in w for w in warnings)
+    assert any("semver" in w for w in warnings)
+    assert any("must be relative" in w for w in warnings)
+    assert any('unknown field "tags"' in w for w in warnings)
+
+
+def test_check_marketplace_json_duplicate_and_missing_source(tmp_path):
+    mv = _manifest_validator()
+    (tmp_path / ".claude-plugin").mkdir()
+    (tmp_path / "plugins" / "a").mkdir(parents=True)
+    (tmp_path / ".claude-plugin" / "marketplace.json").write_text(json.dumps({
+        "name": "market",
+        "owner": {"name": "A"},
+        "plugins": [
+            {"name": "a", "source": "./plugins/a"},
+            {"name": "a", "source": "./plugins/missing"},
+            {"name": "b"},
+        ],
+    }))
+    warnings = mv.check_marketplace_json(tmp_path / ".claude-plugin" / "marketplace.json")
+    assert any('duplicate plugin name "a"' in w for w in warnings)
+    assert any("plugins/missing" in w and "does not exist" in w for w in warnings)
+    assert any('plugins[2]: missing required field "source"' in w for w in warnings)
+
+
+def _scanner():
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import scanner
+    return scanner
+
+
+def test_scan_collects_frontmatter_links_headings_and_code():
+    scanner = _scanner()
+    text = (
+        "---\nname: x\n---\n# Title\n\n"
+        "See [ref](references/a.md) and `[code](not/a/link.md)`.\n"
+        "```md\n[fenced](also/not.md) ${CLAUDE_PLUGIN_ROOT}\n```\n"
+        "## Next ##\nUse ${CLAUDE_PLUGIN_DATA} here.\n"
+    )
+    doc = scanner.scan(text)
+    assert doc.frontmatter == {"name": "x"}
+    assert doc.body.startswith("# Title")
+    assert doc.links == ["references/a.md"]
+    assert doc.headings == [(1, "Title"), (2, "Next")]
+    assert doc.hook_vars == ["${CLAUDE_PLUGIN_DATA}"]
+    assert len(doc.code_ranges) == 2
+
+
+def test_scan_unterminated_fence_runs_to_end_of_file():
+    scanner = _scanner()
+    text = "intro [a](a.md)\n```\n" + "[x](y.md) ${CLAUDE_PLUGIN_ROOT} ``` inline\n" * 20000
+    doc = scanner.scan(text)
+    assert doc.links == ["a.md"]
+    assert doc.hook_vars == []
+    assert doc.code_ranges[-1][1] == len(text)
+
+
+def test_check_skill_md_ignores_links_inside_code(tmp_path):
+    mod = _load_module()
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    content = "---\nname: x\ndescription: y\n---\n\n```\n[example](references/example.md)\n```\n"
+    (skill_dir / "SKILL.md").write_text(content)
+    warnings = mod.check_skill_md(skill_dir / "SKILL.md")
+    assert not any("broken link" in w for w in warnings)
+
+
+def test_pattern_matcher_finds_overlapping_substrings():
+    _load_module()
+    from validators.orphans import PatternMatcher
+    matcher = PatternMatcher(["data.md", "a.md", "scripts/run.sh", "missing.py"])
+    assert matcher.find_all("see data.md and scripts/run.sh") == {"data.md", "a.md", "scripts/run.sh"}
+
+
+def test_find_orphans_reuses_cached_listing(tmp_path, monkeypatch):
+    _load_module()
+    from validators import orphans
+    skill_dir = tmp_path / "my-skill"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "references" / "used.md").write_text("# Used")
+    (skill_dir / "references" / "unused.md").write_text("# Unused")
+    (skill_dir / "SKILL.md").write_text("See references/used.md\n")
+    monkeypatch.setattr(orphans, "RACY_SECONDS", -1.0)
+    text = "See references/used.md\n"
+    assert orphans.find_orphans(skill_dir / "SKILL.md", text, []) == ["references/unused.md"]
+
+    def no_scandir(path):
+        raise AssertionError("listing should come from cache")
+
+    monkeypatch.setattr(orphans.os, "scandir", no_scandir)
+    assert orphans.find_orphans(skill_dir / "SKILL.md", text, []) == ["references/unused.md"]
+
+
+def _make_linked_skill(tmp_path: Path) -> tuple[Path, Path]:
+    """Plugin skill linking to a reference and to a file shared outside its dir."""
+    plugin_dir = tmp_path / "my-plugin"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text('{"name":"x"}')
+    skill_dir = plugin_dir / "skills" / "my-skill"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "references" / "guide.md").write_text("# Guide")
+    (plugin_dir / "shared.md").write_text("# Shared")
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: my-skill\ndescription: x\n---\n"
+        "[guide](references/guide.md) [shared](../../shared.md)\n"
+    )
+    return skill_dir, plugin_dir
+
+
+def test_linkgraph_records_reverse_edges(tmp_path):
+    mod = _load_module()
+    from validators import linkgraph
+    skill_dir, plugin_dir = _make_linked_skill(tmp_path)
+    mod.discover_skill_and_agent_dirs(tmp_path)
+    graph = linkgraph.build(tmp_path, [skill_dir / "SKILL.md"])
+    graph.save()
+    reloaded = linkgraph.LinkGraph(tmp_path, json.loads(graph.path.read_text())["skills"])
+    assert reloaded.dependents(plugin_dir / "shared.md") == {skill_dir / "SKILL.md"}
+    assert reloaded.dependents(skill_dir / "references") == {skill_dir / "SKILL.md"}
+    assert reloaded.dependents(plugin_dir / "other.md") == set()
+
+
+def test_linkgraph_merges_with_a_newer_file_before_saving(tmp_path):
+    mod = _load_module()
+    from validators import linkgraph
+    skill_dir, plugin_dir = _make_linked_skill(tmp_path)
+    mod.discover_skill_and_agent_dirs(tmp_path)
+    linkgraph.build(tmp_path, [skill_dir / "SKILL.md"]).save()
+    graph = linkgraph.for_project(tmp_path, [])
+    graph.forget(skill_dir / "SKILL.md")
+
+    # validate_all rewrites the file while the daemon holds its graph
+    data = json.loads(graph.path.read_text())
+    data["skills"]["other/SKILL.md"] = ["other/notes.md"]
+    graph.path.write_text(json.dumps(data))
+    os.utime(graph.path, ns=(graph.stamp + 10**9, graph.stamp + 10**9))
+    graph.save()
+    saved = json.loads(graph.path.read_text())["skills"]
+    assert saved["other/SKILL.md"] == ["other/notes.md"]
+    assert "my-plugin/skills/my-skill/SKILL.md" not in saved
+
+    # an unchanged graph picks up the newer file on the next lookup
+    data["skills"]["third/SKILL.md"] = ["third/notes.md"]
+    graph.path.write_text(json.dumps(data))
+    os.utime(graph.path, ns=(graph.stamp + 10**9, graph.stamp + 10**9))
+    reloaded = linkgraph.for_project(tmp_path, [])
+    assert reloaded.dependents(tmp_path / "third" / "notes.md") == {tmp_path / "third" / "SKILL.md"}
+
+
+def test_hook_rechecks_parent_skill_when_linked_file_removed(tmp_path):
+    mod = _load_module()
+    skill_dir, plugin_dir = _make_linked_skill(tmp_path)
+    assert mod.handle_payload({"tool_input": {"file_path": str(skill_dir / "SKILL.md")},
+                               "cwd": str(tmp_path)}) is None
+    (plugin_dir / "shared.md").unlink()
+    out = mod.handle_payload({"tool_name": "Bash", "tool_input": {"command": "rm my-plugin/shared.md"},
+                              "cwd": str(tmp_path)})
+    assert "my-skill/SKILL.md" in out["systemMessage"]
+    assert "broken link: ../../shared.md" in out["systemMessage"]
+
+
+def test_hook_rechecks_owning_skill_for_new_reference_file(tmp_path):
+    mod = _load_module()
+    skill_dir, _ = _make_linked_skill(tmp_path)
+    extra = skill_dir / "references" / "extra.md"
+    extra.write_text("# Extra")
+    out = mod.handle_payload({"tool_input": {"file_path": str(extra)}, "cwd": str(tmp_path)})
+    assert "orphaned file: references/extra.md" in out["systemMessage"]
+    # Editing it again changes nothing the skill depends on: silent
+    extra.write_text("# Extra, edited")
+    assert mod.handle_payload({"tool_input": {"file_path": str(extra)}, "cwd": str(tmp_path)}) is None
+
+
+def test_hook_ignores_bash_commands_that_remove_nothing(tmp_path):
+    mod = _load_module()
+    _make_linked_skill(tmp_path)
+    assert mod.handle_payload({"tool_name": "Bash", "tool_input": {"command": "ls -la"},
+                               "cwd": str(tmp_path)}) is None
+
+
+def test_walk_prunes_gitignored_and_vendor_dirs(tmp_path):
+    _load_module()
+    from validators import walk
+    (tmp_path / ".gitignore").write_text("out/\n*.log\n!keep.log\n")
+    for rel in ["a/.claude-plugin/plugin.json", "a/skills/s/SKILL.md", "out/x/.claude-plugin/plugin.json",
+                "node_modules/p/.claude-plugin/plugin.json", "err.log", "keep.log",
+                "a/sub/.gitignore", "a/sub/tmp.md", "a/sub/ok.md"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("tmp.md\n" if rel.endswith(".gitignore") else "{}")
+    files = walk.walk_files(tmp_path)
+    assert "out/x/.claude-plugin/plugin.json" not in files
+    assert "node_modules/p/.claude-plugin/plugin.json" not in files
+    assert "err.log" not in files and "keep.log" in files
+    assert "a/sub/tmp.md" not in files and "a/sub/ok.md" in files
+    inv = walk.classify(files)
+    assert inv.plugin_manifests == ["a/.claude-plugin/plugin.json"]
+    assert inv.skill_mds_under("a/skills") == ["a/skills/s/SKILL.md"]
+    assert inv.markdown_in("a/sub") == ["a/sub/ok.md"]
+
+
+def test_git_files_lists_untracked_and_skips_ignored_and_deleted(tmp_path):
+    _load_module()
+    from validators import walk
+    if subprocess.run(["git", "init", "-q", str(tmp_path)], capture_output=True).returncode != 0:
+        return  # git not available
+    (tmp_path / ".gitignore").write_text("ignored/\n")
+    for rel in ["tracked.md", "gone.md", "new.md", "ignored/x.md"]:
+        (tmp_path / rel).parent.mkdir(exist_ok=True)
+        (tmp_path / rel).write_text("x")
+    subprocess.run(["git", "add", "tracked.md", "gone.md"], cwd=tmp_path, check=True)
+    (tmp_path / "gone.md").unlink()
+    assert walk.git_files(tmp_path) == [".gitignore", "new.md", "tracked.md"]
+
+
+def test_trigger_overlap_index_matches_pairwise_comparison():
+    _load_module()  # puts the hooks dir on sys.path
+    import random
+    from validators import overlap
+
+    rng = random.Random(7)
+    vocabulary = [f"w{i}" for i in range(40)]
+    entries = [(f"s{i}", "Use when " + " ".join(rng.choices(vocabulary, k=rng.randint(1, 12))))
+               for i in range(300)]
+    words = [overlap.trigger_words(d) for _, d in entries]
+    expected = [(entries[i][0], entries[j][0])
+                for i in range(len(entries)) for j in range(i + 1, len(entries))
+                if overlap.overlap_ratio(words[i], words[j]) > overlap.OVERLAP_THRESHOLD]
+    stats = {}
+    found = overlap.find_overlaps(entries, stats=stats)
+    assert [(a, b) for a, b, _ in found] == expected
+    assert stats["candidates"] < len(entries) * (len(entries) - 1) // 2
+
+
+def _paragraph(seed: int, words: int) -> str:
+    import random
+    rng = random.Random(seed)
+    return " ".join(f"w{rng.randrange(5000)}" for _ in range(words))
+
+
+def test_duplicates_reports_copied_block_with_small_edits(tmp_path):
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import duplicates
+
+    shared = _paragraph(1, 80).split()
+    edited = shared[:40] + ["changed", "here"] + shared[41:]
+    a = tmp_path / "a" / "SKILL.md"
+    b = tmp_path / "b" / "references" / "guide.md"
+    a.parent.mkdir()
+    b.parent.mkdir(parents=True)
+    a.write_text("---\nname: a\ndescription: " + " ".join(shared) + "\n---\n"
+                 + _paragraph(2, 50) + "\n\n" + " ".join(shared) + "\n")
+    b.write_text("# Guide\n" + _paragraph(3, 30) + "\n" + " ".join(edited[:50]) + "\n"
+                 + " ".join(edited[50:]) + "\n" + _paragraph(4, 30) + "\n")
+
+    blocks = duplicates.find_duplicates([a, b])
+
+    assert len(blocks) == 1  # frontmatter is not compared
+    block = blocks[0]
+    assert (block.path_a, block.lines_a, block.path_b, block.lines_b) == (a, (7, 7), b, (3, 4))
+    assert block.words == 80
+
+
+def test_duplicate_index_stays_bounded_and_keeps_long_blocks(tmp_path):
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import duplicates
+
+    block = _paragraph(0, 400)
+    paths = []
+    for i in range(40):
+        path = tmp_path / f"f{i}.md"
+        path.write_text(_paragraph(i + 1, 300) + ("\n" + block if i in (5, 30) else "") + "\n")
+        paths.append(path)
+    index = duplicates.FingerprintIndex(max_entries=500)
+
+    blocks = duplicates.find_duplicates(paths, index=index)
+
+    assert index.sample_mask > 0
+    assert len(index._postings) + len(index._boilerplate) <= 500
+    assert [(b.path_a.name, b.path_b.name) for b in blocks] == [("f5.md", "f30.md")]
+    assert blocks[0].words == 400
+
+
+def test_matcher_analysis_flags_backtracking_and_plain_alternations():
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import config_validator, matchers
+    assert matchers.analyze(r"(\w+\s?)*$").backtracking == "nests quantifiers"
+    assert matchers.analyze(r"^(a|ab)+$").backtracking == "repeats an alternation whose branches overlap"
+    assert matchers.analyze(r"^(ab|cd)+$").backtracking is None
+    assert matchers.plain_alternation(r"^(Multi)?Edit$") == "Edit|MultiEdit"
+    assert matchers.plain_alternation(r"(Edit|Write)") is None      # also matches NotebookEdit
+    assert matchers.plain_alternation(r"(?i)^(Edit|Write)$") is None
+    warnings = config_validator.validate_matcher(r"^(Edit|Write)$", "'hooks.PostToolUse'[0]", "PostToolUse")
+    assert warnings == ["'hooks.PostToolUse'[0]: matcher '^(Edit|Write)$' can be the plain alternation "
+                        "'Edit|Write', matched by exact name without a regex"]
+
+
+def test_matcher_warnings_do_not_time_the_matcher(monkeypatch):
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import config_validator, matchers
+    monkeypatch.setattr(matchers, "match_cost_us", lambda *args: 1e9)
+    # timing r"(\w+)+!" against the MCP tool names would never finish
+    warnings = config_validator.validate_matcher(r"(\w+)+!", "'hooks.PostToolUse'[0]", "PostToolUse")
+    assert warnings[0] == (r"'hooks.PostToolUse'[0]: matcher '(\w+)+!' nests quantifiers "
+                           "and can backtrack catastrophically")
+    # warnings come from the regex structure, never from timings
+    assert matchers.matcher_warnings(r"^mcp__github__.*", "'hooks.PreToolUse'[0]") == []
+
+
+def test_plain_bash_call_exits_before_loading_validators(tmp_path):
+    def imports(command: str) -> str:
+        stdin = json.dumps({"tool_name": "Bash", "tool_input": {"command": command}, "cwd": str(tmp_path)})
+        result = subprocess.run([sys.executable, "-X", "importtime", str(SCRIPT)],
+                                input=stdin, capture_output=True, text=True)
+        assert result.returncode == 0 and not result.stdout.strip()
+        return result.stderr
+
+    assert "validators.post_tool_use" not in imports("git status && ls -la")
+    assert "validators.post_tool_use" in imports("rm notes.md")
+
+
+def test_command_paths_reads_only_removing_command_arguments(tmp_path):
+    _load_module()  # puts the hooks dir on sys.path
+    from validators.commands import command_paths
+    assert command_paths("grep -rn rm docs && echo mv", tmp_path) == []
+    assert command_paths("rm -rf -- old.md 2>/dev/null && ls refs", tmp_path) == [tmp_path / "old.md"]
+    assert command_paths("cd x;sudo mv a.md b.md | tee log", tmp_path) == [tmp_path / "a.md", tmp_path / "b.md"]
+    assert command_paths("git rm -r skills/old", tmp_path) == [tmp_path / "skills/old"]
+
+
+def test_manifest_context_fingerprints_only_path_fields(tmp_path):
+    _load_module()  # puts the hooks dir on sys.path
+    from validators import result_cache
+    (tmp_path / ".claude-plugin").mkdir()
+    manifest = tmp_path / ".claude-plugin" / "plugin.json"
+    data = json.dumps({"name": "p", "description": "d" * 300, "skills": "./skills"}).encode()
+    before = result_cache.manifest_context(manifest, data)   # outside documents.run()
+    (tmp_path / "d").mkdir()   # "d" is a description, not a declared path
+    assert result_cache.manifest_context(manifest, json.dumps(
+        {"name": "p", "description": "d", "skills": "./skills"}).encode()) == before
+    (tmp_path / "skills").mkdir()
+    assert result_cache.manifest_context(manifest, data) != before
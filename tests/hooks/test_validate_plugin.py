@@ -0,0 +1,152 @@
+"""Tests for the plugin health check library (refactoring-plugins/scripts/validate_plugin.py)."""
+import importlib.util
+import json
+import threading
+import types
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/skills/refactoring-plugins/scripts/validate_plugin.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load validate_plugin as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("validate_plugin", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _make_marketplace(tmp_path: Path) -> None:
+    (tmp_path / ".claude-plugin").mkdir()
+    (tmp_path / ".claude-plugin" / "marketplace.json").write_text(json.dumps({
+        "name": "market",
+        "owner": {"name": "t"},
+        "plugins": [
+            {"name": "good-plugin", "source": "./plugins/good", "version": "1.0.0"},
+            {"name": "bad-plugin", "source": "./plugins/bad", "version": "2.0.0"},
+            {"name": "remote", "source": {"source": "github", "repo": "o/r"}},
+        ],
+    }))
+    for dirname, name, version in (("good", "good-plugin", "1.0.0"), ("bad", "bad-plugin", "1.0.0")):
+        plugin_dir = tmp_path / "plugins" / dirname
+        (plugin_dir / ".claude-plugin").mkdir(parents=True)
+        (plugin_dir / ".claude-plugin" / "plugin.json").write_text(
+            json.dumps({"name": name, "description": "d", "version": version}))
+        (plugin_dir / "README.md").write_text("# x\n")
+        (plugin_dir / "agents").mkdir()
+        (plugin_dir / "agents" / f"{dirname}.md").write_text("---\nname: a\n---\n")
+
+
+def test_reports_do_not_share_findings(tmp_path):
+    mod = _load_module()
+    _make_marketplace(tmp_path)
+    bad = mod.validate_plugin(tmp_path / "plugins" / "bad")
+    good = mod.validate_plugin(tmp_path / "plugins" / "good")
+    assert not bad.passed
+    assert any("Version mismatch" in e for e in bad.errors)
+    assert good.passed and good.errors == []
+    assert good.name == "good-plugin"
+    assert {f.severity for f in bad.findings} >= {"error", "warning"}
+    paths = {f.message: Path(f.path) for f in bad.findings}
+    assert paths["Version mismatch: plugin.json (1.0.0) != marketplace (2.0.0)"].name == "plugin.json"
+    assert paths["Agent 'bad': missing tools specification"] == tmp_path / "plugins" / "bad" / "agents" / "bad.md"
+    assert "Health check FAILED" in bad.text
+
+
+def test_marketplace_validates_listed_plugins_with_one_catalog_read(tmp_path, monkeypatch):
+    mod = _load_module()
+    _make_marketplace(tmp_path)
+    reads = []
+    read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        if self.name == "marketplace.json":
+            reads.append(self)
+        return read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    result = mod.validate_marketplace(tmp_path, jobs=2)
+
+    assert [r.name for r in result.plugins] == ["good-plugin", "bad-plugin"]
+    assert result.skipped == ["remote"]
+    assert not result.passed
+    assert [r.passed for r in result.plugins] == [True, False]
+    # the catalog schema check and both plugins' version sync share one read
+    assert len(reads) == 1
+
+
+def test_marketplace_reports_trigger_overlap_between_plugins(tmp_path):
+    mod = _load_module()
+    _make_marketplace(tmp_path)
+    for dirname in ("good", "bad"):
+        skill_dir = tmp_path / "plugins" / dirname / "skills" / "reviewing-code"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: reviewing-code\ndescription: Use when reviewing pull request diffs\n---\n# Body\n")
+    result = mod.validate_marketplace(tmp_path)
+    assert [f.message for f in result.overlaps] == [
+        "Possible trigger overlap between 'good-plugin:reviewing-code' and 'bad-plugin:reviewing-code'"
+    ]
+
+
+def test_marketplace_reports_blocks_copied_between_plugins(tmp_path):
+    mod = _load_module()
+    _make_marketplace(tmp_path)
+    body = " ".join(f"word{i}" for i in range(60))
+    for dirname in ("good", "bad"):
+        skill_dir = tmp_path / "plugins" / dirname / "skills" / f"{dirname}-skill"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {dirname}-skill\ndescription: {dirname}\n---\n# Body\n")
+        (skill_dir / "references" / "notes.md").write_text(f"# {dirname}\n\n{body}\n")
+    result = mod.validate_marketplace(tmp_path)
+    assert [f.message for f in result.duplicates] == [
+        "Duplicated block (60 words, 1 lines): plugins/good/skills/good-skill/references/notes.md:3-3"
+        " ~ plugins/bad/skills/bad-skill/references/notes.md:3-3"
+    ]
+    assert result.duplicates[0].rule_id == "duplicate-content"
+
+
+def test_concurrent_runs_keep_their_own_document_cache(tmp_path):
+    mod = _load_module()
+    documents = mod.documents
+    first_open, first_done = threading.Event(), threading.Event()
+    caches = {}
+
+    def first():
+        with documents.run() as cache:
+            caches["first"] = cache
+            first_open.set()
+            first_done.wait(5)
+            caches["first-after"] = documents._active.get()
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    first_open.wait(5)
+    with documents.run() as cache:   # finishes while the first run is still open
+        caches["second"] = cache
+    first_done.set()
+    thread.join()
+    assert caches["first"] is not caches["second"]
+    assert caches["first-after"] is caches["first"]
+
+
+def test_manifest_style_findings_are_warnings(tmp_path):
+    mod = _load_module()
+    (tmp_path / ".claude-plugin").mkdir()
+    (tmp_path / "skills").mkdir()
+    (tmp_path / "README.md").write_text("# x\n")
+    (tmp_path / ".claude-plugin" / "plugin.json").write_text(
+        json.dumps({"name": "p", "description": "d", "version": "1.0", "skills": "skills"}))
+    report = mod.validate_plugin(tmp_path)
+    assert report.passed
+    assert 'plugin.json skills: path "skills" should start with "./"' in report.warnings
+    assert 'plugin.json: version "1.0" is not semver (MAJOR.MINOR.PATCH)' in report.warnings
+
+
+def test_overlong_manifest_path_is_reported_not_raised(tmp_path):
+    _load_module()
+    from validators.manifest_validator import check_plugin_json
+    (tmp_path / ".claude-plugin").mkdir()
+    manifest = tmp_path / ".claude-plugin" / "plugin.json"
+    manifest.write_text(json.dumps({"name": "p", "skills": "./" + "a" * 5000}))
+    assert any("does not exist" in w for w in check_plugin_json(manifest))   # outside documents.run()
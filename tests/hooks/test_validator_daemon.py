@@ -0,0 +1,89 @@
+"""Tests for validator_daemon.py and the hook's socket client."""
+import importlib.util
+import json
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent.parent / "plugins/rcc/hooks/validator_daemon.py"
+
+
+def _load_module() -> types.ModuleType:
+    """Load validator_daemon as a module without executing main()."""
+    spec = importlib.util.spec_from_file_location("validator_daemon", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _make_skill(tmp_path: Path) -> Path:
+    plugin_dir = tmp_path / "my-plugin"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text('{"name":"x"}')
+    skill_dir = plugin_dir / "skills" / "my-skill"
+    skill_dir.mkdir(parents=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: my-skill\ndescription: x\ntags: bad\n---\n# Body\n")
+    return skill_md
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    mod = _load_module()
+    if not mod.daemon.is_supported():
+        pytest.skip("Unix sockets not supported on this platform")
+    thread = threading.Thread(target=mod.serve, args=(tmp_path, 30), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if mod.daemon.control(tmp_path, "ping"):
+            break
+        time.sleep(0.02)
+    yield mod
+    mod.daemon.control(tmp_path, "shutdown")
+    thread.join(timeout=5)
+
+
+def test_daemon_reply_matches_in_process_output(tmp_path, running_daemon):
+    mod = running_daemon
+    skill_md = _make_skill(tmp_path)
+    payload = {"tool_input": {"file_path": str(skill_md)}, "cwd": str(tmp_path)}
+    reply = mod.daemon.request(tmp_path, json.dumps(payload).encode("utf-8"))
+    assert reply is not None
+    assert reply["output"] == mod.render_output(payload)
+    assert "tags" in json.loads(reply["output"])["systemMessage"]
+
+
+def test_client_waits_for_an_accepted_request(tmp_path, running_daemon, monkeypatch):
+    mod = running_daemon
+    skill_md = _make_skill(tmp_path)
+    render_output = mod.render_output
+
+    def slow_render(data):
+        time.sleep(0.5)
+        return render_output(data)
+
+    monkeypatch.setattr(mod, "render_output", slow_render)
+    payload = {"tool_input": {"file_path": str(skill_md)}, "cwd": str(tmp_path)}
+    # Validation outlasts the accept timeout: the client keeps waiting
+    # instead of falling back to a second, in-process run
+    reply = mod.daemon.request(tmp_path, json.dumps(payload).encode("utf-8"), timeout=0.2)
+    assert reply is not None
+    assert "tags" in json.loads(reply["output"])["systemMessage"]
+
+
+def test_daemon_shutdown_removes_socket(tmp_path, running_daemon):
+    mod = running_daemon
+    assert mod.daemon.control(tmp_path, "shutdown") == {"ok": True}
+    for _ in range(100):
+        if not mod.daemon.socket_path(tmp_path).exists():
+            break
+        time.sleep(0.02)
+    assert not mod.daemon.socket_path(tmp_path).exists()
+
+
+def test_request_without_daemon_returns_none(tmp_path):
+    mod = _load_module()
+    assert mod.daemon.request(tmp_path, b"{}") is None